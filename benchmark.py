@@ -0,0 +1,221 @@
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+import tempfile
+import statistics
+import subprocess
+
+BENCHMARKS = ('get_devices', 'update_device_list', 'battery_poll', 'scan', 'disconnect_all_devices')
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'bench_results')
+# Changes smaller than this are noise whatever their percentage
+NOISE_FLOOR_MS = 0.05
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark BlueSync against a simulated Bluetooth backend")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10, 100, 1000], help="device counts to run at")
+    parser.add_argument('--only', nargs='+', choices=BENCHMARKS, default=list(BENCHMARKS), help="benchmarks to run")
+    parser.add_argument('--repeat', type=int, default=20, help="timed runs per benchmark and size")
+    parser.add_argument('--connected-ratio', type=float, default=0.5)
+    parser.add_argument('--battery-ratio', type=float, default=0.5)
+    parser.add_argument('--connect-latency', type=float, default=0.002, help="seconds per simulated connect/disconnect")
+    parser.add_argument('--battery-latency', type=float, default=0.0, help="seconds per simulated battery read")
+    parser.add_argument('--failure-rate', type=float, default=0.0)
+    parser.add_argument('--live-battery', action='store_true', help="serve battery levels from memory, like Battery1 signals")
+    parser.add_argument('--output', help=f"where to write results (default: {RESULTS_DIR}/<commit>.json)")
+    parser.add_argument('--compare', help="earlier results file to compare against")
+    parser.add_argument('--threshold', type=float, default=10.0,
+                        help="with --compare, exit 1 if a median gets slower by more than this percentage")
+    return parser.parse_args(argv)
+
+def git_commit() -> str:
+    """Short commit id of the tree being measured, marked -dirty with uncommitted changes"""
+    try:
+        run = lambda *args: subprocess.run(['git', *args], capture_output=True, text=True, check=True,
+                                           cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+        commit = run('rev-parse', '--short', 'HEAD')
+        return commit + ('-dirty' if run('status', '--porcelain', '--untracked-files=no') else '')
+    except (OSError, subprocess.CalledProcessError): return time.strftime('%Y%m%d-%H%M%S')
+
+def summarize(samples) -> dict:
+    samples = sorted(samples)
+    ms = lambda seconds: round(seconds * 1000, 4)
+    return {
+        'runs': len(samples),
+        'min_ms': ms(samples[0]),
+        'median_ms': ms(statistics.median(samples)),
+        'p95_ms': ms(samples[min(len(samples) - 1, int(len(samples) * 0.95))]),
+        'max_ms': ms(samples[-1]),
+    }
+
+def measure(func, repeat, setup=None) -> dict:
+    """Time func() repeat times; setup() runs untimed before each run"""
+    samples = []
+    for _ in range(repeat):
+        if setup: setup()
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    return summarize(samples)
+
+class Environment:
+    """A BluetoothManager over a FakeBluetoothBackend, with config and battery history in a temp dir"""
+    def __init__(self, size, args):
+        from components.config.config_manager import ConfigManager
+        from components.core.battery_history import BatteryHistoryStore
+        from components.core.bluetooth_manager import BluetoothManager
+        from components.core.fake_backend import FakeBluetoothBackend
+
+        self.tempdir = tempfile.TemporaryDirectory(prefix='bluesync-bench-')
+        config_manager = ConfigManager(os.path.join(self.tempdir.name, 'config.json'))
+        self.backend = FakeBluetoothBackend(
+            config_manager, device_count=size, connected_ratio=args.connected_ratio, battery_ratio=args.battery_ratio,
+            connect_latency=args.connect_latency, battery_latency=args.battery_latency,
+            failure_rate=args.failure_rate, live_battery=args.live_battery
+        )
+        self.manager = BluetoothManager(
+            config_manager, backend=self.backend,
+            battery_history=BatteryHistoryStore(os.path.join(self.tempdir.name, 'battery_history.bin'))
+        )
+        self.connected = self.backend.get_connected_addresses()
+
+    def close(self):
+        self.manager.scheduler.shutdown()
+        self.manager.config_manager.flush()
+        self.manager.battery_history.close()
+        self.tempdir.cleanup()
+
+def bench_get_devices(env, repeat):
+    return measure(env.manager.get_devices, repeat)
+
+def bench_battery_poll(env, repeat):
+    """One round of the window's adaptive polling with every connected device due"""
+    from components.core.battery_poller import BatteryPollScheduler
+    state = {}
+
+    def setup():
+        poller = state['poller'] = BatteryPollScheduler(env.manager.battery_history)
+        poller.sync(a for a in env.connected if not env.manager.has_live_battery(a))
+
+    def poll():
+        poller = state['poller']
+        futures = {address: env.manager.run_async('poll_battery', address) for address in poller.due()}
+        for address, future in futures.items():
+            device = future.result()
+            poller.reschedule(address, device.battery_level if device else None)
+
+    return measure(poll, repeat, setup)
+
+def bench_scan(env, repeat):
+    """Start discovery, list the devices it found and stop it again"""
+    def scan():
+        env.manager.run_async('start_discovery').result()
+        env.manager.get_devices()
+        env.manager.run_async('stop_discovery').result()
+
+    return measure(scan, repeat, env.backend.forget_discovered)
+
+def bench_disconnect_all_devices(env, repeat):
+    return measure(env.manager.disconnect_all_devices, repeat,
+                   lambda: env.backend.set_connected(env.connected, True))
+
+def bench_update_device_list(env, repeat):
+    """First build of the device list, then refreshes in which every connected device's battery changed"""
+    try:
+        import concurrent.futures
+        from components.ui.app_window import BluetoothManagerApp
+        # A backend future that never resolves keeps the window from starting its own polling
+        app = BluetoothManagerApp(concurrent.futures.Future(), tray=False)
+    except Exception as e: return {'skipped': f'{type(e).__name__}: {e}'}
+
+    try:
+        app.update()
+        devices = env.manager.get_devices()
+
+        def render(new_devices):
+            app.devices = new_devices
+            app.update_device_list()
+            app.update_idletasks()
+
+        start = time.perf_counter()
+        render(devices)
+        first = time.perf_counter() - start
+
+        samples = []
+        for run in range(repeat):
+            # Alternate between two levels; fake levels start above the low battery threshold, so no alerts fire
+            changed = [d.replace(battery_level=d.battery_level - 1 - run % 2) if d.battery_level is not None else d
+                       for d in devices]
+            start = time.perf_counter()
+            render(changed)
+            samples.append(time.perf_counter() - start)
+
+        result = summarize(samples)
+        result['first_ms'] = round(first * 1000, 4)
+        result['mode'] = 'virtual' if app.virtual_list is not None else 'cards'
+        return result
+    finally:
+        app.ui_queue.stop()
+        app.destroy()
+
+def run(args) -> dict:
+    results = {name: {} for name in args.only}
+    for size in args.sizes:
+        env = Environment(size, args)
+        try:
+            for name in args.only:
+                result = globals()[f'bench_{name}'](env, args.repeat)
+                results[name][str(size)] = result
+                print(f'{name:<24}{size:>6} devices  ' +
+                      (f'skipped ({result["skipped"]})' if 'skipped' in result else f'median {result["median_ms"]:.3f} ms'),
+                      file=sys.stderr)
+        finally: env.close()
+    return results
+
+def compare(before:dict, after:dict, threshold:float) -> list:
+    """Print median changes between two results files and return the regressions"""
+    if before.get('params') != after.get('params'):
+        print('warning: the runs used different parameters', file=sys.stderr)
+    print(f'{"benchmark":<24}{"devices":>8}{"before ms":>12}{"after ms":>12}{"change":>10}')
+    regressions = []
+    for name, sizes in after['results'].items():
+        for size, result in sizes.items():
+            old = before.get('results', {}).get(name, {}).get(size)
+            if not old or 'median_ms' not in old or 'median_ms' not in result: continue
+            delta = result['median_ms'] - old['median_ms']
+            change = delta / old['median_ms'] * 100 if old['median_ms'] else 0.0
+            slower = change > threshold and delta > NOISE_FLOOR_MS
+            if slower: regressions.append((name, size, change))
+            print(f'{name:<24}{size:>8}{old["median_ms"]:>12.3f}{result["median_ms"]:>12.3f}{change:>+9.1f}%'
+                  + ('  slower' if slower else ''))
+    return regressions
+
+def main():
+    args = parse_args()
+
+    commit = git_commit()
+    report = {
+        'commit': commit,
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'params': {key: getattr(args, key) for key in
+                   ('repeat', 'connected_ratio', 'battery_ratio', 'connect_latency', 'battery_latency',
+                    'failure_rate', 'live_battery')},
+        'results': run(args),
+    }
+
+    output = args.output or os.path.join(RESULTS_DIR, f'{commit}.json')
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w') as f: json.dump(report, f, indent=2)
+    print(f'Results written to {output}', file=sys.stderr)
+
+    if args.compare:
+        with open(args.compare) as f: before = json.load(f)
+        regressions = compare(before, report, args.threshold)
+        if regressions: sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -1,58 +1,179 @@
 import os
 import json
-from components.utils.constants import CONFIG_PATH
+import atexit
+import tempfile
+import threading
+import logging
+from components.utils.constants import CONFIG_PATH, CONFIG_FLUSH_DELAY_S
+
+logger = logging.getLogger(__name__)
 
 class ConfigManager:
-    """Manages configuration storage and retrieval"""
-    def __init__(self, config_path:str=None):
+    """Manages configuration storage and retrieval.
+
+    Mutations only mark the config dirty; a debounced timer writes it to a
+    temp file in the same directory, fsyncs it and renames it over the old
+    file, so a crash never leaves a half-written config. Pending changes are
+    also flushed at interpreter exit, since the timer thread is a daemon and
+    would otherwise be dropped by sys.exit(). Changes made to the file by another process are picked up on
+    the next read, based on its mtime.
+    """
+    def __init__(self, config_path:str=None, flush_delay:float=CONFIG_FLUSH_DELAY_S):
         self.config_path = config_path or CONFIG_PATH
+        self.flush_delay = flush_delay
+        self._lock = threading.RLock()
+        self._dirty = False
+        self._flush_timer = None
+        self._mtime = None
         self.config=self.load_config()
+        atexit.register(self.flush)
+
+    def _file_mtime(self):
+        try: return os.stat(self.config_path).st_mtime_ns
+        except OSError: return None
 
     def load_config(self) -> dict:
         """Load configuration from file"""
+        self._mtime = self._file_mtime()
         if os.path.exists(self.config_path):
             try:
                 with open(self.config_path, 'r') as f:
                     return json.load(f)
             except json.JSONDecodeError:
-                print(f'Error parsing config file, using default config.')
+                logger.error('Error parsing config file, using default config.')
                 return self._get_default_config()
             except Exception as e:
-                print(f'Error loading config: {e}')
+                logger.error('Error loading config: %s', e)
                 return self._get_default_config()
         return self._get_default_config()
-    
+
+    def reload_if_changed(self) -> bool:
+        """Reload the config if the file changed on disk and there are no unsaved local changes."""
+        with self._lock:
+            if self._dirty or self._file_mtime() == self._mtime: return False
+            self.config = self.load_config()
+            return True
+
     def save_config(self) -> bool:
-        """Save configuration to file."""
-        try:
-            with open(self.config_path, 'w') as f:
-                json.dump(self.config, f)
+        """Mark the config dirty and schedule a debounced flush."""
+        with self._lock:
+            self._dirty = True
+            if self._flush_timer: self._flush_timer.cancel()
+            self._flush_timer = threading.Timer(self.flush_delay, self.flush)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+        return True
+
+    def flush(self) -> bool:
+        """Write pending changes now: temp file, fsync, then atomic rename into place."""
+        with self._lock:
+            if self._flush_timer:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            if not self._dirty: return True
+
+            directory = os.path.dirname(os.path.abspath(self.config_path))
+            try:
+                fd, temp_path = tempfile.mkstemp(prefix='.blue_sync_config.', suffix='.tmp', dir=directory)
+                try:
+                    with os.fdopen(fd, 'w') as f:
+                        json.dump(self.config, f)
+                        f.flush()
+                        os.fsync(f.fileno())
+                    os.replace(temp_path, self.config_path)
+                except BaseException:
+                    os.unlink(temp_path)
+                    raise
+            except Exception as e:
+                logger.error('Error saving config file: %s', e)
+                return False
+
+            self._dirty = False
+            self._mtime = self._file_mtime()
             return True
-        except Exception as e:
-            print(f'Error savin config file: {e}')
-            return False
+
+    def is_dirty(self) -> bool:
+        return self._dirty
         
     def _get_default_config(self) -> dict:
         """Get defaylt configuration."""
-        return {'auto_connect_device':None, 'renamed_devices':{}}
+        return {'auto_connect_device':None, 'auto_connect_devices':[], 'renamed_devices':{}, 'profiles':{}}
     
     def get_auto_connect_device(self) -> str:
-        """Get auto-connect device address"""
-        return self.config.get('auto_connect_device', None)
+        """Get the highest priority auto-connect device address"""
+        devices = self.get_auto_connect_devices()
+        return devices[0] if devices else None
     
     def set_auto_connect_device(self, address) -> bool:
-        self.config['auto_connect_device'] = address
-        return self.save_config()
+        """Make address the only auto-connect device, or clear the list with None"""
+        return self.set_auto_connect_devices([address] if address else [])
+    
+    def get_auto_connect_devices(self) -> list:
+        """Get auto-connect device addresses in priority order"""
+        self.reload_if_changed()
+        devices = list(self.config.get('auto_connect_devices', []))
+        legacy = self.config.get('auto_connect_device')
+        if legacy and legacy not in devices: devices.insert(0, legacy)
+        return devices
+    
+    def set_auto_connect_devices(self, addresses:list) -> bool:
+        """Replace the auto-connect list; earlier addresses are tried first"""
+        with self._lock:
+            self.reload_if_changed()
+            self.config['auto_connect_devices'] = list(dict.fromkeys(addresses))
+            self.config['auto_connect_device'] = None
+            return self.save_config()
     
     def get_renamed_devices(self) -> dict:
         """Get dictionary of renamed devices"""
+        self.reload_if_changed()
         return self.config.get('renamed_devices', {})
     
     def set_device_name(self, address:str, name:str) -> bool:
         """Set custom name for a device."""
-        renamed_devices = self.get_renamed_devices()
-        if name and name.strip(): renamed_devices[address] = name.strip()
-        elif address in renamed_devices: del renamed_devices[address]
+        with self._lock:
+            renamed_devices = self.get_renamed_devices()
+            if name and name.strip(): renamed_devices[address] = name.strip()
+            elif address in renamed_devices: del renamed_devices[address]
+            
+            self.config['renamed_devices'] = renamed_devices
+            return self.save_config()
+
+    
+    def get_profiles(self) -> dict:
+        """Get dictionary of device profiles by name"""
+        self.reload_if_changed()
+        return self.config.get('profiles', {})
+    
+    def get_profile(self, name:str) -> dict:
+        """Get one profile, or None if it does not exist"""
+        return self.get_profiles().get(name)
+    
+    def set_profile(self, name:str, connect:list, disconnect:list=(), after:dict=None, exclusive:bool=False) -> bool:
+        """Create or replace a profile.
         
-        self.config['renamed_devices'] = renamed_devices
-        return self.save_config()
\ No newline at end of file
+        Args:
+            name (str): Profile name.
+            connect (list): Addresses to connect.
+            disconnect (list): Addresses to disconnect.
+            after (dict): Ordering constraints; maps an address to the addresses that must be handled before it.
+            exclusive (bool): Also disconnect every connected device not in connect.
+        """
+        with self._lock:
+            profiles = self.get_profiles()
+            profiles[name] = {
+                'connect': list(connect),
+                'disconnect': list(disconnect),
+                'after': {address: list(before) for address, before in (after or {}).items()},
+                'exclusive': bool(exclusive)
+            }
+            self.config['profiles'] = profiles
+            return self.save_config()
+    
+    def delete_profile(self, name:str) -> bool:
+        """Delete a profile"""
+        with self._lock:
+            profiles = self.get_profiles()
+            if profiles.pop(name, None) is None: return False
+            self.config['profiles'] = profiles
+            return self.save_config()
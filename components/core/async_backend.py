@@ -0,0 +1,217 @@
+import asyncio
+import logging
+import threading
+import concurrent.futures
+import dbus
+from components.core.bluetooth_backend import BluetoothBackend, LinuxBluetoothBackend, build_discovery_filter
+from components.core.errors import (
+    BluetoothError, BluetoothTimeoutError, AlreadyConnectedError, NotConnectedError,
+    DeviceNotReadyError, OperationInProgressError, map_dbus_error
+)
+from components.utils.metrics import metrics
+from components.utils.constants import (
+    DBUS_CALL_TIMEOUT_S, CONNECT_TIMEOUT_S, DISCONNECT_TIMEOUT_S,
+    DISCONNECT_ALL_MAX_PARALLEL, DISCONNECT_ALL_DEADLINE_S, DISCOVERY_FILTER
+)
+
+logger = logging.getLogger(__name__)
+
+class AsyncBluetoothBackend(BluetoothBackend):
+    """Asyncio implementation of BluetoothBackend.
+
+    All operations run as coroutines on one dedicated event-loop thread.
+    D-Bus calls are issued through LinuxBluetoothBackend.start_call and their
+    replies resolve asyncio futures, so any number of operations can be in
+    flight without a thread each. The *_async methods return coroutines;
+    submit() schedules one and returns a concurrent.futures.Future. The
+    synchronous BluetoothBackend methods block on the same coroutines.
+    """
+    def __init__(self, config_manager, linux_backend=None):
+        self.config_manager = config_manager
+        self.linux = linux_backend or LinuxBluetoothBackend(config_manager)
+        self._last_errors = {}
+
+        self.loop = asyncio.new_event_loop()
+        self._blocking_executor = concurrent.futures.ThreadPoolExecutor(max_workers=2, thread_name_prefix='bluesync-blocking')
+        self._loop_thread = threading.Thread(target=self._run_loop, name='bluesync-asyncio', daemon=True)
+        self._loop_thread.start()
+
+    def _run_loop(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def submit(self, coroutine) -> concurrent.futures.Future:
+        """Schedule a coroutine on the backend loop from any thread."""
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop)
+
+    def close(self):
+        """Stop the event loop thread."""
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._blocking_executor.shutdown(wait=False, cancel_futures=True)
+
+    async def _run_blocking(self, func, *args):
+        """Run a call that has no asynchronous D-Bus form on the small blocking pool."""
+        return await self.loop.run_in_executor(self._blocking_executor, func, *args)
+
+    async def _call(self, path, interface, method, *args, timeout=DBUS_CALL_TIMEOUT_S):
+        """Await a BlueZ method call, mapping D-Bus errors to BluetoothError."""
+        with metrics.timer('bluez_call', method=method):
+            return await self._invoke(path, interface, method, *args, timeout=timeout)
+
+    async def _invoke(self, path, interface, method, *args, timeout=DBUS_CALL_TIMEOUT_S):
+        if not self.linux.supports_async_calls:
+            try:
+                return await self._run_blocking(
+                    lambda: self.linux.bus.get_object('org.bluez', path, introspect=False)
+                        .get_dbus_method(method, interface)(*args, timeout=timeout)
+                )
+            except Exception as e: raise map_dbus_error(e)
+
+        future = self.loop.create_future()
+
+        def resolve(setter, value):
+            if not future.done(): setter(value)
+
+        def on_reply(*values):
+            self.loop.call_soon_threadsafe(resolve, future.set_result, values)
+
+        def on_error(error):
+            self.loop.call_soon_threadsafe(resolve, future.set_exception, map_dbus_error(error))
+
+        try:
+            self.linux.start_call(path, interface, method, *args, timeout=timeout, on_reply=on_reply, on_error=on_error)
+        except Exception as e: raise map_dbus_error(e)
+
+        try: return await asyncio.wait_for(future, timeout + 1)
+        except asyncio.TimeoutError: raise BluetoothTimeoutError(f'{method} on {path} timed out after {timeout}s')
+
+    async def get_devices_async(self):
+        return await self._run_blocking(self.linux.get_devices)
+
+    async def scan_devices_async(self):
+        return await self.start_discovery_async()
+
+    async def start_discovery_async(self, discovery_filter=None):
+        try:
+            adapter = self.linux.get_adapter_path()
+            if adapter is None: raise DeviceNotReadyError('No Bluetooth adapter found')
+            await self._call(adapter, 'org.bluez.Adapter1', 'SetDiscoveryFilter',
+                             build_discovery_filter(DISCOVERY_FILTER if discovery_filter is None else discovery_filter))
+            await self._call(adapter, 'org.bluez.Adapter1', 'StartDiscovery')
+            return True
+        except OperationInProgressError: return True
+        except BluetoothError as e:
+            logger.error('Error scanning for devices: %s', e)
+            return False
+
+    async def stop_discovery_async(self):
+        try:
+            adapter = self.linux.get_adapter_path()
+            if adapter is None: return False
+            await self._call(adapter, 'org.bluez.Adapter1', 'StopDiscovery')
+            return True
+        except BluetoothError as e:
+            logger.warning('Error stopping discovery: %s', e)
+            return False
+
+    async def connect_device_async(self, address):
+        self._last_errors.pop(address, None)
+        try:
+            path = self.linux.require_device_path(address)
+            if self.linux.needs_trust(path):
+                try:
+                    await self._call(path, 'org.freedesktop.DBus.Properties', 'Set',
+                                     'org.bluez.Device1', 'Trusted', dbus.Boolean(True))
+                except BluetoothError as e: logger.warning('Error trusting %s: %s', address, e)
+            await self._call(path, 'org.bluez.Device1', 'Connect', timeout=CONNECT_TIMEOUT_S)
+            return True
+        except AlreadyConnectedError: return True
+        except BluetoothError as e:
+            self._last_errors[address] = e
+            logger.error('Error connecting to %s: %s', address, e)
+            return False
+
+    async def disconnect_device_async(self, address):
+        self._last_errors.pop(address, None)
+        try:
+            path = self.linux.require_device_path(address)
+            await self._call(path, 'org.bluez.Device1', 'Disconnect', timeout=DISCONNECT_TIMEOUT_S)
+            return True
+        except NotConnectedError: return True
+        except BluetoothError as e:
+            self._last_errors[address] = e
+            logger.error('Error disconnecting %s: %s', address, e)
+            return False
+
+    async def disconnect_all_devices_async(self, max_parallel=DISCONNECT_ALL_MAX_PARALLEL, deadline=DISCONNECT_ALL_DEADLINE_S):
+        addresses = self.linux.get_connected_addresses()
+        if not addresses: return {}
+
+        semaphore = asyncio.Semaphore(max(1, max_parallel))
+
+        async def disconnect(address):
+            async with semaphore: return await self.disconnect_device_async(address)
+
+        tasks = {asyncio.ensure_future(disconnect(address)): address for address in addresses}
+        done, pending = await asyncio.wait(tasks, timeout=deadline)
+        for task in pending: task.cancel()
+
+        results = {address: False for address in addresses}
+        for task in done:
+            if not task.cancelled() and task.exception() is None: results[tasks[task]] = bool(task.result())
+        return results
+
+    async def get_battery_level_async(self, device_path):
+        return await self._run_blocking(self.linux.get_battery_level, device_path)
+
+    def get_devices(self):
+        return self.submit(self.get_devices_async()).result()
+
+    def scan_devices(self):
+        return self.submit(self.scan_devices_async()).result()
+
+    def start_discovery(self, discovery_filter=None):
+        return self.submit(self.start_discovery_async(discovery_filter)).result()
+
+    def stop_discovery(self):
+        return self.submit(self.stop_discovery_async()).result()
+
+    def connect_device(self, address):
+        return self.submit(self.connect_device_async(address)).result()
+
+    def disconnect_device(self, address):
+        return self.submit(self.disconnect_device_async(address)).result()
+
+    def disconnect_all_devices(self, max_parallel=DISCONNECT_ALL_MAX_PARALLEL, deadline=DISCONNECT_ALL_DEADLINE_S):
+        return self.submit(self.disconnect_all_devices_async(max_parallel, deadline)).result()
+
+    def get_battery_level(self, device_path):
+        return self.submit(self.get_battery_level_async(device_path)).result()
+
+    def add_device_listener(self, callback):
+        self.linux.add_device_listener(callback)
+
+    def remove_device_listener(self, callback):
+        self.linux.remove_device_listener(callback)
+
+    def get_device(self, address):
+        return self.linux.get_device(address)
+
+    def get_connected_addresses(self):
+        return self.linux.get_connected_addresses()
+
+    @property
+    def supports_device_events(self):
+        return self.linux.supports_device_events
+
+    def get_last_error(self, address):
+        return self._last_errors.get(address) or self.linux.get_last_error(address)
+
+    def get_battery_cache_stats(self):
+        return self.linux.get_battery_cache_stats()
+
+    def has_live_battery(self, address):
+        return self.linux.has_live_battery(address)
+
+    def is_adapter_powered(self):
+        return self.linux.is_adapter_powered()
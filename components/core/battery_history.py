@@ -0,0 +1,187 @@
+import os
+import time
+import array
+import struct
+import threading
+import logging
+from components.utils.constants import (BATTERY_HISTORY_PATH, BATTERY_HISTORY_CAPACITY,
+                                        BATTERY_HISTORY_HEARTBEAT_S, BATTERY_DRAIN_WINDOW_S)
+
+logger = logging.getLogger(__name__)
+
+# One on-disk record: 6-byte MAC, float64 unix time, int8 level
+RECORD = struct.Struct('<6sdb')
+
+class BatteryRing:
+    """Fixed-capacity ring buffer of (timestamp, level) samples for one device."""
+    __slots__ = ('capacity', 'timestamps', 'levels', 'start', 'count')
+
+    def __init__(self, capacity:int):
+        self.capacity = capacity
+        self.timestamps = array.array('d', bytes(8 * capacity))
+        self.levels = array.array('b', bytes(capacity))
+        self.start = 0
+        self.count = 0
+
+    def append(self, timestamp:float, level:int):
+        index = (self.start + self.count) % self.capacity
+        self.timestamps[index] = timestamp
+        self.levels[index] = level
+        if self.count < self.capacity: self.count += 1
+        else: self.start = (self.start + 1) % self.capacity
+
+    def last(self):
+        if not self.count: return None
+        index = (self.start + self.count - 1) % self.capacity
+        return self.timestamps[index], self.levels[index]
+
+    def samples(self, since:float=None) -> list:
+        """Return (timestamp, level) pairs in time order, optionally only those at or after since."""
+        result = []
+        for offset in range(self.count):
+            index = (self.start + offset) % self.capacity
+            if since is None or self.timestamps[index] >= since:
+                result.append((self.timestamps[index], self.levels[index]))
+        return result
+
+class BatteryHistoryStore:
+    """Per-device battery level history with drain-rate and time-to-empty estimates.
+
+    Each device gets a BatteryRing, so memory stays bounded however long the
+    process runs. Samples are appended to a binary log of fixed-size records
+    next to the config file; the log is read lazily on first use and
+    compacted to the ring contents once it grows past twice their size.
+    A sample is only stored when the level changed or the heartbeat interval
+    has passed since the last stored sample.
+    """
+    def __init__(self, path:str=BATTERY_HISTORY_PATH, capacity:int=BATTERY_HISTORY_CAPACITY,
+                 heartbeat_s:float=BATTERY_HISTORY_HEARTBEAT_S):
+        self.path = path
+        self.capacity = capacity
+        self.heartbeat_s = heartbeat_s
+        self._rings = {}
+        self._lock = threading.RLock()
+        self._loaded = False
+        self._log = None
+        self._log_records = 0
+
+    @staticmethod
+    def _pack_address(address:str) -> bytes:
+        return bytes.fromhex(address.replace(':', ''))
+
+    @staticmethod
+    def _unpack_address(packed:bytes) -> str:
+        return ':'.join(f'{byte:02X}' for byte in packed)
+
+    def _ring(self, address:str) -> BatteryRing:
+        ring = self._rings.get(address)
+        if ring is None: ring = self._rings[address] = BatteryRing(self.capacity)
+        return ring
+
+    def _ensure_loaded(self):
+        if self._loaded: return
+        self._loaded = True
+        try:
+            with open(self.path, 'rb') as f: data = f.read()
+        except FileNotFoundError: return
+        except Exception as e:
+            logger.error('Error loading battery history: %s', e)
+            return
+
+        usable = len(data) - len(data) % RECORD.size
+        for packed, timestamp, level in RECORD.iter_unpack(memoryview(data)[:usable]):
+            self._ring(self._unpack_address(packed)).append(timestamp, level)
+        self._log_records = usable // RECORD.size
+
+    def _append_to_log(self, address:str, timestamp:float, level:int):
+        try:
+            if self._log is None: self._log = open(self.path, 'ab')
+            self._log.write(RECORD.pack(self._pack_address(address), timestamp, level))
+            self._log.flush()
+            self._log_records += 1
+        except Exception as e:
+            logger.error('Error writing battery history: %s', e)
+            return
+
+        if self._log_records > 2 * sum(ring.count for ring in self._rings.values()) + self.capacity: self.compact()
+
+    def compact(self):
+        """Rewrite the log so it holds exactly the samples currently in memory."""
+        with self._lock:
+            self._ensure_loaded()
+            temp_path = f'{self.path}.tmp'
+            try:
+                with open(temp_path, 'wb') as f:
+                    for address, ring in self._rings.items():
+                        packed = self._pack_address(address)
+                        for timestamp, level in ring.samples():
+                            f.write(RECORD.pack(packed, timestamp, level))
+                    f.flush()
+                    os.fsync(f.fileno())
+                if self._log is not None:
+                    self._log.close()
+                    self._log = None
+                os.replace(temp_path, self.path)
+                self._log_records = sum(ring.count for ring in self._rings.values())
+            except Exception as e: logger.error('Error compacting battery history: %s', e)
+
+    def record(self, address:str, level:int, timestamp:float=None) -> bool:
+        """Store a reading. Returns False if it was skipped as redundant."""
+        if level is None: return False
+        timestamp = time.time() if timestamp is None else timestamp
+        level = max(0, min(100, int(level)))
+        with self._lock:
+            self._ensure_loaded()
+            ring = self._ring(address)
+            last = ring.last()
+            if last and last[1] == level and timestamp - last[0] < self.heartbeat_s: return False
+            ring.append(timestamp, level)
+            self._append_to_log(address, timestamp, level)
+        return True
+
+    def get_history(self, address:str, since:float=None) -> list:
+        """Return (timestamp, level) samples for address in time order."""
+        with self._lock:
+            self._ensure_loaded()
+            ring = self._rings.get(address)
+            return ring.samples(since) if ring else []
+
+    def get_addresses(self) -> list:
+        with self._lock:
+            self._ensure_loaded()
+            return list(self._rings)
+
+    def get_drain_rate(self, address:str, window_s:float=BATTERY_DRAIN_WINDOW_S) -> float:
+        """Return the discharge rate in percent per hour over the current discharge, or None.
+
+        Uses a least-squares fit over samples within window_s, starting after
+        the last time the level went up (i.e. the device was charged).
+        """
+        samples = self.get_history(address, since=time.time() - window_s)
+        for index in range(len(samples) - 1, 0, -1):
+            if samples[index][1] > samples[index - 1][1]:
+                samples = samples[index:]
+                break
+        if len(samples) < 2 or samples[-1][0] - samples[0][0] <= 0: return None
+
+        n = len(samples)
+        mean_t = sum(t for t, _ in samples) / n
+        mean_level = sum(level for _, level in samples) / n
+        variance = sum((t - mean_t) ** 2 for t, _ in samples)
+        if not variance: return None
+        slope = sum((t - mean_t) * (level - mean_level) for t, level in samples) / variance
+        return max(0.0, -slope * 3600)
+
+    def estimate_time_to_empty(self, address:str) -> float:
+        """Return the estimated seconds until the battery reaches 0%, or None if not draining."""
+        rate = self.get_drain_rate(address)
+        if not rate: return None
+        last_timestamp, last_level = self.get_history(address)[-1]
+        remaining = last_level / rate * 3600 - (time.time() - last_timestamp)
+        return max(0.0, remaining)
+
+    def close(self):
+        with self._lock:
+            if self._log is not None:
+                self._log.close()
+                self._log = None
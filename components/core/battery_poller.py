@@ -0,0 +1,93 @@
+import time
+from components.utils.constants import (
+    CRITICAL_BATTERY_THRESHOLD, BATTERY_CHECK_INTERVAL_MS, BATTERY_POLL_MIN_S,
+    BATTERY_POLL_MAX_S, BATTERY_POLL_CRITICAL_MARGIN, BATTERY_POLL_FULL_LEVEL
+)
+
+class BatteryPollScheduler:
+    """Decides when each device's battery should be polled next.
+
+    Devices near CRITICAL_BATTERY_THRESHOLD, or draining fast enough to reach
+    it soon, are polled every min_s. Full, unchanged or battery-less devices
+    back off exponentially up to max_s. The caller drives it: sync() the set
+    of devices to poll, poll whatever due() returns, and report each reading
+    with reschedule(). It is not thread-safe; use it from one thread.
+    Without battery_history, callers pass the drain rate to reschedule(),
+    e.g. when looking it up is a daemon round trip.
+    """
+    def __init__(self, battery_history=None, base_s:float=BATTERY_CHECK_INTERVAL_MS / 1000,
+                 min_s:float=BATTERY_POLL_MIN_S, max_s:float=BATTERY_POLL_MAX_S):
+        self.battery_history = battery_history
+        self.base_s = base_s
+        self.min_s = min_s
+        self.max_s = max_s
+        self._next_due = {}
+        self._intervals = {}
+        self._levels = {}
+        self._in_flight = set()
+        self._stats = {'polls': 0, 'backoffs': 0, 'fast_polls': 0}
+
+    def sync(self, addresses):
+        """Track exactly addresses; new ones are due immediately."""
+        addresses = set(addresses)
+        for address in [a for a in self._next_due if a not in addresses]:
+            self._next_due.pop(address)
+            self._intervals.pop(address, None)
+            self._levels.pop(address, None)
+            self._in_flight.discard(address)
+        now = time.monotonic()
+        for address in addresses: self._next_due.setdefault(address, now)
+
+    def due(self, now:float=None) -> list:
+        """Return tracked devices whose poll is due and mark them in flight."""
+        now = time.monotonic() if now is None else now
+        due = [a for a, at in self._next_due.items() if at <= now and a not in self._in_flight]
+        self._in_flight.update(due)
+        self._stats['polls'] += len(due)
+        return due
+
+    def reschedule(self, address:str, level:int, now:float=None, drain_rate:float=None):
+        """Record a poll result and set the device's next due time."""
+        self._in_flight.discard(address)
+        if address not in self._next_due: return
+        now = time.monotonic() if now is None else now
+        interval = self._interval(address, level, drain_rate)
+        self._intervals[address] = interval
+        self._levels[address] = level
+        self._next_due[address] = now + interval
+
+    def _interval(self, address, level, rate=None) -> float:
+        previous = self._intervals.get(address, self.base_s)
+        backoff = min(previous * 2, self.max_s)
+
+        if level is None:
+            self._stats['backoffs'] += 1
+            return backoff
+        if level <= CRITICAL_BATTERY_THRESHOLD + BATTERY_POLL_CRITICAL_MARGIN:
+            self._stats['fast_polls'] += 1
+            return self.min_s
+
+        if rate is None and self.battery_history: rate = self.battery_history.get_drain_rate(address)
+        if rate:
+            # Poll about four times before the level can reach the threshold
+            seconds_to_critical = (level - CRITICAL_BATTERY_THRESHOLD) / rate * 3600
+            interval = max(self.min_s, min(self.max_s, seconds_to_critical / 4))
+            if interval < self.base_s: self._stats['fast_polls'] += 1
+            return interval
+
+        if level >= BATTERY_POLL_FULL_LEVEL or level == self._levels.get(address):
+            self._stats['backoffs'] += 1
+            return backoff
+        return self.base_s
+
+    def next_delay(self, now:float=None) -> float:
+        """Seconds until the next poll is due, or None when nothing is waiting."""
+        now = time.monotonic() if now is None else now
+        pending = [at for a, at in self._next_due.items() if a not in self._in_flight]
+        return max(0.0, min(pending) - now) if pending else None
+
+    def get_stats(self) -> dict:
+        stats = dict(self._stats)
+        stats['tracked'] = len(self._next_due)
+        stats['in_flight'] = len(self._in_flight)
+        return stats
@@ -1,8 +1,52 @@
 import re
 import abc
 import dbus
+import time
+import logging
+import threading
 import subprocess
+import concurrent.futures
 from components.core.device import BluetoothDevice
+from components.core.upower_index import UPowerIndex
+from components.core.errors import (
+    BluetoothError, BluetoothTimeoutError, DeviceNotFoundError, DeviceNotReadyError,
+    AlreadyConnectedError, NotConnectedError, OperationInProgressError, map_dbus_error
+)
+from components.utils.metrics import metrics
+from components.utils.constants import (
+    DBUS_CALL_TIMEOUT_S, CONNECT_TIMEOUT_S, DISCONNECT_TIMEOUT_S,
+    DISCONNECT_ALL_MAX_PARALLEL, DISCONNECT_ALL_DEADLINE_S, BATTERY_NEGATIVE_TTL_S, BLUETOOTHCTL_TIMEOUT_S,
+    DISCOVERY_FILTER
+)
+
+try:
+    from dbus.mainloop.glib import DBusGMainLoop, threads_init
+    from gi.repository import GLib
+except ImportError:
+    DBusGMainLoop = None
+    threads_init = None
+    GLib = None
+
+logger = logging.getLogger(__name__)
+
+DISCOVERY_FILTER_TYPES = {
+    'Transport': dbus.String,
+    'RSSI': dbus.Int16,
+    'Pathloss': dbus.UInt16,
+    'UUIDs': lambda uuids: dbus.Array(uuids, signature='s'),
+    'DuplicateData': dbus.Boolean,
+    'Discoverable': dbus.Boolean,
+    'Pattern': dbus.String,
+}
+
+def build_discovery_filter(discovery_filter:dict) -> dbus.Dictionary:
+    """Convert a plain discovery filter dict into the typed a{sv} SetDiscoveryFilter expects."""
+    typed = {}
+    for key, value in discovery_filter.items():
+        if value is None: continue
+        if key not in DISCOVERY_FILTER_TYPES: raise ValueError(f'Unknown discovery filter key: {key}')
+        typed[key] = DISCOVERY_FILTER_TYPES[key](value)
+    return dbus.Dictionary(typed, signature='sv')
 
 class BluetoothBackend(abc.ABC):
     """Abstract base class for Bluetooth backend implementations."""
@@ -12,6 +56,12 @@ class BluetoothBackend(abc.ABC):
     @abc.abstractmethod
     def scan_devices(self) -> bool: pass
 
+    @abc.abstractmethod
+    def start_discovery(self, discovery_filter:dict=None) -> bool: pass
+
+    @abc.abstractmethod
+    def stop_discovery(self) -> bool: pass
+
     @abc.abstractmethod
     def connect_device(self, address:str) -> bool: pass
 
@@ -19,214 +69,581 @@ class BluetoothBackend(abc.ABC):
     def disconnect_device(self, address:str) -> bool: pass
 
     @abc.abstractmethod
-    def disconnect_all_devices(self) -> bool: pass
+    def disconnect_all_devices(self, max_parallel:int=DISCONNECT_ALL_MAX_PARALLEL,
+                               deadline:float=DISCONNECT_ALL_DEADLINE_S) -> dict: pass
 
     @abc.abstractmethod
     def get_battery_level(self, device_path:str) -> int: pass
 
+    def add_device_listener(self, callback) -> None:
+        """Register callback(event, address) for device registry changes. No-op by default."""
+
+    def remove_device_listener(self, callback) -> None:
+        """Unregister a device listener. No-op by default."""
+
+    def get_last_error(self, address:str):
+        """Return the error from the last failed operation on address, if known."""
+        return None
+
+    def get_device(self, address:str):
+        """Return one device by address, or None. Defaults to a full get_devices()."""
+        return next((d for d in self.get_devices() if d.address == address), None)
+
+    def get_connected_addresses(self) -> list:
+        """Return the addresses of connected devices. Defaults to a full get_devices()."""
+        return [d.address for d in self.get_devices() if d.connected]
+
+    @property
+    def supports_device_events(self) -> bool:
+        """Whether device listeners receive live events."""
+        return False
+
+    def get_battery_cache_stats(self) -> dict:
+        """Return battery lookup cache counters, empty when the backend does not cache."""
+        return {}
+
+    def has_live_battery(self, address:str) -> bool:
+        """Whether battery changes for address arrive as device events, so polling is unnecessary."""
+        return False
+
+    def is_adapter_powered(self) -> bool:
+        """Whether a Bluetooth adapter is available and powered. Assumed True by default."""
+        return True
+
 class LinuxBluetoothBackend(BluetoothBackend):
     """Linux implementation of BluetoothBackend using dbus"""
+    BATTERY_SOURCES = ('battery1', 'device1', 'upower', 'bluetoothctl')
+
     def __init__(self, config_manager):
-        self.bus = dbus.SystemBus()
         self.config_manager = config_manager
+        self.bus = dbus.SystemBus(mainloop=DBusGMainLoop()) if DBusGMainLoop else dbus.SystemBus()
+
+        # Device registry: object path -> {'Device1': props, 'Battery1': props or None}
+        self._registry = {}
+        self._path_by_address = {}
+        self._registry_lock = threading.RLock()
+        self._registry_seeded = False
+        self._adapters = {}
+        self._device_listeners = []
+        self._signal_loop = None
+        self._last_errors = {}
+
+        # Battery source memo: address -> source, (address, source) -> negative expiry.
+        # Read and updated from scheduler workers and the signal thread, so guarded by _battery_lock;
+        # the lock is never held while a source is being read.
+        self._battery_lock = threading.Lock()
+        self._battery_sources = {}
+        self._battery_negative = {}
+        self._battery_stats = {'hits': 0, 'misses': 0, 'negative_hits': 0}
+        self._connected_addresses = set()
+        self.upower = UPowerIndex(self.bus)
+
+        self._seed_registry()
+        self._subscribe_signals()
+
+    def add_device_listener(self, callback):
+        """Register callback(event, address) for 'added', 'removed' and 'changed' registry events.
+
+        'adapter' events pass the adapter object path instead of an address,
+        and 'reset' passes None after bluetoothd restarts.
+        """
+        if callback not in self._device_listeners: self._device_listeners.append(callback)
+
+    def remove_device_listener(self, callback):
+        """Unregister a previously added device listener."""
+        if callback in self._device_listeners: self._device_listeners.remove(callback)
+
+    def _notify_listeners(self, event, address):
+        for callback in list(self._device_listeners):
+            try: callback(event, address)
+            except Exception: logger.exception('Error in device listener')
+
+    def _seed_registry(self):
+        """Populate the registry with a single GetManagedObjects call."""
+        try:
+            with metrics.timer('dbus_get_managed_objects'):
+                obj = self.bus.get_object('org.bluez', '/')
+                manager = dbus.Interface(obj, 'org.freedesktop.DBus.ObjectManager')
+                objects = manager.GetManagedObjects()
+        except Exception as e:
+            logger.error('Error seeding device registry: %s', e)
+            return False
+
+        with self._registry_lock:
+            self._registry.clear()
+            self._path_by_address.clear()
+            self._adapters.clear()
+            for path, interfaces in objects.items():
+                self._store_interfaces(str(path), interfaces)
+            self._registry_seeded = True
+        return True
+
+    def _subscribe_signals(self):
+        """Keep the registry current from BlueZ signals when a GLib main loop is available."""
+        if not (DBusGMainLoop and GLib): return
+        try:
+            self.bus.add_signal_receiver(
+                self._on_interfaces_added,
+                dbus_interface='org.freedesktop.DBus.ObjectManager',
+                signal_name='InterfacesAdded',
+                bus_name='org.bluez'
+            )
+            self.bus.add_signal_receiver(
+                self._on_interfaces_removed,
+                dbus_interface='org.freedesktop.DBus.ObjectManager',
+                signal_name='InterfacesRemoved',
+                bus_name='org.bluez'
+            )
+            self.bus.add_signal_receiver(
+                self._on_properties_changed,
+                dbus_interface='org.freedesktop.DBus.Properties',
+                signal_name='PropertiesChanged',
+                bus_name='org.bluez',
+                path_keyword='path'
+            )
+            self.bus.watch_name_owner('org.bluez', self._on_bluez_owner_changed)
+            self.upower.subscribe()
+
+            threads_init()
+            self._signal_loop = GLib.MainLoop()
+            threading.Thread(target=self._signal_loop.run, daemon=True).start()
+        except Exception as e:
+            logger.error('Error subscribing to BlueZ signals: %s', e)
+            self._signal_loop = None
+            self.upower.live = False
+
+    @property
+    def supports_device_events(self) -> bool:
+        return self.registry_live
+
+    @property
+    def registry_live(self) -> bool:
+        """Whether the registry is kept current by signals rather than reseeded on every read."""
+        return self._signal_loop is not None and self._registry_seeded
+
+    def has_live_battery(self, address):
+        """True when the device exposes Battery1 and the registry is kept current by signals."""
+        if not self.registry_live: return False
+        with self._registry_lock:
+            entry = self._registry.get(self._path_by_address.get(address))
+            return entry is not None and entry['Battery1'] is not None
+
+    def _store_interfaces(self, path, interfaces):
+        """Merge interface properties for path into the registry. Returns the address or None."""
+        if 'org.bluez.Adapter1' in interfaces:
+            self._adapters.setdefault(path, {}).update(interfaces['org.bluez.Adapter1'])
+
+        entry = self._registry.get(path)
+        if 'org.bluez.Device1' in interfaces:
+            if entry is None:
+                entry = {'Device1': {}, 'Battery1': None}
+                self._registry[path] = entry
+            entry['Device1'].update(interfaces['org.bluez.Device1'])
+        if entry is None: return None
+
+        if 'org.bluez.Battery1' in interfaces:
+            entry['Battery1'] = dict(entry['Battery1'] or {}, **interfaces['org.bluez.Battery1'])
+
+        address = entry['Device1'].get('Address')
+        if address is None: return None
+        address = str(address)
+        self._path_by_address[address] = path
+        return address
+
+    def _on_interfaces_added(self, path, interfaces):
+        path = str(path)
+        with self._registry_lock:
+            is_new = path not in self._registry
+            address = self._store_interfaces(path, interfaces)
+        if 'org.bluez.Adapter1' in interfaces: self._notify_listeners('adapter', path)
+        if address: self._notify_listeners('added' if is_new else 'changed', address)
+
+    def _on_interfaces_removed(self, path, interfaces):
+        path = str(path)
+        event = None
+        if 'org.bluez.Adapter1' in interfaces:
+            with self._registry_lock: self._adapters.pop(path, None)
+            self._notify_listeners('adapter', path)
+        with self._registry_lock:
+            entry = self._registry.get(path)
+            if entry is None: return
+            address = entry['Device1'].get('Address')
+            if 'org.bluez.Device1' in interfaces:
+                del self._registry[path]
+                if address is not None: self._path_by_address.pop(str(address), None)
+                event = 'removed'
+            elif 'org.bluez.Battery1' in interfaces:
+                entry['Battery1'] = None
+                event = 'changed'
+        if event and address is not None: self._notify_listeners(event, str(address))
+
+    def _on_properties_changed(self, interface, changed, invalidated, path=None):
+        path = str(path)
+        if interface == 'org.bluez.Adapter1':
+            with self._registry_lock:
+                props = self._adapters.setdefault(path, {})
+                props.update(changed)
+                for name in invalidated: props.pop(name, None)
+            self._notify_listeners('adapter', path)
+            return
+        if interface not in ('org.bluez.Device1', 'org.bluez.Battery1'): return
+        key = interface.split('.')[-1]
+        with self._registry_lock:
+            entry = self._registry.get(path)
+            if entry is None: return
+            props = entry[key] if entry[key] is not None else {}
+            props.update(changed)
+            for name in invalidated: props.pop(name, None)
+            entry[key] = props
+            address = entry['Device1'].get('Address')
+        if address is None: return
+        if key == 'Device1' and bool(changed.get('Connected', False)): self.invalidate_battery_cache(str(address))
+        self._notify_listeners('changed', str(address))
+
+    def _on_bluez_owner_changed(self, owner):
+        """Reseed when bluetoothd (re)starts, drop everything when it goes away."""
+        if owner:
+            self._seed_registry()
+        else:
+            with self._registry_lock:
+                self._registry.clear()
+                self._path_by_address.clear()
+                self._adapters.clear()
+        self._notify_listeners('reset', None)
+
+    def get_device_path(self, address):
+        """Return the BlueZ object path for address, or None if unknown."""
+        with self._registry_lock:
+            return self._path_by_address.get(address)
+
+    def get_connected_addresses(self):
+        """Return addresses the registry reports as connected, without battery lookups."""
+        if not self.registry_live: self._seed_registry()
+        with self._registry_lock:
+            return [
+                str(entry['Device1']['Address']) for entry in self._registry.values()
+                if 'Address' in entry['Device1'] and bool(entry['Device1'].get('Connected', False))
+            ]
 
     def get_devices(self):
+        if not self.registry_live: self._seed_registry()
+        return self._build_devices(self._snapshot())
+
+    def get_device(self, address):
+        """Build a single BluetoothDevice from the registry, or None if unknown."""
+        path = self.get_device_path(address)
+        if path is None: return None
+        devices = self._build_devices(self._snapshot([path]))
+        return devices[0] if devices else None
+
+    def _snapshot(self, paths=None):
+        """Copy registry entries (all, or only paths) so devices can be built outside the lock."""
+        with self._registry_lock:
+            entries = self._registry.items() if paths is None else [(p, self._registry[p]) for p in paths if p in self._registry]
+            return [
+                (path, dict(entry['Device1']), dict(entry['Battery1']) if entry['Battery1'] is not None else None)
+                for path, entry in entries
+            ]
+
+    def _build_devices(self, snapshot):
+        """Build BluetoothDevice snapshots; a device that fails to build is logged and skipped."""
         devices = []
-        try:
-            obj = self.bus.get_object('org.bluez', '/')
-            manager = dbus.Interface(obj, 'org.freedesktop.DBus.ObjectManager')
-            objects = manager.GetManagedObjects()
+        auto_connect_devices = set(self.config_manager.get_auto_connect_devices())
+        renamed_devices = self.config_manager.get_renamed_devices()
 
-            auto_connect_device = self.config_manager.get_auto_connect_device()
-            renamed_devices = self.config_manager.get_renamed_devices()
+        for path, device_props, battery_props in snapshot:
+            try:
+                if 'Address' not in device_props: continue
+                address = str(device_props['Address'])
+                if 'Name' not in device_props: continue
 
-            for path, interfaces in objects.items():
-                if 'org.bluez.Device1' in interfaces:
-                    device_props = interfaces['org.bluez.Device1']
-
-                    if 'Address' not in device_props: continue
-                    address = str(device_props['Address'])
-                    if 'Name' not in device_props: continue
-
-                    name = str(device_props.get('Name'))
-                    paired = bool(device_props.get('Paired', False))
-                    connected = bool(device_props.get('Connected', False))
-                    device_class = device_props.get('Class', 0)
-
-                    auto_connect = (address == auto_connect_device)
-                    custom_name = renamed_devices.get(address, None)
-
-                    battery_level = None
-                    if connected:
-                        print(f"\n Checking battery for connected device: {name} ({address})")
-
-                        if 'org.bluez.Battery1' in interfaces:
-                            print(f'Device has Battery1 interface')
-                            battery_props = interfaces['org.bluez.Battery1']                        
-                            if 'Percentage' in battery_props:
-                                battery_level = int(battery_props['Percentage'])
-                                print(f'Battery level from interfaces: {battery_level}%')
-                        else:
-                            print(f'Device does not have Battery1 interface in GetManagedObjects.')
-                            battery_level = self.get_battery_level(path)
-
-                        if battery_level is not None: print(f'Final battery level: {battery_level}%')
-                        else: print('Could not determine battery level.')
-
-                    device = BluetoothDevice(
-                        address, name, paired, connected, auto_connect,
-                        device_class, custom_name, battery_level
-                    )
-                    devices.append(device)
-        except Exception as e: print(f'Error getting devices: {e}')
+                name = str(device_props.get('Name'))
+                paired = bool(device_props.get('Paired', False))
+                connected = bool(device_props.get('Connected', False))
+                device_class = int(device_props.get('Class', 0))
+                appearance = int(device_props['Appearance']) if 'Appearance' in device_props else None
+
+                auto_connect = address in auto_connect_devices
+                custom_name = renamed_devices.get(address, None)
+
+                if connected and address not in self._connected_addresses: self.invalidate_battery_cache(address)
+                if connected: self._connected_addresses.add(address)
+                else: self._connected_addresses.discard(address)
+
+                battery_level = None
+                if connected:
+                    if battery_props is not None:
+                        if 'Percentage' in battery_props: battery_level = int(battery_props['Percentage'])
+                    else:
+                        battery_level = self.get_battery_level(path)
+
+                device = BluetoothDevice(
+                    address, name, paired, connected, auto_connect,
+                    device_class, custom_name, battery_level, appearance
+                )
+                devices.append(device)
+            except Exception as e: logger.error('Error building device at %s: %s', path, e)
         return devices
     
     def scan_devices(self):
+        return self.start_discovery()
+
+    def get_adapter_path(self):
+        """Return the object path of the first known adapter, or None."""
+        if not self.registry_live and not self._adapters: self._seed_registry()
+        with self._registry_lock:
+            return next(iter(sorted(self._adapters)), None)
+
+    def is_adapter_powered(self):
+        """True if any known adapter is powered."""
+        if not self.registry_live: self._seed_registry()
+        with self._registry_lock:
+            return any(bool(props.get('Powered', False)) for props in self._adapters.values())
+
+    def is_discovering(self) -> bool:
+        with self._registry_lock:
+            return any(bool(props.get('Discovering', False)) for props in self._adapters.values())
+
+    def start_discovery(self, discovery_filter=None):
+        """Start adapter discovery with a filter (Transport, RSSI, UUIDs, DuplicateData, Pathloss)."""
         try:
-            subprocess.run(['bluetoothctl', 'scan', 'on'], timeout=5)
+            adapter = self.get_adapter_path()
+            if adapter is None: raise DeviceNotReadyError('No Bluetooth adapter found')
+            self._call(adapter, 'org.bluez.Adapter1', 'SetDiscoveryFilter',
+                       build_discovery_filter(DISCOVERY_FILTER if discovery_filter is None else discovery_filter))
+            self._call(adapter, 'org.bluez.Adapter1', 'StartDiscovery')
             return True
-        except subprocess.TimeoutExpired: return True
-        except Exception as e: 
-            print(f'Error scanning for devices: {e}')
+        except OperationInProgressError: return True
+        except BluetoothError as e:
+            logger.error('Error scanning for devices: %s', e)
+            return False
+
+    def stop_discovery(self):
+        try:
+            adapter = self.get_adapter_path()
+            if adapter is None: return False
+            self._call(adapter, 'org.bluez.Adapter1', 'StopDiscovery')
+            return True
+        except BluetoothError as e:
+            # BlueZ answers Failed/NotReady when this client has no discovery session running
+            logger.warning('Error stopping discovery: %s', e)
             return False
         
     def connect_device(self, address):
+        self._last_errors.pop(address, None)
         try:
-            subprocess.run(['bluetoothctl', 'trust', address])
-            result = subprocess.run(
-                ['bluetoothctl', 'connect', address],
-                capture_output=True,
-                text=True
-            )
-
-            if 'Failed' in result.stdout or 'failed' in result.stderr:
-                print(f'Error connecting to device: {result.stderr or result.stdout}')
-                return False
+            path = self.require_device_path(address)
+            self._set_trusted(path)
+            self._call(path, 'org.bluez.Device1', 'Connect', timeout=CONNECT_TIMEOUT_S)
             return True
-        except Exception as e:
-            print(f'Error connecting to device: {e}')
+        except AlreadyConnectedError: return True
+        except BluetoothError as e:
+            self._last_errors[address] = e
+            logger.error('Error connecting to %s: %s', address, e)
             return False
         
     def disconnect_device(self, address):
+        self._last_errors.pop(address, None)
         try:
-            result = subprocess.run(
-                ['bluetoothctl', 'disconnect', address], 
-                capture_output=True, 
-                text=True
-            )
-            
-            if "Failed" in result.stdout or "failed" in result.stderr:
-                print(f"Error disconnecting device: {result.stderr or result.stdout}")
-                return False
-                
+            path = self.require_device_path(address)
+            self._call(path, 'org.bluez.Device1', 'Disconnect', timeout=DISCONNECT_TIMEOUT_S)
             return True
-        except Exception as e:
-            print(f"Error disconnecting device: {e}")
+        except NotConnectedError: return True
+        except BluetoothError as e:
+            self._last_errors[address] = e
+            logger.error('Error disconnecting %s: %s', address, e)
             return False
+
+    def get_last_error(self, address):
+        """Return the BluetoothError from the last failed connect/disconnect of address, if any."""
+        return self._last_errors.get(address)
+
+    def require_device_path(self, address):
+        """Resolve address to a device object path, reseeding the registry once on a miss."""
+        path = self.get_device_path(address)
+        if path is None and self._seed_registry(): path = self.get_device_path(address)
+        if path is None: raise DeviceNotFoundError(f'Unknown device {address}')
+        return path
+
+    def needs_trust(self, path):
+        """Whether the registry does not yet record the device at path as trusted."""
+        with self._registry_lock:
+            entry = self._registry.get(path)
+            return not (entry and bool(entry['Device1'].get('Trusted', False)))
+
+    def _set_trusted(self, path):
+        """Mark the device trusted through Properties.Set unless the registry says it already is."""
+        if not self.needs_trust(path): return
+        try:
+            self._call(path, 'org.freedesktop.DBus.Properties', 'Set',
+                       'org.bluez.Device1', 'Trusted', dbus.Boolean(True))
+        except BluetoothError as e: logger.warning('Error trusting %s: %s', path, e)
+
+    @property
+    def supports_async_calls(self) -> bool:
+        """Whether start_call can deliver replies, i.e. the signal loop is running."""
+        return self._signal_loop is not None
+
+    def start_call(self, path, interface, method, *args, timeout=DBUS_CALL_TIMEOUT_S, on_reply, on_error):
+        """Issue a BlueZ method call without waiting. Handlers run on the signal loop thread."""
+        obj = self.bus.get_object('org.bluez', path, introspect=False)
+        func = obj.get_dbus_method(method, interface)
+        func(*args, reply_handler=on_reply, error_handler=on_error, timeout=timeout)
+
+    def _call(self, path, interface, method, *args, timeout=DBUS_CALL_TIMEOUT_S):
+        """Invoke a BlueZ method with a deadline, mapping D-Bus errors to BluetoothError.
+
+        When the signal loop is running the call is issued with reply/error
+        handlers and this thread only waits on the result; otherwise it falls
+        back to a blocking call with the same timeout. Every call is timed in
+        the bluez_call histogram by method.
+        """
+        with metrics.timer('bluez_call', method=method):
+            return self._invoke(path, interface, method, *args, timeout=timeout)
+
+    def _invoke(self, path, interface, method, *args, timeout=DBUS_CALL_TIMEOUT_S):
+        done = threading.Event()
+        result = {}
+
+        def on_reply(*values):
+            result['value'] = values
+            done.set()
+
+        def on_error(error):
+            result['error'] = error
+            done.set()
+
+        try:
+            if not self.supports_async_calls:
+                obj = self.bus.get_object('org.bluez', path, introspect=False)
+                return obj.get_dbus_method(method, interface)(*args, timeout=timeout)
+            self.start_call(path, interface, method, *args, timeout=timeout, on_reply=on_reply, on_error=on_error)
+        except Exception as e: raise map_dbus_error(e)
+
+        if not done.wait(timeout + 1):
+            raise BluetoothTimeoutError(f'{method} on {path} timed out after {timeout}s')
+        if 'error' in result: raise map_dbus_error(result['error'])
+        return result['value']
         
 
-    def disconnect_all_devices(self):
-        devices = self.get_devices()
-        success = True
-        for device in devices:
-            if device.connected:
-                if not self.disconnect_device(device.address):
-                    success = False
-        return success
+    def disconnect_all_devices(self, max_parallel=DISCONNECT_ALL_MAX_PARALLEL, deadline=DISCONNECT_ALL_DEADLINE_S):
+        """Disconnect every connected device concurrently.
+
+        Returns a dict mapping address to True/False. Devices still pending
+        when the deadline expires are reported as False.
+        """
+        addresses = self.get_connected_addresses()
+        if not addresses: return {}
+
+        results = {address: False for address in addresses}
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=max(1, min(max_parallel, len(addresses))))
+        try:
+            futures = {executor.submit(self.disconnect_device, address): address for address in addresses}
+            done, _ = concurrent.futures.wait(futures, timeout=deadline)
+            for future in done:
+                try: results[futures[future]] = bool(future.result())
+                except Exception as e: logger.error('Error disconnecting %s: %s', futures[future], e)
+        finally: executor.shutdown(wait=False, cancel_futures=True)
+        return results
     
 
     def get_battery_level(self, path):
+        """Return the battery percentage for the device at path, or None.
+
+        The source that last worked for the device is tried first. Sources
+        that failed are skipped until BATTERY_NEGATIVE_TTL_S expires or the
+        device reconnects.
+        """
+        address = self._get_address_from_path(path)
+        now = time.monotonic()
+
+        with self._battery_lock: source = self._battery_sources.get(address)
+        if source is not None:
+            level = self._read_battery_source(source, path, address)
+            with self._battery_lock:
+                if level is not None:
+                    self._battery_stats['hits'] += 1
+                    return level
+                if self._battery_sources.get(address) == source: self._battery_sources.pop(address)
+                self._battery_negative[(address, source)] = now + BATTERY_NEGATIVE_TTL_S
+
+        with self._battery_lock: self._battery_stats['misses'] += 1
+        for source in self.BATTERY_SOURCES:
+            with self._battery_lock:
+                expires = self._battery_negative.get((address, source))
+                if expires is not None and expires > now:
+                    self._battery_stats['negative_hits'] += 1
+                    continue
+
+            level = self._read_battery_source(source, path, address)
+            with self._battery_lock:
+                if level is not None:
+                    self._battery_sources[address] = source
+                    self._battery_negative.pop((address, source), None)
+                    return level
+                self._battery_negative[(address, source)] = now + BATTERY_NEGATIVE_TTL_S
+
+        logger.debug('No battery information available for %s', address)
+        return None
+
+    def invalidate_battery_cache(self, address):
+        """Forget the remembered and failed battery sources for address."""
+        with self._battery_lock:
+            self._battery_sources.pop(address, None)
+            for key in [k for k in list(self._battery_negative) if k[0] == address]: self._battery_negative.pop(key, None)
+
+    def get_battery_cache_stats(self):
+        """Return battery source cache counters: hits, misses and negative_hits."""
+        with self._battery_lock: return dict(self._battery_stats)
+
+    def _read_battery_source(self, source, path, address):
         try:
-            print(f"Attempting to get battery level for device at path: {path}")
-            
-            try:
-                device_obj = self.bus.get_object('org.bluez', path)
-                battery_props = dbus.Interface(device_obj, 'org.freedesktop.DBus.Properties')
-                try:
-                    battery_level = battery_props.Get('org.bluez.Battery1', 'Percentage')
-                    print(f"Found battery level via Battery1 interface: {battery_level}")
-                    return int(battery_level)
-                except dbus.exceptions.DBusException as e:
-                    print(f"No Battery1 interface available: {e}")
-            except Exception as e:
-                print(f"Error accessing device object: {e}")
-                
-            try:
-                device_obj = self.bus.get_object('org.bluez', path)
-                props_iface = dbus.Interface(device_obj, 'org.freedesktop.DBus.Properties')
-                props = props_iface.GetAll('org.bluez.Device1')
-                
-                if 'BatteryPercentage' in props:
-                    print(f"Found battery level in device properties: {props['BatteryPercentage']}")
-                    return int(props['BatteryPercentage'])
-                print("No BatteryPercentage property found in device properties")
-            except Exception as e:
-                print(f"Error getting device properties: {e}")
-                
-            try:
-                address = self._get_address_from_path(path)
-                print(f"Checking UPower for device with address: {address}")
-                
-                upower_bus = dbus.SystemBus()
-                upower_proxy = upower_bus.get_object('org.freedesktop.UPower', '/org/freedesktop/UPower')
-                upower_interface = dbus.Interface(upower_proxy, 'org.freedesktop.UPower')
-                
-                device_paths = upower_interface.EnumerateDevices()
-                
-                for device_path in device_paths:
-                    dev_proxy = upower_bus.get_object('org.freedesktop.UPower', device_path)
-                    dev_props = dbus.Interface(dev_proxy, 'org.freedesktop.DBus.Properties')
-                    
-                    try:
-                        device_type = dev_props.Get('org.freedesktop.UPower.Device', 'Type')
-                        if device_type == 7:
-                            device_native_path = str(dev_props.Get('org.freedesktop.UPower.Device', 'NativePath'))
-                            print(f"Found Bluetooth device in UPower: {device_native_path}")
-                            
-                            if address.replace(':', '_').lower() in device_native_path.lower():
-                                percentage = dev_props.Get('org.freedesktop.UPower.Device', 'Percentage')
-                                print(f"Found battery level via UPower: {percentage}%")
-                                return int(percentage)
-                    except Exception as e:
-                        print(f"Error checking UPower device: {e}")
-                
-                print("Device not found in UPower")
-            except Exception as e:
-                print(f"Error using UPower method: {e}")
-                
-            try:
-                address = self._get_address_from_path(path)
-                
-                print(f"Trying bluetoothctl info for address: {address}")
-                result = subprocess.run(['bluetoothctl', 'info', address], capture_output=True, text=True)
-                output = result.stdout
-                
-                battery_matches = re.findall(r'Battery Percentage: .*?(\d+)%', output)
-                if battery_matches:
-                    battery_level = int(battery_matches[0])
-                    print(f"Found battery level via bluetoothctl: {battery_level}")
-                    return battery_level
-                    
-                battery_matches = re.findall(r'Battery Level: .*?(\d+)%', output)
-                if battery_matches:
-                    battery_level = int(battery_matches[0])
-                    print(f"Found battery level via bluetoothctl: {battery_level}")
-                    return battery_level
-                    
-                print("No battery information found in bluetoothctl output")
-            except Exception as e:
-                print(f"Error using bluetoothctl method: {e}")
-                
-            print("All battery detection methods failed for this device")
-            return None
+            with metrics.timer('battery_read', source=source):
+                level = getattr(self, f'_battery_from_{source}')(path, address)
         except Exception as e:
-            print(f"Error getting battery level: {e}")
+            logger.debug('Error reading battery of %s via %s: %s', address, source, e)
             return None
+        metrics.inc('battery_read_results', source=source, result='found' if level is not None else 'empty')
+        return level
+
+    def _battery_from_battery1(self, path, address):
+        device_obj = self.bus.get_object('org.bluez', path, introspect=False)
+        battery_props = dbus.Interface(device_obj, 'org.freedesktop.DBus.Properties')
+        try: return int(battery_props.Get('org.bluez.Battery1', 'Percentage'))
+        except dbus.exceptions.DBusException: return None
+
+    def _battery_from_device1(self, path, address):
+        device_obj = self.bus.get_object('org.bluez', path, introspect=False)
+        props_iface = dbus.Interface(device_obj, 'org.freedesktop.DBus.Properties')
+        props = props_iface.GetAll('org.bluez.Device1')
+        if 'BatteryPercentage' in props: return int(props['BatteryPercentage'])
+        return None
+
+    def _battery_from_upower(self, path, address):
+        return self.upower.get_percentage(address)
+
+    def _battery_from_bluetoothctl(self, path, address):
+        with metrics.timer('subprocess', command='bluetoothctl'):
+            result = subprocess.run(['bluetoothctl', 'info', address], capture_output=True, text=True,
+                                    timeout=BLUETOOTHCTL_TIMEOUT_S)
+        output = result.stdout
+        
+        battery_matches = re.findall(r'Battery Percentage: .*?(\d+)%', output)
+        if battery_matches: return int(battery_matches[0])
+        
+        battery_matches = re.findall(r'Battery Level: .*?(\d+)%', output)
+        if battery_matches: return int(battery_matches[0])
+        return None
         
     def _get_address_from_path(self, path):
-        address = path.split('/')[-1]
-        if '_' in address: address = address.replace('_', ':')
-        return address
+        """Return the device address for a BlueZ object path, from the registry when it is known."""
+        with self._registry_lock:
+            entry = self._registry.get(path)
+            address = entry['Device1'].get('Address') if entry is not None else None
+        if address is not None: return str(address)
+        name = path.split('/')[-1]
+        if name.startswith('dev_'): name = name[4:]
+        return name.replace('_', ':').upper()
             
 
             
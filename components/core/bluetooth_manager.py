@@ -1,33 +1,247 @@
+import time
+import concurrent.futures
 from components.config.config_manager import ConfigManager
-from components.core.bluetooth_backend import LinuxBluetoothBackend
+from components.core.battery_history import BatteryHistoryStore
+from components.core.bluetooth_backend import BluetoothBackend, LinuxBluetoothBackend
+from components.core.reconnect import ReconnectSupervisor
+from components.core.scheduler import OperationScheduler
+from components.utils.metrics import metrics, label_snapshot, merge_snapshots
+from components.utils.constants import DEFAULT_BACKEND, SCHEDULER_MAX_WORKERS, PROFILE_DEADLINE_S
 
 class BluetoothManager:
-    """Main bluetooth manager class that orchestrates all Bluetooth operations."""
-    def __init__(self, config_manager=None):
+    """Main bluetooth manager class that orchestrates all Bluetooth operations.
+
+    backend is a backend kind ('linux', 'async' or 'remote') or a ready
+    BluetoothBackend instance, such as a FakeBluetoothBackend.
+    """
+    PER_DEVICE_OPERATIONS = {'connect_device', 'disconnect_device', 'poll_battery'}
+    SUPERSEDES = {
+        'connect_device': ('disconnect_device',),
+        'disconnect_device': ('connect_device',),
+        'start_discovery': ('stop_discovery',),
+        'stop_discovery': ('start_discovery',),
+    }
+
+    def __init__(self, config_manager=None, backend=None, battery_history=None):
         self.config_manager = config_manager or ConfigManager()
-        self.backend = LinuxBluetoothBackend(self.config_manager)
+        self.backend = backend if isinstance(backend, BluetoothBackend) else self._create_backend(backend or DEFAULT_BACKEND)
+        self.scheduler = OperationScheduler(SCHEDULER_MAX_WORKERS)
+        self.battery_history = battery_history or getattr(self.backend, 'battery_history', None) or BatteryHistoryStore()
+        self.reconnect = ReconnectSupervisor(self)
+
+    def _create_backend(self, kind):
+        if kind == 'async':
+            from components.core.async_backend import AsyncBluetoothBackend
+            return AsyncBluetoothBackend(self.config_manager)
+        if kind == 'remote':
+            from components.core.remote_backend import RemoteBluetoothBackend
+            return RemoteBluetoothBackend(self.config_manager)
+        if kind == 'linux': return LinuxBluetoothBackend(self.config_manager)
+        raise ValueError(f'Unknown Bluetooth backend: {kind}')
+
+    @property
+    def is_async(self) -> bool:
+        return hasattr(self.backend, 'submit')
+
+    @property
+    def is_remote(self) -> bool:
+        """Whether a daemon owns the backend, its config and its reconnect supervisor"""
+        return getattr(self.backend, 'is_remote', False)
+
+    def run_async(self, operation:str, *args) -> concurrent.futures.Future:
+        """Schedule a backend operation and return a Future for its result.
+
+        Operations on the same device run one at a time, duplicate pending
+        requests are coalesced, and a connect cancels a pending disconnect
+        (and vice versa). Operations without a device share one queue.
+        """
+        address = args[0] if operation in self.PER_DEVICE_OPERATIONS else None
+        # The coroutine path skips connect_device/disconnect_device, so record the user's intent here
+        if operation == 'connect_device': self.reconnect.release(address)
+        elif operation == 'disconnect_device': self.reconnect.hold(address)
+        coroutine_function = getattr(self.backend, f'{operation}_async', None) if self.is_async else None
+        if coroutine_function is not None:
+            func = lambda *call_args: self.backend.submit(coroutine_function(*call_args))
+        else:
+            # Manager-level operations such as poll_battery have no coroutine form; run them on a worker
+            func = getattr(self, operation)
+        started = time.perf_counter()
+
+        def on_created(future):
+            # Coalesced requests share this future, so it is observed once per execution
+            future.add_done_callback(lambda done: self._observe_operation(operation, started, done))
+            if self.is_async and operation == 'get_devices': future.add_done_callback(self._record_battery_future)
+
+        return self.scheduler.submit(address, operation, func, *args,
+                                     supersedes=self.SUPERSEDES.get(operation, ()), on_created=on_created)
+
+    def _observe_operation(self, operation, started, future):
+        """Time a scheduled operation from submission to completion, counted by outcome"""
+        if future.cancelled(): result = 'cancelled'
+        elif future.exception() is not None: result = 'error'
+        else: result = 'failed' if future.result() is False else 'ok'
+        metrics.observe('operation', time.perf_counter() - started, operation=operation)
+        metrics.inc('operation_results', operation=operation, result=result)
+
+    def get_scheduler_stats(self) -> dict:
+        return self.scheduler.get_stats()
+
+    def get_metrics(self) -> dict:
+        """Metrics snapshot of this process, plus the daemon's labelled process="daemon" when it serves the backend"""
+        snapshot = metrics.snapshot()
+        if self.is_remote:
+            snapshot = merge_snapshots(snapshot, label_snapshot(self.backend.get_metrics(), process='daemon'))
+        return snapshot
 
     def get_devices(self) -> list:
-        return self.backend.get_devices()
-    
+        devices = self.backend.get_devices()
+        self.record_battery_levels(devices)
+        return devices
+
+    def _record_battery_future(self, future):
+        if future.cancelled() or future.exception() is not None: return
+        self.record_battery_levels(future.result())
+
+    def record_battery_levels(self, devices) -> None:
+        """Add the battery level of every connected device to the history"""
+        for device in devices:
+            if device.connected and device.battery_level is not None:
+                self.battery_history.record(device.address, device.battery_level)
+
+    def poll_battery(self, address):
+        """Read one device's current state, including a fresh battery level, and record it"""
+        device = self.backend.get_device(address)
+        if device is not None: self.record_battery_levels([device])
+        return device
+
+    def has_live_battery(self, address) -> bool:
+        return self.backend.has_live_battery(address)
+
+    def is_adapter_powered(self) -> bool:
+        return self.backend.is_adapter_powered()
+
+    def get_battery_history(self, address, since=None) -> list:
+        return self.battery_history.get_history(address, since)
+
+    def get_drain_rate(self, address):
+        return self.battery_history.get_drain_rate(address)
+
+    def estimate_time_to_empty(self, address):
+        return self.battery_history.estimate_time_to_empty(address)
+
+    def add_device_listener(self, callback) -> None:
+        self.backend.add_device_listener(callback)
+
+    def remove_device_listener(self, callback) -> None:
+        self.backend.remove_device_listener(callback)
+
+    def get_device(self, address):
+        return self.backend.get_device(address)
+
+    def get_connected_addresses(self) -> list:
+        return self.backend.get_connected_addresses()
+
+    @property
+    def supports_device_events(self) -> bool:
+        return self.backend.supports_device_events
+
     def scan_devices(self) -> bool:
         return self.backend.scan_devices()
+
+    def start_discovery(self, discovery_filter=None) -> bool:
+        return self.backend.start_discovery(discovery_filter)
+
+    def stop_discovery(self) -> bool:
+        return self.backend.stop_discovery()
     
     def connect_device(self, address) -> bool:
+        self.reconnect.release(address)
         return self.backend.connect_device(address)
     
     def disconnect_device(self, address) -> bool:
+        # Hold before disconnecting so the supervisor does not treat the drop as unexpected
+        self.reconnect.hold(address)
         return self.backend.disconnect_device(address)
     
-    def disconnect_all_devices(self) -> bool:
-        return self.backend.disconnect_all_devices()
+    def get_last_error(self, address):
+        return self.backend.get_last_error(address)
+
+    def get_battery_cache_stats(self) -> dict:
+        return self.backend.get_battery_cache_stats()
+
+    def get_battery_level(self, device_path):
+        return self.backend.get_battery_level(device_path)
+
+    def disconnect_all_devices(self, **kwargs) -> dict:
+        """Disconnect everything, holding each device so the reconnect supervisor keeps running but leaves them alone"""
+        for address in self.get_connected_addresses(): self.reconnect.hold(address)
+        return self.backend.disconnect_all_devices(**kwargs)
     
+    def apply_profile(self, name, deadline=PROFILE_DEADLINE_S) -> dict:
+        """Connect and disconnect a profile's devices concurrently under one deadline.
+
+        A device starts only once every device listed for it in the profile's
+        'after' constraints has finished successfully; if one fails, the
+        devices waiting on it are skipped. Devices already in the wanted
+        state are not touched. Returns {address: {'action', 'success', 'error'}}.
+        """
+        profile = self.config_manager.get_profile(name)
+        if profile is None: raise KeyError(f'Unknown profile: {name}')
+
+        # Registry-backed on Linux, so deciding what to touch needs no battery lookups
+        connected = set(self.get_connected_addresses())
+        actions = {address: 'disconnect_device' for address in profile.get('disconnect', [])}
+        if profile.get('exclusive'): actions.update((address, 'disconnect_device') for address in connected)
+        actions.update((address, 'connect_device') for address in profile.get('connect', []))
+        after = {address: [d for d in profile.get('after', {}).get(address, []) if d in actions and d != address]
+                 for address in actions}
+
+        results = {}
+        def finish(address, success, error=None):
+            results[address] = {'action': actions[address].split('_')[0], 'success': success, 'error': error}
+
+        for address, action in actions.items():
+            if (action == 'connect_device') == (address in connected): finish(address, True)
+
+        running = {}
+        end = time.monotonic() + deadline
+        while True:
+            for address in actions:
+                if address in results or address in running.values(): continue
+                failed = [d for d in after[address] if d in results and not results[d]['success']]
+                if failed: finish(address, False, f'skipped: {", ".join(failed)} failed')
+                elif all(d in results for d in after[address]):
+                    running[self.run_async(actions[address], address)] = address
+
+            remaining = end - time.monotonic()
+            if not running or remaining <= 0: break
+            done, _ = concurrent.futures.wait(running, timeout=remaining, return_when=concurrent.futures.FIRST_COMPLETED)
+            for future in done:
+                address = running.pop(future)
+                if future.cancelled(): finish(address, False, 'cancelled')
+                elif future.exception() is not None: finish(address, False, str(future.exception()))
+                elif future.result(): finish(address, True)
+                else: finish(address, False, str(self.get_last_error(address) or 'failed'))
+
+        for future, address in running.items():
+            future.cancel()
+            finish(address, False, 'timed out')
+        for address in actions:
+            if address not in results: finish(address, False, 'timed out' if time.monotonic() >= end else 'ordering cycle')
+        return results
+
     def rename_device(self, address, name) -> bool:
+        if self.is_remote: return self.backend.rename_device(address, name)
         return self.config_manager.set_device_name(address, name)
     
     def set_auto_connect(self, address, auto_connect=True) -> bool:
-        if auto_connect: return self.config_manager.set_auto_connect_device(address)
-        else:
-            if self.config_manager.get_auto_connect_device() == address:
-                return self.config_manager.set_auto_connect_device(None)
-            return True
\ No newline at end of file
+        """Add address to the end of the auto-connect list, or remove it; the daemon's list when it owns the backend"""
+        if self.is_remote: return self.backend.set_auto_connect(address, auto_connect)
+        devices = [a for a in self.config_manager.get_auto_connect_devices() if a != address]
+        if auto_connect: devices.append(address)
+        success = self.config_manager.set_auto_connect_devices(devices)
+        if self.reconnect.running: self.reconnect.request_check()
+        return success
+
+    def get_reconnect_state(self, address=None):
+        return self.reconnect.get_state(address)
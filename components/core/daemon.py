@@ -0,0 +1,187 @@
+import os
+import json
+import queue
+import socket
+import threading
+import concurrent.futures
+import logging
+from components.core.device import BluetoothDevice
+from components.utils.constants import DAEMON_SOCKET_PATH, DAEMON_MAX_WORKERS, DAEMON_CLIENT_QUEUE_SIZE
+
+logger = logging.getLogger(__name__)
+
+def encode(value):
+    """Convert results to JSON-friendly values; devices become dicts and errors their message."""
+    if isinstance(value, BluetoothDevice): return value.as_dict()
+    if isinstance(value, Exception): return str(value)
+    if isinstance(value, (list, tuple)): return [encode(item) for item in value]
+    if isinstance(value, dict): return {str(key): encode(item) for key, item in value.items()}
+    return value
+
+class DaemonClient:
+    """One connected client. Replies and events are queued and written by a
+    dedicated thread, so a slow client never blocks the signal thread or the
+    worker pool; a client that falls max_queue messages behind is disconnected.
+    """
+    def __init__(self, conn, max_queue:int=DAEMON_CLIENT_QUEUE_SIZE):
+        self.conn = conn
+        self.subscribed = False
+        self.closed = False
+        self._queue = queue.Queue(max_queue)
+        threading.Thread(target=self._write_loop, name='bluesync-daemon-writer', daemon=True).start()
+
+    def send(self, message) -> bool:
+        """Queue message without blocking. Returns False if the client is gone or was dropped."""
+        if self.closed: return False
+        try: self._queue.put_nowait((json.dumps(message) + '\n').encode())
+        except queue.Full:
+            logger.warning('Disconnecting BlueSync daemon client that fell %d messages behind', self._queue.maxsize)
+            self.close()
+            return False
+        return True
+
+    def _write_loop(self):
+        while True:
+            data = self._queue.get()
+            if data is None or self.closed: return
+            try: self.conn.sendall(data)
+            except OSError:
+                self.close()
+                return
+
+    def close(self):
+        """Shut the socket down, which also ends the reader and unblocks a writer stuck in sendall."""
+        if self.closed: return
+        self.closed = True
+        try: self.conn.shutdown(socket.SHUT_RDWR)
+        except OSError: pass
+        try: self._queue.put_nowait(None)
+        except queue.Full: pass
+
+class DaemonServer:
+    """Serves one BluetoothManager to local clients over a Unix socket.
+
+    The protocol is newline-delimited JSON. A request is
+    {"id": n, "method": name, "params": [...] or {...}} and gets back
+    {"id": n, "result": ...} or {"id": n, "error": {"type": ..., "message": ...}}.
+    Requests run on a worker pool, so replies can arrive out of order. After
+    a "subscribe" request the connection also receives device events as
+    {"event": name, "address": address}.
+    """
+    # Methods clients may call, mapped to the BluetoothManager attribute that serves them
+    METHODS = {
+        'ping': None,
+        'subscribe': None,
+        'get_devices': 'get_devices',
+        'get_connected_addresses': 'get_connected_addresses',
+        'get_device': 'poll_battery',
+        'scan_devices': 'scan_devices',
+        'start_discovery': 'start_discovery',
+        'stop_discovery': 'stop_discovery',
+        'connect_device': 'connect_device',
+        'disconnect_device': 'disconnect_device',
+        'disconnect_all_devices': 'disconnect_all_devices',
+        'get_last_error': 'get_last_error',
+        'has_live_battery': 'has_live_battery',
+        'get_battery_level': 'get_battery_level',
+        'rename_device': 'rename_device',
+        'set_auto_connect': 'set_auto_connect',
+        'apply_profile': 'apply_profile',
+        'get_reconnect_state': 'get_reconnect_state',
+        'is_adapter_powered': 'is_adapter_powered',
+        'get_battery_history': 'get_battery_history',
+        'get_drain_rate': 'get_drain_rate',
+        'estimate_time_to_empty': 'estimate_time_to_empty',
+        'get_battery_cache_stats': 'get_battery_cache_stats',
+        'get_scheduler_stats': 'get_scheduler_stats',
+        'get_metrics': 'get_metrics',
+    }
+    # Operations that go through the manager's scheduler so they are serialized per device
+    SCHEDULED = {'connect_device', 'disconnect_device', 'start_discovery', 'stop_discovery'}
+
+    def __init__(self, bt_manager, socket_path:str=DAEMON_SOCKET_PATH, max_workers:int=DAEMON_MAX_WORKERS):
+        self.bt_manager = bt_manager
+        self.socket_path = socket_path
+        self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='bluesync-daemon')
+        self._server = None
+        self._running = False
+        self._clients = set()
+        self._lock = threading.Lock()
+
+    def _remove_stale_socket(self):
+        """Delete a socket file left behind by a daemon that is no longer running."""
+        if not os.path.exists(self.socket_path): return
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(self.socket_path)
+            raise RuntimeError(f'BlueSync daemon already running on {self.socket_path}')
+        except (ConnectionRefusedError, FileNotFoundError): os.unlink(self.socket_path)
+        finally: probe.close()
+
+    def serve_forever(self):
+        self._remove_stale_socket()
+        self._server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._server.bind(self.socket_path)
+        os.chmod(self.socket_path, 0o600)
+        self._server.listen()
+        self._running = True
+        self.bt_manager.add_device_listener(self._broadcast)
+        logger.info('BlueSync daemon listening on %s', self.socket_path)
+
+        try:
+            while self._running:
+                try: conn, _ = self._server.accept()
+                except OSError: break
+                threading.Thread(target=self._handle_client, args=(conn,), daemon=True).start()
+        finally: self.shutdown()
+
+    def shutdown(self):
+        if not self._running: return
+        self._running = False
+        self.bt_manager.remove_device_listener(self._broadcast)
+        try: self._server.close()
+        except OSError: pass
+        if os.path.exists(self.socket_path): os.unlink(self.socket_path)
+        with self._lock: clients = list(self._clients)
+        for client in clients: client.close()
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+    def _handle_client(self, conn):
+        client = DaemonClient(conn)
+        with self._lock: self._clients.add(client)
+        try:
+            for line in conn.makefile('r'):
+                if not line.strip(): continue
+                try: request = json.loads(line)
+                except json.JSONDecodeError:
+                    client.send({'id': None, 'error': {'type': 'ValueError', 'message': 'invalid JSON'}})
+                    continue
+                self.executor.submit(self._dispatch, client, request)
+        except OSError: pass
+        finally:
+            with self._lock: self._clients.discard(client)
+            client.close()
+            conn.close()
+
+    def _dispatch(self, client, request):
+        request_id = request.get('id')
+        method = request.get('method')
+        params = request.get('params') or []
+        args, kwargs = (params, {}) if isinstance(params, list) else ([], params)
+        try:
+            if method not in self.METHODS: raise ValueError(f'Unknown method: {method}')
+            if method == 'ping': result = True
+            elif method == 'subscribe':
+                client.subscribed = True
+                result = True
+            elif method in self.SCHEDULED: result = self.bt_manager.run_async(method, *args).result()
+            else: result = getattr(self.bt_manager, self.METHODS[method])(*args, **kwargs)
+            response = {'id': request_id, 'result': encode(result)}
+        except Exception as e:
+            response = {'id': request_id, 'error': {'type': type(e).__name__, 'message': str(e)}}
+        client.send(response)
+
+    def _broadcast(self, event, address):
+        """Device listener; queues backend events for subscribed clients without blocking the signal thread."""
+        with self._lock: subscribers = [client for client in self._clients if client.subscribed]
+        for client in subscribers: client.send({'event': event, 'address': address})
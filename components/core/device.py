@@ -1,7 +1,14 @@
+from components.core.device_classifier import classify_device
+
 class BluetoothDevice:
+    """Immutable snapshot of a Bluetooth device as reported by the backend."""
+    FIELDS = ('address', 'name', 'paired', 'connected', 'auto_connect',
+              'device_class', 'custom_name', 'battery_level', 'appearance')
+    __slots__ = FIELDS
+
     def __init__(self, address:str, name:str, paired:bool=False, connected:bool=False,
                  auto_connect:bool=False, device_class:str=None, custom_name:str=None,
-                 battery_level:int=None):
+                 battery_level:int=None, appearance:int=None):
         """
         Initialize a Bluetooth device.
         
@@ -14,41 +21,56 @@ class BluetoothDevice:
             device_class (str): Bluetooth device class code.
             custom_name (str): User-defined custom name for device.
             battery_level (int): Battery level percentage or None if not available.
+            appearance (int): LE GAP Appearance value or None if not advertised.
         """
-        self.address = address
-        self.name = name if name else "Unknown Device"
-        self.paired = paired
-        self.connected = connected
-        self.auto_connect = auto_connect
-        self.device_class = device_class
-        self.custom_name = custom_name
-        self.battery_level = battery_level
+        set_field = object.__setattr__
+        set_field(self, 'address', address)
+        set_field(self, 'name', name if name else "Unknown Device")
+        set_field(self, 'paired', paired)
+        set_field(self, 'connected', connected)
+        set_field(self, 'auto_connect', auto_connect)
+        set_field(self, 'device_class', device_class)
+        set_field(self, 'custom_name', custom_name)
+        set_field(self, 'battery_level', battery_level)
+        set_field(self, 'appearance', appearance)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f'BluetoothDevice is immutable; use replace({name}=...)')
+
+    def __delattr__(self, name):
+        raise AttributeError('BluetoothDevice is immutable')
+
+    def replace(self, **changes) -> 'BluetoothDevice':
+        """Return a copy of this snapshot with the given fields changed."""
+        values = self.as_dict()
+        values.update(changes)
+        return BluetoothDevice(**values)
+
+    def as_dict(self) -> dict:
+        """Return the fields as a plain dict, e.g. for JSON; BluetoothDevice(**d) restores it."""
+        return {field: getattr(self, field) for field in self.FIELDS}
+
+    def diff(self, other:'BluetoothDevice') -> frozenset:
+        """Return the names of fields whose values differ from other."""
+        if other is None: return frozenset(self.FIELDS)
+        return frozenset(field for field in self.FIELDS if getattr(self, field) != getattr(other, field))
 
     def get_display_name(self) -> str:
         """Get the custom name if set, otherwise the device name."""
         return self.custom_name if self.custom_name else self.name
     
     def get_device_type(self) -> str:
-        """Determine the device type based on the name or device class."""
-        name_lower = self.name.lower()
-
-        if any(word in name_lower for word in ["headphone", "headset", "earphone", "earbud", "airpod"]):
-            return "headphones"
-        if any(word in name_lower for word in ["speaker", "sound", "audio"]):
-            return "speaker"
-        if any(word in name_lower for word in ["mouse", "mx", "trackpad"]):
-            return "mouse"
-        if any(word in name_lower for word in ["keyboard", "keychron", "magic keyboard"]):
-            return "keyboard"
-        if any(word in name_lower for word in ["controller", "gamepad", "playstation", "xbox", "joy-con"]):
-            return "controller"
-        if any(word in name_lower for word in ["phone", "iphone", "android", "pixel", "galaxy"]):
-            return "phone"
-            
-        return "generic"
+        """Determine the device type from the class of device, LE appearance or name."""
+        return classify_device(self.address, self.name, self.device_class, self.appearance)
 
     def __eq__(self, other) -> bool:
         """Check if two devices are equal based on their address."""
         if not isinstance(other, BluetoothDevice): return False
         return self.address == other.address
-    
\ No newline at end of file
+
+    def __hash__(self) -> int:
+        """Hash on the address, consistent with __eq__."""
+        return hash(self.address)
+
+    def __repr__(self) -> str:
+        return f'BluetoothDevice({", ".join(f"{field}={getattr(self, field)!r}" for field in self.FIELDS)})'
@@ -0,0 +1,80 @@
+import re
+import functools
+
+# Class of Device major classes (bits 8-12)
+COD_MAJOR_PHONE = 0x02
+COD_MAJOR_AUDIO_VIDEO = 0x04
+COD_MAJOR_PERIPHERAL = 0x05
+
+# Audio/Video minor classes (bits 2-7)
+COD_AV_HEADPHONES = {0x01, 0x02, 0x06}   # wearable headset, hands-free, headphones
+COD_AV_SPEAKER = {0x05, 0x07, 0x0A}      # loudspeaker, portable audio, HiFi audio
+
+# GAP Appearance values (category in bits 6-15, subcategory in bits 0-5)
+APPEARANCE_CATEGORY_PHONE = 0x001
+APPEARANCE_CATEGORY_HID = 0x00F
+APPEARANCE_CATEGORY_AUDIO_SINK = 0x021
+APPEARANCE_CATEGORY_WEARABLE_AUDIO = 0x025
+APPEARANCE_HID_TYPES = {0x01: "keyboard", 0x02: "mouse", 0x03: "controller", 0x04: "controller"}
+
+# Keyword fallback, in priority order; one compiled pattern matches them all in a single scan
+KEYWORDS = (
+    ("headphones", ("headphone", "headset", "earphone", "earbud", "airpod")),
+    ("speaker", ("speaker", "sound", "audio")),
+    ("mouse", ("mouse", "mx", "trackpad")),
+    ("keyboard", ("keyboard", "keychron", "magic keyboard")),
+    ("controller", ("controller", "gamepad", "playstation", "xbox", "joy-con")),
+    ("phone", ("phone", "iphone", "android", "pixel", "galaxy")),
+)
+KEYWORD_PATTERN = re.compile('|'.join(
+    f"(?P<{device_type}>{'|'.join(re.escape(word) for word in words)})" for device_type, words in KEYWORDS
+), re.IGNORECASE)
+KEYWORD_PRIORITY = {device_type: index for index, (device_type, _) in enumerate(KEYWORDS)}
+
+def type_from_class(device_class) -> str:
+    """Decode the major/minor Class of Device bitfields, or return None."""
+    if not device_class: return None
+    device_class = int(device_class)
+    major = (device_class >> 8) & 0x1F
+    minor = (device_class >> 2) & 0x3F
+
+    if major == COD_MAJOR_PHONE: return "phone"
+    if major == COD_MAJOR_AUDIO_VIDEO:
+        if minor in COD_AV_HEADPHONES: return "headphones"
+        if minor in COD_AV_SPEAKER: return "speaker"
+        return None
+    if major == COD_MAJOR_PERIPHERAL:
+        if (minor & 0x0F) in (0x01, 0x02): return "controller"   # joystick, gamepad
+        pointing = (minor >> 4) & 0x03
+        if pointing == 0x01 or pointing == 0x03: return "keyboard"
+        if pointing == 0x02: return "mouse"
+    return None
+
+def type_from_appearance(appearance) -> str:
+    """Decode the LE GAP Appearance value, or return None."""
+    if not appearance: return None
+    appearance = int(appearance)
+    category = appearance >> 6
+
+    if category == APPEARANCE_CATEGORY_PHONE: return "phone"
+    if category == APPEARANCE_CATEGORY_HID: return APPEARANCE_HID_TYPES.get(appearance & 0x3F)
+    if category == APPEARANCE_CATEGORY_WEARABLE_AUDIO: return "headphones"
+    if category == APPEARANCE_CATEGORY_AUDIO_SINK: return "speaker"
+    return None
+
+def type_from_name(name:str) -> str:
+    """Match the name against the keyword table, honouring its priority order."""
+    best = None
+    for match in KEYWORD_PATTERN.finditer(name or ""):
+        if best is None or KEYWORD_PRIORITY[match.lastgroup] < KEYWORD_PRIORITY[best]: best = match.lastgroup
+    return best
+
+@functools.lru_cache(maxsize=1024)
+def classify_device(address:str, name:str, device_class=None, appearance=None) -> str:
+    """Return the icon type for a device: CoD first, then Appearance, then name keywords."""
+    return (
+        type_from_class(device_class)
+        or type_from_appearance(appearance)
+        or type_from_name(name)
+        or "generic"
+    )
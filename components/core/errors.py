@@ -0,0 +1,56 @@
+import dbus
+
+class BluetoothError(Exception):
+    """Base class for errors reported by a Bluetooth backend."""
+    def __init__(self, message:str, dbus_name:str=None):
+        super().__init__(message)
+        self.dbus_name = dbus_name
+
+class BluetoothTimeoutError(BluetoothError):
+    """The operation did not complete before its deadline."""
+
+class DeviceNotFoundError(BluetoothError):
+    """BlueZ does not know the device."""
+
+class DeviceNotReadyError(BluetoothError):
+    """The adapter is powered off or not ready."""
+
+class OperationInProgressError(BluetoothError):
+    """Another operation on the device is still running."""
+
+class AuthenticationError(BluetoothError):
+    """Pairing or authentication with the device failed."""
+
+class AlreadyConnectedError(BluetoothError):
+    """The device is already connected."""
+
+class NotConnectedError(BluetoothError):
+    """The device is not connected."""
+
+class OperationCancelledError(BluetoothError):
+    """The operation was cancelled before it completed."""
+
+DBUS_ERROR_MAP = {
+    'org.bluez.Error.DoesNotExist': DeviceNotFoundError,
+    'org.freedesktop.DBus.Error.UnknownObject': DeviceNotFoundError,
+    'org.freedesktop.DBus.Error.UnknownMethod': DeviceNotFoundError,
+    'org.bluez.Error.NotReady': DeviceNotReadyError,
+    'org.bluez.Error.InProgress': OperationInProgressError,
+    'org.bluez.Error.AlreadyConnected': AlreadyConnectedError,
+    'org.bluez.Error.NotConnected': NotConnectedError,
+    'org.bluez.Error.AuthenticationFailed': AuthenticationError,
+    'org.bluez.Error.AuthenticationCanceled': AuthenticationError,
+    'org.bluez.Error.AuthenticationRejected': AuthenticationError,
+    'org.bluez.Error.AuthenticationTimeout': BluetoothTimeoutError,
+    'org.freedesktop.DBus.Error.NoReply': BluetoothTimeoutError,
+    'org.freedesktop.DBus.Error.Timeout': BluetoothTimeoutError,
+}
+
+def map_dbus_error(error:Exception) -> BluetoothError:
+    """Translate a DBusException into the matching BluetoothError subclass."""
+    if isinstance(error, BluetoothError): return error
+    if isinstance(error, dbus.exceptions.DBusException):
+        name = error.get_dbus_name()
+        message = error.get_dbus_message() or name or str(error)
+        return DBUS_ERROR_MAP.get(name, BluetoothError)(message, name)
+    return BluetoothError(str(error))
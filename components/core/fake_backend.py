@@ -0,0 +1,224 @@
+import time
+import random
+import logging
+import threading
+import concurrent.futures
+from components.core.bluetooth_backend import BluetoothBackend
+from components.core.device import BluetoothDevice
+from components.core.errors import BluetoothError, DeviceNotFoundError, DeviceNotReadyError
+from components.utils.constants import (
+    CRITICAL_BATTERY_THRESHOLD, DISCONNECT_ALL_MAX_PARALLEL, DISCONNECT_ALL_DEADLINE_S
+)
+
+logger = logging.getLogger(__name__)
+
+ADAPTER_PATH = '/org/bluez/hci0'
+
+class FakeBluetoothBackend(BluetoothBackend):
+    """Simulated BluetoothBackend for benchmarks and UI work without bluetoothd.
+
+    device_count paired devices are generated from seed, so runs with the
+    same arguments see the same devices. connected_ratio of them start
+    connected and battery_ratio of those report a battery level. Connects
+    and disconnects take connect_latency seconds and fail with probability
+    failure_rate; battery reads take battery_latency seconds unless
+    live_battery is set, in which case levels come from memory like
+    signal-delivered Battery1 properties. A scan adds discover_count unpaired
+    devices, announced to listeners as 'added' events.
+    """
+    # Headphones, mouse, keyboard, phone and speaker Class of Device values
+    DEVICE_CLASSES = (0x240404, 0x002580, 0x002540, 0x5a020c, 0x240414)
+
+    def __init__(self, config_manager=None, device_count:int=10, connected_ratio:float=0.5, battery_ratio:float=0.5,
+                 connect_latency:float=0.0, battery_latency:float=0.0, failure_rate:float=0.0,
+                 discover_count:int=10, live_battery:bool=False, seed:int=0):
+        self.config_manager = config_manager
+        self.connected_ratio = connected_ratio
+        self.battery_ratio = battery_ratio
+        self.connect_latency = connect_latency
+        self.battery_latency = battery_latency
+        self.failure_rate = failure_rate
+        self.discover_count = discover_count
+        self.live_battery = live_battery
+        self.powered = True
+        self.discovering = False
+        self._random = random.Random(seed)
+        self._lock = threading.RLock()
+        self._devices = {}
+        self._device_listeners = []
+        self._last_errors = {}
+        self._next_index = 0
+        self._stats = {'connects': 0, 'disconnects': 0, 'failures': 0, 'battery_reads': 0, 'scans': 0}
+        for _ in range(device_count): self._add_device(paired=True)
+
+    def _add_device(self, paired:bool):
+        """Create the next simulated device and return its address."""
+        index = self._next_index
+        self._next_index += 1
+        address = f'02:00:00:{(index >> 16) & 0xFF:02X}:{(index >> 8) & 0xFF:02X}:{index & 0xFF:02X}'
+        connected = paired and self._random.random() < self.connected_ratio
+        has_battery = self._random.random() < self.battery_ratio
+        self._devices[address] = {
+            'name': f'Fake Device {index}',
+            'paired': paired,
+            'connected': connected,
+            'device_class': self.DEVICE_CLASSES[index % len(self.DEVICE_CLASSES)],
+            'battery_level': self._random.randint(CRITICAL_BATTERY_THRESHOLD + 5, 100) if has_battery else None,
+        }
+        return address
+
+    @staticmethod
+    def device_path(address:str) -> str:
+        return f'{ADAPTER_PATH}/dev_{address.replace(":", "_")}'
+
+    def add_device_listener(self, callback):
+        if callback not in self._device_listeners: self._device_listeners.append(callback)
+
+    def remove_device_listener(self, callback):
+        if callback in self._device_listeners: self._device_listeners.remove(callback)
+
+    def _notify_listeners(self, event, address):
+        for callback in list(self._device_listeners):
+            try: callback(event, address)
+            except Exception: logger.exception('Error in device listener')
+
+    @property
+    def supports_device_events(self) -> bool:
+        return True
+
+    def has_live_battery(self, address):
+        with self._lock:
+            device = self._devices.get(address)
+            return self.live_battery and device is not None and device['battery_level'] is not None
+
+    def is_adapter_powered(self):
+        return self.powered
+
+    def get_stats(self) -> dict:
+        """Return counters of simulated operations."""
+        with self._lock: return dict(self._stats)
+
+    def _build_device(self, address, props, auto_connect_devices, renamed_devices):
+        battery_level = None
+        if props['connected'] and props['battery_level'] is not None:
+            battery_level = props['battery_level'] if self.live_battery else self.get_battery_level(self.device_path(address))
+        return BluetoothDevice(
+            address, props['name'], props['paired'], props['connected'], address in auto_connect_devices,
+            props['device_class'], renamed_devices.get(address), battery_level
+        )
+
+    def _config(self):
+        if self.config_manager is None: return set(), {}
+        return set(self.config_manager.get_auto_connect_devices()), self.config_manager.get_renamed_devices()
+
+    def get_devices(self):
+        auto_connect_devices, renamed_devices = self._config()
+        with self._lock: devices = [(address, dict(props)) for address, props in self._devices.items()]
+        return [self._build_device(address, props, auto_connect_devices, renamed_devices) for address, props in devices]
+
+    def get_device(self, address):
+        with self._lock:
+            props = self._devices.get(address)
+            if props is None: return None
+            props = dict(props)
+        return self._build_device(address, props, *self._config())
+
+    def get_connected_addresses(self):
+        with self._lock: return [address for address, props in self._devices.items() if props['connected']]
+
+    def set_connected(self, addresses, connected:bool=True):
+        """Force the connection state of addresses without latency or failures."""
+        with self._lock:
+            for address in addresses: self._devices[address]['connected'] = connected
+
+    def set_battery_level(self, address:str, level:int):
+        """Change a device's battery level and announce it like a Battery1 PropertiesChanged signal."""
+        with self._lock: self._devices[address]['battery_level'] = level
+        self._notify_listeners('changed', address)
+
+    def set_powered(self, powered:bool):
+        self.powered = powered
+        self._notify_listeners('adapter', ADAPTER_PATH)
+
+    def forget_discovered(self):
+        """Remove the unpaired devices earlier scans added."""
+        with self._lock:
+            removed = [address for address, props in self._devices.items() if not props['paired']]
+            for address in removed: del self._devices[address]
+        for address in removed: self._notify_listeners('removed', address)
+
+    def scan_devices(self):
+        return self.start_discovery()
+
+    def start_discovery(self, discovery_filter=None):
+        if not self.powered: return False
+        with self._lock:
+            if self.discovering: return True
+            self.discovering = True
+            self._stats['scans'] += 1
+            added = [self._add_device(paired=False) for _ in range(self.discover_count)]
+        self._notify_listeners('adapter', ADAPTER_PATH)
+        for address in added: self._notify_listeners('added', address)
+        return True
+
+    def stop_discovery(self):
+        with self._lock:
+            if not self.discovering: return False
+            self.discovering = False
+        self._notify_listeners('adapter', ADAPTER_PATH)
+        return True
+
+    def _change_connection(self, address, connected):
+        """Simulate a Connect or Disconnect call, including its latency and failure rate."""
+        self._last_errors.pop(address, None)
+        action = 'connect' if connected else 'disconnect'
+        try:
+            if not self.powered: raise DeviceNotReadyError('Bluetooth adapter is powered off')
+            with self._lock:
+                if address not in self._devices: raise DeviceNotFoundError(f'Unknown device {address}')
+                if self._devices[address]['connected'] == connected: return True
+                self._stats[f'{action}s'] += 1
+            if self.connect_latency: time.sleep(self.connect_latency)
+            if self.failure_rate and self._random.random() < self.failure_rate:
+                with self._lock: self._stats['failures'] += 1
+                raise BluetoothError(f'Simulated {action} failure', 'org.bluez.Error.Failed')
+            with self._lock:
+                self._devices[address]['connected'] = connected
+                if connected: self._devices[address]['paired'] = True
+        except BluetoothError as e:
+            self._last_errors[address] = e
+            logger.debug('Error in simulated %s of %s: %s', action, address, e)
+            return False
+        self._notify_listeners('changed', address)
+        return True
+
+    def connect_device(self, address):
+        return self._change_connection(address, True)
+
+    def disconnect_device(self, address):
+        return self._change_connection(address, False)
+
+    def get_last_error(self, address):
+        return self._last_errors.get(address)
+
+    def disconnect_all_devices(self, max_parallel=DISCONNECT_ALL_MAX_PARALLEL, deadline=DISCONNECT_ALL_DEADLINE_S):
+        """Disconnect every connected device concurrently, like LinuxBluetoothBackend."""
+        addresses = self.get_connected_addresses()
+        if not addresses: return {}
+
+        results = {address: False for address in addresses}
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=max(1, min(max_parallel, len(addresses))))
+        try:
+            futures = {executor.submit(self.disconnect_device, address): address for address in addresses}
+            done, _ = concurrent.futures.wait(futures, timeout=deadline)
+            for future in done: results[futures[future]] = bool(future.result())
+        finally: executor.shutdown(wait=False, cancel_futures=True)
+        return results
+
+    def get_battery_level(self, device_path):
+        address = device_path.split('/')[-1][4:].replace('_', ':')
+        if self.battery_latency: time.sleep(self.battery_latency)
+        with self._lock:
+            self._stats['battery_reads'] += 1
+            device = self._devices.get(address)
+            return device['battery_level'] if device is not None and device['connected'] else None
@@ -0,0 +1,219 @@
+import time
+import random
+import threading
+import logging
+from components.utils.constants import (
+    RECONNECT_BASE_DELAY_S, RECONNECT_MAX_DELAY_S, RECONNECT_MAX_ATTEMPTS, RECONNECT_POLL_S
+)
+
+logger = logging.getLogger(__name__)
+
+class ReconnectSupervisor:
+    """Keeps the auto-connect devices connected.
+
+    Devices come from ConfigManager.get_auto_connect_devices() in priority
+    order. The supervisor listens for device and adapter events instead of
+    polling: when a device drops, it is retried at once and then with
+    jittered exponential backoff; when an adapter powers on, every device is
+    retried with its backoff reset. Attempts go through the manager's
+    scheduler, so independent devices reconnect in parallel. After
+    max_attempts failures a device is 'failed' and only retried every
+    max_delay, or at once when it is added or changes again. Devices the
+    user disconnected on purpose are held until they are connected again.
+    Event handling and device lookups run on the supervisor thread, never
+    on the thread that delivers the event.
+
+    The per-device state is a dict with 'state' (connected, waiting,
+    connecting, failed, held or no_adapter), 'attempts', 'retry_in' and
+    'last_error'; listeners receive (address, state) on every change.
+    """
+    def __init__(self, bt_manager, base_delay:float=RECONNECT_BASE_DELAY_S, max_delay:float=RECONNECT_MAX_DELAY_S,
+                 max_attempts:int=RECONNECT_MAX_ATTEMPTS, poll_interval:float=RECONNECT_POLL_S):
+        self.bt_manager = bt_manager
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_attempts = max_attempts
+        self.poll_interval = poll_interval
+        self._states = {}
+        self._due = {}
+        self._held = set()
+        # Work queued by events and callers for the supervisor thread
+        self._pending_checks = {}
+        self._pending_check_all = None
+        self._adapter_changed = False
+        self._listeners = []
+        self._cond = threading.Condition()
+        self._running = False
+        self._thread = None
+        self._adapter_powered = None
+
+    def start(self):
+        """Subscribe to device events and try every auto-connect device that is not connected."""
+        if self._running: return
+        self._running = True
+        self.bt_manager.add_device_listener(self._on_device_event)
+        self._thread = threading.Thread(target=self._run, name='bluesync-reconnect', daemon=True)
+        self._thread.start()
+        self.request_check()
+
+    def stop(self):
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+        self.bt_manager.remove_device_listener(self._on_device_event)
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    def add_listener(self, callback):
+        """Register callback(address, state) for retry state changes."""
+        self._listeners.append(callback)
+
+    def get_state(self, address:str=None):
+        """Return one device's retry state, or all of them keyed by address."""
+        with self._cond:
+            if address is not None: return self._public_state(address)
+            return {address: self._public_state(address) for address in self._states}
+
+    def _public_state(self, address):
+        state = self._states.get(address)
+        if state is None: return None
+        state = dict(state)
+        due = self._due.get(address)
+        state['retry_in'] = max(0.0, due - time.monotonic()) if due is not None else None
+        return state
+
+    def hold(self, address:str):
+        """Stop reconnecting address, e.g. because the user disconnected it."""
+        with self._cond:
+            self._held.add(address)
+            self._due.pop(address, None)
+            if address in self._states: self._set_state(address, 'held')
+
+    def release(self, address:str):
+        """Allow address to be reconnected again."""
+        with self._cond: self._held.discard(address)
+
+    def _backoff(self, attempts:int) -> float:
+        """Exponential delay for the given attempt count with equal jitter."""
+        delay = min(self.max_delay, self.base_delay * 2 ** max(0, attempts - 1))
+        return delay / 2 + random.uniform(0, delay / 2)
+
+    def _set_state(self, address, state, **changes):
+        entry = self._states.setdefault(address, {'state': None, 'attempts': 0, 'last_error': None})
+        changed = entry['state'] != state or any(entry.get(key) != value for key, value in changes.items())
+        entry['state'] = state
+        entry.update(changes)
+        if changed:
+            snapshot = self._public_state(address)
+            for callback in list(self._listeners):
+                try: callback(address, snapshot)
+                except Exception: logger.exception('Error in reconnect listener')
+
+    def request_check(self, reset:bool=False, rearm:bool=False):
+        """Have the supervisor thread run check_all() soon; safe to call from any thread."""
+        with self._cond:
+            pending = self._pending_check_all or (False, False)
+            self._pending_check_all = (pending[0] or reset, pending[1] or rearm)
+            self._cond.notify_all()
+
+    def check_all(self, reset:bool=False, rearm:bool=False):
+        """Re-read the auto-connect list and the state of every device on it."""
+        addresses = self.bt_manager.config_manager.get_auto_connect_devices()
+        with self._cond:
+            for address in [a for a in self._states if a not in addresses]:
+                self._states.pop(address)
+                self._due.pop(address, None)
+        powered = self._adapter_powered = self.bt_manager.is_adapter_powered()
+        for address in addresses: self._check(address, reset, powered, rearm)
+
+    def _check(self, address, reset=False, powered=None, rearm=False):
+        """Update address from its current connection state; rearm also retries a 'failed' device."""
+        device = self.bt_manager.get_device(address)
+        if powered is None: powered = self.bt_manager.is_adapter_powered()
+        with self._cond:
+            previous = self._states.get(address, {}).get('state')
+            if device is not None and device.connected:
+                self._held.discard(address)
+                self._due.pop(address, None)
+                self._set_state(address, 'connected', attempts=0, last_error=None)
+            elif address in self._held: self._set_state(address, 'held')
+            elif not powered:
+                self._due.pop(address, None)
+                self._set_state(address, 'no_adapter')
+            elif previous == 'connecting': return
+            elif reset or previous in (None, 'connected', 'held', 'no_adapter') or (rearm and previous == 'failed'):
+                self._due[address] = time.monotonic()
+                changes = {'attempts': 0} if reset or previous in ('connected', 'failed') else {}
+                self._set_state(address, 'waiting', **changes)
+                self._cond.notify_all()
+
+    def _on_device_event(self, event, address):
+        """Backend listener; queues the event for the supervisor thread so the signal thread never blocks."""
+        if event == 'reset': return self.request_check(rearm=True)
+        with self._cond:
+            if event == 'adapter': self._adapter_changed = True
+            elif address in self._states and event in ('added', 'changed', 'removed'):
+                self._pending_checks[address] = self._pending_checks.get(address, False) or event != 'removed'
+            else: return
+            self._cond.notify_all()
+
+    def _on_adapter_changed(self):
+        """Retry everything, with backoff reset, when an adapter powers on; mark devices when it powers off."""
+        powered = self.bt_manager.is_adapter_powered()
+        if powered == self._adapter_powered: return
+        self._adapter_powered = powered
+        self.check_all(reset=powered)
+
+    def _run(self):
+        last_poll = time.monotonic()
+        while True:
+            with self._cond:
+                if not self._running: return
+                checks, self._pending_checks = self._pending_checks, {}
+                check_all, self._pending_check_all = self._pending_check_all, None
+                adapter_changed, self._adapter_changed = self._adapter_changed, False
+                queued = bool(checks) or check_all is not None or adapter_changed
+                now = time.monotonic()
+                order = {address: index for index, address in enumerate(self._states)}
+                due = sorted((a for a, at in self._due.items() if at <= now), key=lambda a: order.get(a, len(order)))
+                for address in due:
+                    self._due.pop(address)
+                    self._set_state(address, 'connecting')
+                if not due and not queued:
+                    wait = min([at - now for at in self._due.values()], default=None)
+                    if not self.bt_manager.supports_device_events:
+                        wait = min(wait if wait is not None else self.poll_interval, self.poll_interval)
+                    self._cond.wait(wait)
+
+            try:
+                if adapter_changed: self._on_adapter_changed()
+                if check_all is not None: self.check_all(*check_all)
+                for address, rearm in checks.items(): self._check(address, rearm=rearm)
+            except Exception: logger.exception('Error checking auto-connect devices')
+            for address in due:
+                self.bt_manager.run_async('connect_device', address).add_done_callback(
+                    lambda future, address=address: self._on_attempt_done(address, future))
+            if not self.bt_manager.supports_device_events and time.monotonic() - last_poll >= self.poll_interval:
+                last_poll = time.monotonic()
+                self.check_all()
+
+    def _on_attempt_done(self, address, future):
+        if future.cancelled(): success, error = False, 'cancelled'
+        elif future.exception() is not None: success, error = False, str(future.exception())
+        else: success, error = bool(future.result()), None
+        if not success: error = str(self.bt_manager.get_last_error(address) or error or 'failed')
+        with self._cond:
+            if address not in self._states or address in self._held: return
+            if success:
+                self._set_state(address, 'connected', attempts=0, last_error=None)
+                return
+            attempts = self._states[address]['attempts'] + 1
+            if attempts >= self.max_attempts:
+                self._due[address] = time.monotonic() + self.max_delay
+                self._set_state(address, 'failed', attempts=attempts, last_error=error)
+            else:
+                self._due[address] = time.monotonic() + self._backoff(attempts)
+                self._set_state(address, 'waiting', attempts=attempts, last_error=error)
+            self._cond.notify_all()
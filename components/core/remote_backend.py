@@ -0,0 +1,206 @@
+import json
+import socket
+import itertools
+import threading
+import concurrent.futures
+import logging
+from components.core import errors
+from components.core.bluetooth_backend import BluetoothBackend
+from components.core.device import BluetoothDevice
+from components.utils.metrics import metrics
+from components.utils.constants import (
+    DAEMON_SOCKET_PATH, DAEMON_CALL_TIMEOUT_S, DISCONNECT_ALL_MAX_PARALLEL, DISCONNECT_ALL_DEADLINE_S
+)
+
+logger = logging.getLogger(__name__)
+
+class RemoteBatteryHistory:
+    """Battery history queries answered by the daemon, which owns the history store."""
+    def __init__(self, backend):
+        self.backend = backend
+
+    def record(self, address, level, timestamp=None) -> bool:
+        return False
+
+    def get_history(self, address, since=None) -> list:
+        return [tuple(sample) for sample in self.backend.request('get_battery_history', address, since)]
+
+    def get_drain_rate(self, address):
+        return self.backend.request('get_drain_rate', address)
+
+    def estimate_time_to_empty(self, address):
+        return self.backend.request('estimate_time_to_empty', address)
+
+    def close(self):
+        pass
+
+class RemoteBluetoothBackend(BluetoothBackend):
+    """BluetoothBackend that forwards every call to a running `main.py --daemon`.
+
+    One Unix socket connection carries all requests; a reader thread matches
+    replies to requests by id, so calls from several threads can be in
+    flight at once. Device events pushed by the daemon are delivered to the
+    registered listeners on a separate thread, so listeners may call back
+    into the daemon. If the daemon goes away, pending calls fail with
+    BluetoothError, listeners get a 'reset' event, and the next call
+    reconnects.
+    """
+    is_remote = True
+
+    def __init__(self, config_manager=None, socket_path:str=DAEMON_SOCKET_PATH):
+        self.config_manager = config_manager
+        self.socket_path = socket_path
+        self.battery_history = RemoteBatteryHistory(self)
+        self._sock = None
+        self._lock = threading.RLock()
+        self._pending = {}
+        self._ids = itertools.count(1)
+        self._device_listeners = []
+        self._events = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix='bluesync-daemon-events')
+        self._connect()
+
+    @staticmethod
+    def daemon_running(socket_path:str=DAEMON_SOCKET_PATH) -> bool:
+        """Whether a daemon is accepting connections on socket_path."""
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(socket_path)
+            return True
+        except OSError: return False
+        finally: probe.close()
+
+    def _connect(self):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.connect(self.socket_path)
+        self._sock = sock
+        threading.Thread(target=self._read_loop, args=(sock,), name='bluesync-daemon-client', daemon=True).start()
+        if self._device_listeners: self._send('subscribe')
+
+    def _read_loop(self, sock):
+        try:
+            for line in sock.makefile('r'):
+                message = json.loads(line)
+                if 'event' in message:
+                    self._events.submit(self._notify_listeners, message['event'], message.get('address'))
+                    continue
+                with self._lock: future = self._pending.pop(message.get('id'), None)
+                if future is None: continue
+                if 'error' in message: future.set_exception(self._make_error(message['error']))
+                else: future.set_result(message.get('result'))
+        except (OSError, ValueError) as e: logger.warning('Error reading from BlueSync daemon: %s', e)
+        finally:
+            with self._lock:
+                if self._sock is sock: self._sock = None
+                pending, self._pending = self._pending, {}
+            for future in pending.values():
+                future.set_exception(errors.BluetoothError('BlueSync daemon connection closed'))
+            sock.close()
+            try: self._events.submit(self._notify_listeners, 'reset', None)
+            except RuntimeError: pass
+
+    @staticmethod
+    def _make_error(error:dict) -> Exception:
+        """Rebuild the daemon's exception, keeping BluetoothError subclasses."""
+        error_class = getattr(errors, error.get('type', ''), None)
+        if not (isinstance(error_class, type) and issubclass(error_class, errors.BluetoothError)):
+            error_class = errors.BluetoothError
+        return error_class(error.get('message', ''))
+
+    def _send(self, method, *params, **kwargs) -> concurrent.futures.Future:
+        future = concurrent.futures.Future()
+        with self._lock:
+            request_id = next(self._ids)
+            self._pending[request_id] = future
+            message = {'id': request_id, 'method': method, 'params': kwargs if kwargs else list(params)}
+            try:
+                if self._sock is None: self._connect()
+                self._sock.sendall((json.dumps(message) + '\n').encode())
+            except OSError as e:
+                self._pending.pop(request_id, None)
+                future.set_exception(errors.BluetoothError(f'BlueSync daemon unavailable: {e}'))
+        return future
+
+    def request(self, method:str, *params, timeout:float=DAEMON_CALL_TIMEOUT_S, **kwargs):
+        """Call method on the daemon and return its result, raising BluetoothError on failure."""
+        with metrics.timer('daemon_request', method=method):
+            try: return self._send(method, *params, **kwargs).result(timeout)
+            except concurrent.futures.TimeoutError:
+                raise errors.BluetoothTimeoutError(f'BlueSync daemon did not answer {method} within {timeout}s')
+
+    def add_device_listener(self, callback):
+        first = not self._device_listeners
+        if callback not in self._device_listeners: self._device_listeners.append(callback)
+        if first: self._send('subscribe')
+
+    def remove_device_listener(self, callback):
+        if callback in self._device_listeners: self._device_listeners.remove(callback)
+
+    def _notify_listeners(self, event, address):
+        for callback in list(self._device_listeners):
+            try: callback(event, address)
+            except Exception: logger.exception('Error in device listener')
+
+    @property
+    def supports_device_events(self) -> bool:
+        return True
+
+    def get_devices(self):
+        try: return [BluetoothDevice(**device) for device in self.request('get_devices')]
+        except errors.BluetoothError as e:
+            logger.error('Error getting devices: %s', e)
+            return []
+
+    def get_device(self, address):
+        device = self.request('get_device', address)
+        return BluetoothDevice(**device) if device else None
+
+    def get_connected_addresses(self):
+        return self.request('get_connected_addresses')
+
+    def scan_devices(self):
+        return self.request('scan_devices')
+
+    def start_discovery(self, discovery_filter=None):
+        return self.request('start_discovery', discovery_filter)
+
+    def stop_discovery(self):
+        return self.request('stop_discovery')
+
+    def connect_device(self, address):
+        return self.request('connect_device', address)
+
+    def disconnect_device(self, address):
+        return self.request('disconnect_device', address)
+
+    def disconnect_all_devices(self, max_parallel=DISCONNECT_ALL_MAX_PARALLEL, deadline=DISCONNECT_ALL_DEADLINE_S):
+        return self.request('disconnect_all_devices', max_parallel=max_parallel, deadline=deadline)
+
+    def get_battery_level(self, device_path):
+        return self.request('get_battery_level', device_path)
+
+    def get_last_error(self, address):
+        return self.request('get_last_error', address)
+
+    def has_live_battery(self, address):
+        return self.request('has_live_battery', address)
+
+    def get_battery_cache_stats(self):
+        return self.request('get_battery_cache_stats')
+
+    def is_adapter_powered(self):
+        return self.request('is_adapter_powered')
+
+    def get_metrics(self):
+        return self.request('get_metrics')
+
+    def set_auto_connect(self, address, auto_connect=True):
+        """Change the daemon's auto-connect list, which its reconnect supervisor follows."""
+        return self.request('set_auto_connect', address, auto_connect)
+
+    def rename_device(self, address, name):
+        return self.request('rename_device', address, name)
+
+    def close(self):
+        with self._lock: sock, self._sock = self._sock, None
+        if sock is not None: sock.close()
+        self._events.shutdown(wait=False)
@@ -0,0 +1,143 @@
+import time
+import threading
+import collections
+import concurrent.futures
+
+class _Operation:
+    __slots__ = ('kind', 'func', 'args', 'future', 'submitted_at')
+
+    def __init__(self, kind, func, args):
+        self.kind = kind
+        self.func = func
+        self.args = args
+        self.future = concurrent.futures.Future()
+        self.submitted_at = time.monotonic()
+
+class OperationScheduler:
+    """Runs Bluetooth operations on a bounded worker pool.
+
+    Operations sharing a key (normally a device address) run one at a time
+    in submission order. A pending operation identical to a new one absorbs
+    it, and a new operation cancels pending operations of the kinds it
+    supersedes. Functions may return a concurrent.futures.Future, in which
+    case the slot is held until that future completes but no worker thread
+    waits on it.
+    """
+    def __init__(self, max_workers:int=4):
+        self.max_workers = max_workers
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='bluesync-op')
+        self._lock = threading.Lock()
+        self._queues = {}
+        self._active = set()
+        self._ready = collections.deque()
+        self._running = 0
+        self._stats = {
+            'submitted': 0, 'coalesced': 0, 'cancelled': 0, 'completed': 0,
+            'max_queue_depth': 0, 'total_wait_s': 0.0, 'max_wait_s': 0.0
+        }
+
+    def submit(self, key, kind:str, func, *args, supersedes=(), on_created=None) -> concurrent.futures.Future:
+        """Queue func(*args) under key and return a Future for its result.
+
+        on_created(future) is called only when a new operation is queued, not
+        when the request is coalesced into a pending one.
+        """
+        with self._lock:
+            self._stats['submitted'] += 1
+            queue = self._queues.setdefault(key, collections.deque())
+
+            for pending in queue:
+                if pending.kind == kind and pending.args == args:
+                    self._stats['coalesced'] += 1
+                    return pending.future
+
+            for pending in [op for op in queue if op.kind in supersedes]:
+                queue.remove(pending)
+                pending.future.cancel()
+                self._stats['cancelled'] += 1
+
+            operation = _Operation(kind, func, args)
+            queue.append(operation)
+            if key not in self._active and key not in self._ready: self._ready.append(key)
+            self._stats['max_queue_depth'] = max(self._stats['max_queue_depth'], self._queue_depth_locked())
+            self._dispatch_locked()
+        if on_created is not None: on_created(operation.future)
+        return operation.future
+
+    def cancel_pending(self, key, kinds=None) -> int:
+        """Cancel queued (not running) operations for key, optionally only of the given kinds."""
+        with self._lock:
+            queue = self._queues.get(key)
+            if not queue: return 0
+            cancelled = [op for op in queue if kinds is None or op.kind in kinds]
+            for operation in cancelled:
+                queue.remove(operation)
+                operation.future.cancel()
+            self._stats['cancelled'] += len(cancelled)
+            return len(cancelled)
+
+    def get_stats(self) -> dict:
+        """Return counters plus current queue depth and wait times in milliseconds."""
+        with self._lock:
+            stats = dict(self._stats)
+            stats['queue_depth'] = self._queue_depth_locked()
+            stats['running'] = self._running
+        started = stats['completed'] + stats['running']
+        stats['avg_wait_ms'] = (stats.pop('total_wait_s') / started * 1000) if started else 0.0
+        stats['max_wait_ms'] = stats.pop('max_wait_s') * 1000
+        return stats
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _queue_depth_locked(self):
+        return sum(len(queue) for queue in self._queues.values())
+
+    def _dispatch_locked(self):
+        while self._running < self.max_workers and self._ready:
+            key = self._ready.popleft()
+            queue = self._queues.get(key)
+            if not queue:
+                self._queues.pop(key, None)
+                continue
+            operation = queue.popleft()
+            self._active.add(key)
+            self._running += 1
+            self._executor.submit(self._run, key, operation)
+
+    def _run(self, key, operation):
+        wait = time.monotonic() - operation.submitted_at
+        with self._lock:
+            self._stats['total_wait_s'] += wait
+            self._stats['max_wait_s'] = max(self._stats['max_wait_s'], wait)
+
+        if not operation.future.set_running_or_notify_cancel():
+            self._finish(key)
+            return
+
+        try: result = operation.func(*operation.args)
+        except Exception as e:
+            operation.future.set_exception(e)
+            self._finish(key)
+            return
+
+        if isinstance(result, concurrent.futures.Future):
+            result.add_done_callback(lambda inner: self._complete_from(operation, inner, key))
+        else:
+            operation.future.set_result(result)
+            self._finish(key)
+
+    def _complete_from(self, operation, inner, key):
+        if inner.cancelled(): operation.future.set_exception(concurrent.futures.CancelledError())
+        elif inner.exception() is not None: operation.future.set_exception(inner.exception())
+        else: operation.future.set_result(inner.result())
+        self._finish(key)
+
+    def _finish(self, key):
+        with self._lock:
+            self._running -= 1
+            self._stats['completed'] += 1
+            self._active.discard(key)
+            if self._queues.get(key): self._ready.append(key)
+            else: self._queues.pop(key, None)
+            self._dispatch_locked()
@@ -0,0 +1,112 @@
+import re
+import threading
+import logging
+import dbus
+
+logger = logging.getLogger(__name__)
+
+UPOWER_SERVICE = 'org.freedesktop.UPower'
+UPOWER_PATH = '/org/freedesktop/UPower'
+UPOWER_DEVICE_IFACE = 'org.freedesktop.UPower.Device'
+
+ADDRESS_PATTERN = re.compile(r'([0-9A-Fa-f]{2}[:_]){5}[0-9A-Fa-f]{2}')
+
+def normalize_address(text:str) -> str:
+    """Return the first Bluetooth address in text as AA:BB:CC:DD:EE:FF, or None."""
+    match = ADDRESS_PATTERN.search(text)
+    return match.group(0).replace('_', ':').upper() if match else None
+
+class UPowerIndex:
+    """Maps Bluetooth addresses to UPower device object paths.
+
+    The index is built on first use with one EnumerateDevices call and, when
+    signals are available, kept current from UPower's DeviceAdded and
+    DeviceRemoved signals. Without signals a lookup miss triggers a rebuild.
+    """
+    def __init__(self, bus):
+        self.bus = bus
+        self.live = False
+        self._paths = {}
+        self._addresses = {}
+        self._built = False
+        self._lock = threading.RLock()
+
+    def subscribe(self):
+        """Track DeviceAdded/DeviceRemoved. Needs a running main loop on the bus."""
+        try:
+            self.bus.add_signal_receiver(self._on_device_added, dbus_interface=UPOWER_SERVICE,
+                                         signal_name='DeviceAdded', bus_name=UPOWER_SERVICE)
+            self.bus.add_signal_receiver(self._on_device_removed, dbus_interface=UPOWER_SERVICE,
+                                         signal_name='DeviceRemoved', bus_name=UPOWER_SERVICE)
+            self.bus.watch_name_owner(UPOWER_SERVICE, self._on_owner_changed)
+            self.live = True
+        except Exception as e:
+            logger.warning('Error subscribing to UPower signals: %s', e)
+
+    def get_percentage(self, address:str) -> int:
+        """Return the UPower battery percentage for address, or None."""
+        path = self.get_path(address)
+        if path is None and not self.live and self.rebuild(): path = self.get_path(address)
+        if path is None: return None
+
+        try:
+            obj = self.bus.get_object(UPOWER_SERVICE, path, introspect=False)
+            props = dbus.Interface(obj, 'org.freedesktop.DBus.Properties').GetAll(UPOWER_DEVICE_IFACE)
+        except dbus.exceptions.DBusException:
+            self._forget_path(path)
+            return None
+        if not bool(props.get('IsPresent', True)) or 'Percentage' not in props: return None
+        return int(props['Percentage'])
+
+    def get_path(self, address:str) -> str:
+        """Return the UPower object path indexed for address, building the index on first use."""
+        key = normalize_address(address)
+        if key is None: return None
+        with self._lock:
+            if not self._built: self.rebuild()
+            return self._paths.get(key)
+
+    def rebuild(self) -> bool:
+        """Re-enumerate UPower devices. Returns False if UPower is unavailable."""
+        try:
+            upower = dbus.Interface(self.bus.get_object(UPOWER_SERVICE, UPOWER_PATH, introspect=False), UPOWER_SERVICE)
+            device_paths = upower.EnumerateDevices()
+        except dbus.exceptions.DBusException as e:
+            logger.warning('Error enumerating UPower devices: %s', e)
+            return False
+
+        with self._lock:
+            self._paths.clear()
+            self._addresses.clear()
+            for path in device_paths: self._index_path(str(path))
+            self._built = True
+        return True
+
+    def _index_path(self, path):
+        try:
+            obj = self.bus.get_object(UPOWER_SERVICE, path, introspect=False)
+            native_path = dbus.Interface(obj, 'org.freedesktop.DBus.Properties').Get(UPOWER_DEVICE_IFACE, 'NativePath')
+        except dbus.exceptions.DBusException: return
+
+        address = normalize_address(str(native_path))
+        if address is None: return
+        with self._lock:
+            self._paths[address] = path
+            self._addresses[path] = address
+
+    def _forget_path(self, path):
+        with self._lock:
+            address = self._addresses.pop(path, None)
+            if address is not None and self._paths.get(address) == path: del self._paths[address]
+
+    def _on_device_added(self, path):
+        if self._built: self._index_path(str(path))
+
+    def _on_device_removed(self, path):
+        self._forget_path(str(path))
+
+    def _on_owner_changed(self, owner):
+        with self._lock:
+            self._paths.clear()
+            self._addresses.clear()
+            self._built = False
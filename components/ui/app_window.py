@@ -1,37 +1,102 @@
-import time
 import threading
+import concurrent.futures
 import customtkinter as ctk
-from components.ui.device_card import DeviceCard
-from components.ui.tray_icon import TrayIconManager
+from components.core.battery_poller import BatteryPollScheduler
+from components.ui.ui_queue import UIUpdateQueue
+from components.utils.notifications import NotificationManager
+from components.utils.startup_profile import StartupProfile
+from components.utils.metrics import metrics
 from components.utils.constants import (
     PADDING, CORNER_RADIUS, BUTTON_COLOR, SCANNING_COLOR,
-    BATTERY_CHECK_INTERVAL_MS
+    BATTERY_CHECK_INTERVAL_MS, SCAN_DURATION_MS, SCAN_POLL_INTERVAL_MS,
+    UI_FRAME_MS, UI_FRAME_BUDGET_MS, DEVICE_LIST_MODE, VIRTUAL_LIST_THRESHOLD,
+    CARD_RENDERER
 )
 
 class BluetoothManagerApp(ctk.CTk):
-    """Main application window for Bluetooth Manager"""
-    def __init__(self, bluetooth_manager):
+    """Main application window for Bluetooth Manager.
+
+    bluetooth_manager may be a BluetoothManager or a Future that resolves to
+    one. The window paints first; the tray icon, icon decoding and the
+    backend start on background threads, and the first device fetch runs as
+    soon as the backend is ready. Card widgets, PIL and pystray are imported
+    on first use. With tray=False no tray icon is created.
+    """
+    def __init__(self, bluetooth_manager, startup_profile=None, tray:bool=True):
         super().__init__()
-        self.bt_manager = bluetooth_manager
+        self.startup_profile = startup_profile or StartupProfile()
+        self.bt_manager = None
+        self.tray_icon = None
+        self._first_devices_shown = False
         self.devices = []
+        self.device_cards = {}
+        self.no_devices_label = None
+        self.virtual_list = None
+        self.last_refresh_stats = {'created': 0, 'destroyed': 0, 'updated': 0, 'moved': 0}
         self.scanning = False
         self.exit_app = False
         self.battery_check_job = None
+        self.battery_poller = None
+        self.refresh_job = None
+        self.scan_job = None
+        self.debug_panel = None
+        self._pending_discovered = set()
+        self._pending_discovered_lock = threading.Lock()
+        self.ui_queue = UIUpdateQueue(self, UI_FRAME_MS, UI_FRAME_BUDGET_MS)
         
         self.title("Bluetooth Manager")
         self.geometry("700x600")
         self.minsize(600, 450)
         self._create_ui()
         self.protocol("WM_DELETE_WINDOW", self.on_close)
+        self.bind("<F12>", lambda event: self.show_debug_panel())
+        self.ui_queue.start()
+        self.after_idle(self.startup_profile.mark, 'first_paint')
+        
+        for widget in (self.scan_button, self.refresh_button, self.save_profile_button, self.profile_menu):
+            widget.configure(state="disabled")
+        self.update_status("Connecting to Bluetooth...")
+        if tray: threading.Thread(target=self._start_tray, name='tray-startup', daemon=True).start()
+        threading.Thread(target=self._preload_icons, name='icon-preload', daemon=True).start()
+        
+        if not isinstance(bluetooth_manager, concurrent.futures.Future):
+            ready = concurrent.futures.Future()
+            ready.set_result(bluetooth_manager)
+            bluetooth_manager = ready
+        bluetooth_manager.add_done_callback(lambda future: self.ui_queue.post('backend_ready', self._on_backend_ready, future))
+    
+    def _start_tray(self):
+        with self.startup_profile.span('tray'):
+            from components.ui.tray_icon import TrayIconManager
+            # pystray calls these on its own thread; window changes go through the UI queue
+            self.tray_icon = TrayIconManager(
+                lambda: self.ui_queue.post('show_window', self.show_window),
+                lambda: self.ui_queue.post('quit', self.quit_app),
+                self.quit_and_close_connections,
+                self.get_profile_names,
+                self.apply_profile
+            )
+            self.tray_icon.run()
+    
+    def _preload_icons(self):
+        with self.startup_profile.span('icons'):
+            from components.ui.icons import IconFactory
+            IconFactory.preload()
+    
+    def _on_backend_ready(self, future):
+        """Finish startup on the Tk thread once the BluetoothManager exists"""
+        if future.exception() is not None:
+            self.update_status(f"Bluetooth unavailable: {future.exception()}")
+            return
         
-        self.tray_icon = TrayIconManager(
-            self.show_window,
-            self.quit_app,
-            self.quit_and_close_connections
-        )
-        self.tray_icon.run()
+        self.bt_manager = future.result()
+        # Drain rates are fetched with each poll on a worker; the history may live in the daemon
+        self.battery_poller = BatteryPollScheduler()
+        for widget in (self.scan_button, self.refresh_button, self.save_profile_button, self.profile_menu):
+            widget.configure(state="normal")
+        self._update_profile_menu()
         
-        self.refresh_devices()
+        self.bt_manager.add_device_listener(self._on_battery_event)
         self.try_auto_connect()
         self.start_battery_check_timer()
     
@@ -87,6 +152,27 @@ class BluetoothManagerApp(ctk.CTk):
             height=36
         )
         self.refresh_button.pack(side="left")
+        
+        self.save_profile_button = ctk.CTkButton(
+            self.button_frame,
+            text="Save Profile",
+            command=self.save_profile,
+            fg_color=BUTTON_COLOR,
+            corner_radius=CORNER_RADIUS,
+            height=36,
+            width=110
+        )
+        self.save_profile_button.pack(side="right")
+        
+        self.profile_menu = ctk.CTkOptionMenu(
+            self.button_frame,
+            values=["No profiles"],
+            command=self.apply_profile,
+            height=36,
+            width=140
+        )
+        self.profile_menu.pack(side="right", padx=(0, PADDING))
+        self.profile_menu.set("Profiles")
     
     def _create_devices_section(self):
         """Create the devices section with devices list"""
@@ -124,58 +210,121 @@ class BluetoothManagerApp(ctk.CTk):
         self.check_battery_levels()
         
     def check_battery_levels(self):
-        """Periodically check battery levels for connected devices"""
-        if self.battery_check_job: self.after_cancel(self.battery_check_job)
+        """Poll the batteries that are due and sleep until the next one is.
 
-        if self.winfo_viewable(): self.update_battery_levels()
+        Runs whether or not the window is visible so low battery alerts still
+        fire from the tray. Devices whose battery arrives through live
+        property changes are not polled; asking the backend which those are
+        may be a daemon round trip, so it happens on a worker thread.
+        """
+        if self.battery_check_job: self.after_cancel(self.battery_check_job)
+        connected = [d.address for d in self.devices if d.connected]
+        
+        def find_polled():
+            try: polled = [address for address in connected if not self.bt_manager.has_live_battery(address)]
+            except Exception: polled = connected
+            self.ui_queue.post('battery_check', self._poll_due_batteries, polled)
         
-        self.battery_check_job = self.after(BATTERY_CHECK_INTERVAL_MS, self.check_battery_levels)
+        threading.Thread(target=find_polled, daemon=True).start()
     
-    def update_battery_levels(self):
-        """Refresh battery levels for connected devices"""
-        updated_devices = self.bt_manager.get_devices()
-        device_widgets = [w for w in self.devices_frame.winfo_children() if isinstance(w, DeviceCard)]
+    def _poll_due_batteries(self, addresses):
+        self.battery_poller.sync(addresses)
+        for address in self.battery_poller.due(): self.poll_battery(address)
         
-        for widget in device_widgets:
-            for device in updated_devices:
-                if widget.device.address == device.address and device.connected:
-                    if device.battery_level is not None:
-                        widget.device.battery_level = device.battery_level
-                        widget.update_battery_display(device.battery_level)
+        delay = self.battery_poller.next_delay()
+        delay_ms = BATTERY_CHECK_INTERVAL_MS if delay is None else min(int(delay * 1000) + 1, BATTERY_CHECK_INTERVAL_MS)
+        if self.battery_check_job: self.after_cancel(self.battery_check_job)
+        self.battery_check_job = self.after(delay_ms, self.check_battery_levels)
+    
+    def poll_battery(self, address):
+        """Read one device's battery and drain rate in the background and schedule its next poll"""
+        def apply(device, drain_rate):
+            self.battery_poller.reschedule(address, device.battery_level if device else None, drain_rate=drain_rate)
+            card = self.device_cards.get(address)
+            if device and card and device.connected and device.battery_level is not None:
+                self._replace_device(card.device.replace(battery_level=device.battery_level))
+        
+        def on_done(future):
+            device = self._future_result(future, default=None)
+            if device is None or device.battery_level is None:
+                return self.ui_queue.post(('poll_battery', address), apply, device, None)
+            self.bt_manager.run_async('get_drain_rate', address).add_done_callback(
+                lambda rate: self.ui_queue.post(('poll_battery', address), apply, device, self._future_result(rate, default=None)))
+        
+        self.bt_manager.run_async('poll_battery', address).add_done_callback(on_done)
+    
+    def _on_battery_event(self, event, address):
+        """Backend listener; pushes signal-delivered battery levels to the cards. Called off the Tk thread."""
+        if event == 'changed' and self.bt_manager.has_live_battery(address):
+            device = self.bt_manager.get_device(address)
+            if device is None or device.battery_level is None: return
+            self.bt_manager.record_battery_levels([device])
+            self.ui_queue.post(('live_battery', address), self._apply_live_battery, device)
+    
+    def _apply_live_battery(self, device):
+        card = self.device_cards.get(device.address)
+        if not card or not card.device.connected or device.battery_level == card.device.battery_level: return
+        self._replace_device(card.device.replace(battery_level=device.battery_level))
     
     def try_auto_connect(self):
-        """Attempt to connect to the auto-connect device"""
-        self.update_status("Checking for auto-connect device...")
+        """Fetch the first device list, then let the reconnect supervisor connect the auto-connect devices"""
+        self.update_status("Checking for auto-connect devices...")
         
-        def connect_thread():
-            self.devices = self.bt_manager.get_devices()
-            auto_device = next((d for d in self.devices if d.auto_connect), None)
-            
-            if auto_device:
-                if not auto_device.connected:
-                    self.update_status(f"Auto-connecting to {auto_device.name}...")
-                    success = self.bt_manager.connect_device(auto_device.address)
-                    if success: self.update_status(f"Auto-connected to {auto_device.name}")
-                    else: self.update_status(f"Failed to auto-connect to {auto_device.name}")
-                else: self.update_status(f"Auto-connect device {auto_device.name} already connected")
-            else: self.update_status("No auto-connect device configured")
-            
-            self.after(1000, self.refresh_devices)
+        def start_supervisor(future):
+            self.ui_queue.post('devices', self._apply_devices, self._future_result(future, default=[]))
+            if self.bt_manager.is_remote:
+                self.update_status("Connected to BlueSync daemon")
+                return
+            self.bt_manager.reconnect.add_listener(self._on_reconnect_state)
+            self.bt_manager.reconnect.start()
+            if not self.bt_manager.config_manager.get_auto_connect_devices():
+                self.update_status("No auto-connect device configured")
         
-        thread = threading.Thread(target=connect_thread)
-        thread.daemon = True
-        thread.start()
+        self.bt_manager.run_async('get_devices').add_done_callback(start_supervisor)
+    
+    def _on_reconnect_state(self, address, state):
+        """Show reconnect progress in the status bar; called off the Tk thread"""
+        device = next((d for d in self.devices if d.address == address), None)
+        name = device.get_display_name() if device else address
+        if state['state'] == 'connecting':
+            attempt = f" (attempt {state['attempts'] + 1})" if state['attempts'] else ""
+            self.update_status(f"Auto-connecting to {name}{attempt}...")
+        elif state['state'] == 'waiting' and state['last_error']:
+            self.update_status(f"Could not connect {name}: {state['last_error']}; retrying in {state['retry_in']:.0f}s")
+        elif state['state'] == 'failed':
+            self.update_status(f"Gave up auto-connecting {name} after {state['attempts']} attempts: {state['last_error']}")
+        elif state['state'] == 'no_adapter':
+            self.update_status("Bluetooth adapter is off; waiting to auto-connect")
+        elif state['state'] == 'connected':
+            self.schedule_refresh()
     
     def update_status(self, message):
-        """Update the status bar with a message"""
-        self.after(0, lambda: self.status_label.configure(text=message))
+        """Update the status bar with a message; safe to call from any thread"""
+        self.ui_queue.post('status', self.status_label.configure, text=message)
+    
+    def show_debug_panel(self):
+        """Open the metrics panel, or raise it if it is already open"""
+        if self.debug_panel is not None and self.debug_panel.winfo_exists():
+            self.debug_panel.lift()
+            return
+        from components.ui.debug_panel import DebugPanel
+        self.debug_panel = DebugPanel(self, self.ui_queue, self._get_metrics, self._get_debug_stats)
+    
+    def _get_metrics(self):
+        return self.bt_manager.get_metrics() if self.bt_manager else metrics.snapshot()
+    
+    def _get_debug_stats(self):
+        stats = {'UI queue': self.ui_queue.get_stats(), 'Last list refresh': self.last_refresh_stats}
+        if self.bt_manager and not self.bt_manager.is_remote:
+            stats['Battery source cache'] = self.bt_manager.get_battery_cache_stats()
+        return stats
     
     def show_window(self):
         """Show the application window from the system tray"""
         self.deiconify()
         self.lift()
         self.focus_force()
-        self.refresh_devices()
+        if self.bt_manager: self.refresh_devices()
     
     def on_close(self):
         """Handle window close event"""
@@ -184,22 +333,75 @@ class BluetoothManagerApp(ctk.CTk):
     def quit_app(self):
         """Quit the application"""
         self.exit_app = True
+        self.ui_queue.stop()
+        if self.bt_manager:
+            self.bt_manager.config_manager.flush()
+            self.bt_manager.battery_history.close()
         if self.tray_icon: self.tray_icon.stop()
         self.destroy()
         
     def quit_and_close_connections(self):
         """Quit the application and close all connections"""
+        if self.bt_manager is None: return self.ui_queue.post('quit', self.quit_app)
         self.update_status("Closing all connections...")
         
         def disconnect_and_quit():
-            success = self.bt_manager.disconnect_all_devices()
-            self.update_status("All connections closed" if success else "Failed to close all connections")
-            self.after(500, self.quit_app)
+            # Only this process's supervisor stops; a daemon keeps supervising its devices
+            self.bt_manager.reconnect.stop()
+            results = self.bt_manager.disconnect_all_devices()
+            failed = [address for address, ok in results.items() if not ok]
+            if failed: self.update_status(f"Failed to close {len(failed)} of {len(results)} connections")
+            else: self.update_status("All connections closed")
+            self.ui_queue.post('quit', self.after, 0 if not failed else 500, self.quit_app)
         
         thread = threading.Thread(target=disconnect_and_quit)
         thread.daemon = True
         thread.start()
     
+    def get_profile_names(self):
+        """Return the saved profile names; safe to call from any thread"""
+        if self.bt_manager is None: return []
+        return sorted(self.bt_manager.config_manager.get_profiles())
+    
+    def _update_profile_menu(self):
+        names = self.get_profile_names()
+        self.profile_menu.configure(values=names or ["No profiles"])
+        self.profile_menu.set("Profiles")
+        if self.tray_icon: self.tray_icon.update_menu()
+    
+    def save_profile(self):
+        """Save the currently connected devices as a profile that disconnects everything else"""
+        connected = [device.address for device in self.devices if device.connected]
+        if not connected:
+            self.update_status("Connect the profile's devices first")
+            return
+        
+        dialog = ctk.CTkInputDialog(text="Profile name:", title="Save Profile")
+        name = (dialog.get_input() or "").strip()
+        if not name: return
+        
+        if self.bt_manager.config_manager.set_profile(name, connected, exclusive=True):
+            self.update_status(f"Saved profile {name} with {len(connected)} devices")
+        else: self.update_status("Failed to save profile")
+        self._update_profile_menu()
+    
+    def apply_profile(self, name):
+        """Apply a profile in the background; safe to call from the tray thread"""
+        if self.bt_manager is None or name not in self.get_profile_names(): return
+        self.update_status(f"Applying profile {name}...")
+        
+        def apply():
+            results = self.bt_manager.apply_profile(name)
+            failed = [address for address, result in results.items() if not result['success']]
+            if failed:
+                error = results[failed[0]]['error']
+                self.update_status(f"Profile {name}: {len(failed)} of {len(results)} devices failed ({failed[0]}: {error})")
+            else: self.update_status(f"Profile {name} applied")
+            self.schedule_refresh(0)
+        
+        threading.Thread(target=apply, daemon=True).start()
+        self.ui_queue.post('profile_menu', self.profile_menu.set, "Profiles")
+    
     def toggle_scan(self):
         """Toggle device scanning"""
         if not self.scanning:
@@ -207,108 +409,278 @@ class BluetoothManagerApp(ctk.CTk):
             self.scan_button.configure(text="Stop Scanning", fg_color=SCANNING_COLOR)
             self.update_status("Scanning for devices...")
             
-            scan_thread = threading.Thread(target=self.scan_for_devices)
-            scan_thread.daemon = True
-            scan_thread.start()
+            self.bt_manager.add_device_listener(self._on_device_event)
+            self.bt_manager.run_async('start_discovery').add_done_callback(self._on_discovery_started)
+            self.scan_job = self.after(SCAN_DURATION_MS, self.stop_scan)
+            if not self.bt_manager.supports_device_events: self._poll_scan()
         else:
-            self.scanning = False
-            self.scan_button.configure(text="Scan for Devices", fg_color=BUTTON_COLOR)
-            self.update_status("Scan stopped")
-    
-    def scan_for_devices(self):
-        """Scan for new devices"""
-        self.bt_manager.scan_devices()
-        end_time = time.time() + 10
-        while self.scanning and time.time() < end_time:
-            self.refresh_devices()
-            time.sleep(2)
-        
+            self.stop_scan("Scan stopped")
+    
+    def stop_scan(self, message="Scan completed"):
+        """Stop discovery on the adapter and reset the scan button"""
+        if not self.scanning: return
         self.scanning = False
-        self.after(0, lambda: self.scan_button.configure(text="Scan for Devices", fg_color=BUTTON_COLOR))
-        self.after(0, lambda: self.update_status("Scan completed"))
+        if self.scan_job:
+            self.after_cancel(self.scan_job)
+            self.scan_job = None
+        
+        self.bt_manager.remove_device_listener(self._on_device_event)
+        self.bt_manager.run_async('stop_discovery')
+        self.scan_button.configure(text="Scan for Devices", fg_color=BUTTON_COLOR)
+        self.update_status(message)
+        self.schedule_refresh()
     
-    def refresh_devices(self):
-        """Refresh the devices list"""
-        self.devices = self.bt_manager.get_devices()
+    def _on_discovery_started(self, future):
+        if not future.cancelled() and not self._future_result(future):
+            self.ui_queue.post('stop_scan', self.stop_scan, "Scan failed")
+    
+    def _poll_scan(self):
+        """Refresh periodically while scanning when the backend cannot stream device events"""
+        if not self.scanning: return
+        self.refresh_devices()
+        self.after(SCAN_POLL_INTERVAL_MS, self._poll_scan)
+    
+    def _on_device_event(self, event, address):
+        """Backend listener; called off the Tk thread"""
+        if event in ('added', 'changed') and address not in self.device_cards:
+            with self._pending_discovered_lock: self._pending_discovered.add(address)
+            self.ui_queue.post('discovered', self._add_discovered_devices)
+    
+    def _add_discovered_devices(self):
+        """Look up every device discovered since the last frame on a worker thread, then insert them in one list update"""
+        with self._pending_discovered_lock:
+            addresses = self._pending_discovered
+            self._pending_discovered = set()
+        
+        known = {device.address for device in self.devices}
+        addresses = [address for address in addresses if address not in known]
+        if not addresses: return
+        
+        def fetch():
+            devices = []
+            for address in addresses:
+                try: devices.append(self.bt_manager.get_device(address))
+                except Exception: continue
+            self.ui_queue.post(None, self._insert_discovered_devices, [device for device in devices if device is not None])
+        
+        threading.Thread(target=fetch, daemon=True).start()
+    
+    def _insert_discovered_devices(self, devices):
+        known = {device.address for device in self.devices}
+        added = [device for device in devices if device.address not in known]
+        if not added: return
+        self.devices.extend(added)
         self.update_device_list()
+    
+    def schedule_refresh(self, delay_ms=1000):
+        """Refresh the device list after delay_ms, collapsing repeated requests into one"""
+        def schedule():
+            if self.refresh_job: self.after_cancel(self.refresh_job)
+            self.refresh_job = self.after(delay_ms, self._run_scheduled_refresh)
+        self.ui_queue.post('schedule_refresh', schedule)
+    
+    def _run_scheduled_refresh(self):
+        self.refresh_job = None
+        self.refresh_devices()
+    
+    def refresh_devices(self):
+        """Fetch devices in the background and apply them on the next UI frame"""
+        if self.bt_manager is None: return
+        def on_done(future):
+            if future.cancelled() or future.exception() is not None: return
+            self.ui_queue.post('devices', self._apply_devices, future.result())
         
+        self.bt_manager.run_async('get_devices').add_done_callback(on_done)
+    
+    def _apply_devices(self, devices):
+        self.devices = devices
+        self.update_device_list()
+        if not self._first_devices_shown:
+            self._first_devices_shown = True
+            self.after_idle(self.startup_profile.mark, 'first_devices')
+        if self.battery_check_job: self.check_battery_levels()
+        
+    def _use_virtual_list(self):
+        """Whether the device list should be rendered by VirtualDeviceList"""
+        if DEVICE_LIST_MODE == "virtual": return True
+        if DEVICE_LIST_MODE == "auto": return self.virtual_list is not None or len(self.devices) >= VIRTUAL_LIST_THRESHOLD
+        return False
+    
+    def _card_class(self):
+        """DeviceCard (nested widgets) or CanvasDeviceCard (single canvas), per CARD_RENDERER"""
+        if CARD_RENDERER == "canvas":
+            from components.ui.canvas_card import CanvasDeviceCard
+            return CanvasDeviceCard
+        from components.ui.device_card import DeviceCard
+        return DeviceCard
+    
+    def _card_callbacks(self):
+        return {
+            'connect': self.connect_device,
+            'disconnect': self.disconnect_device,
+            'auto_connect': self.toggle_auto_connect,
+            'rename': self.rename_device,
+            'refresh_battery': self.refresh_battery
+        }
+    
+    def _update_virtual_list(self):
+        """Render self.devices through the recycling virtual list, switching to it on first use"""
+        destroyed = 0
+        if self.virtual_list is None:
+            for card in self.device_cards.values(): card.destroy()
+            destroyed = len(self.device_cards)
+            self.devices_frame.pack_forget()
+            from components.ui.virtual_list import VirtualDeviceList
+            self.virtual_list = VirtualDeviceList(
+                self.devices_container,
+                self._card_callbacks(),
+                card_class=self._card_class(),
+                fg_color=("gray90", "gray17"),
+                corner_radius=CORNER_RADIUS
+            )
+            self.virtual_list.pack(fill="both", expand=True)
+            self.device_cards = self.virtual_list.cards_by_address
+        
+        created_before = self.virtual_list.stats['created']
+        rebound_before = self.virtual_list.stats['rebound']
+        self.virtual_list.set_devices(self.devices)
+        self.last_refresh_stats = {
+            'created': self.virtual_list.stats['created'] - created_before,
+            'destroyed': destroyed,
+            'updated': self.virtual_list.stats['rebound'] - rebound_before,
+            'moved': 0
+        }
+    
     def update_device_list(self):
-        """Update the devices list UI"""
-        for widget in self.devices_frame.winfo_children(): widget.destroy()
+        """Reconcile device cards with self.devices, timing the pass in the ui_rebuild histogram"""
+        self._update_battery_alerts(self.devices)
+        virtual = self._use_virtual_list()
+        with metrics.timer('ui_rebuild', view='virtual' if virtual else 'cards'):
+            if virtual: self._update_virtual_list()
+            else: self._update_cards()
+        for action, count in self.last_refresh_stats.items():
+            if count: metrics.inc('ui_cards', count, action=action)
+    
+    def _update_cards(self):
+        """Reconcile one card per device with self.devices, keyed by address"""
+        stats = {'created': 0, 'destroyed': 0, 'updated': 0, 'moved': 0}
+        wanted = {device.address: device for device in self.devices}
+        
+        for address in [a for a in self.device_cards if a not in wanted]:
+            self.device_cards.pop(address).destroy()
+            stats['destroyed'] += 1
         
         if not self.devices:
-            no_devices_label = ctk.CTkLabel(
-                self.devices_frame, 
-                text="No devices found", 
-                font=ctk.CTkFont(size=14),
-                text_color=("gray50", "gray70")
-            )
-            no_devices_label.pack(pady=50)
+            if self.no_devices_label is None:
+                self.no_devices_label = ctk.CTkLabel(
+                    self.devices_frame, 
+                    text="No devices found", 
+                    font=ctk.CTkFont(size=14),
+                    text_color=("gray50", "gray70")
+                )
+                stats['created'] += 1
+            if not self.no_devices_label.winfo_manager(): self.no_devices_label.pack(pady=50)
+            self.last_refresh_stats = stats
             return
         
+        if self.no_devices_label is not None and self.no_devices_label.winfo_manager():
+            self.no_devices_label.pack_forget()
+        
+        callbacks = self._card_callbacks()
+        ordered_cards = []
         for device in self.devices:
-            callbacks = {
-                'connect': self.connect_device,
-                'disconnect': self.disconnect_device,
-                'auto_connect': self.toggle_auto_connect,
-                'rename': self.rename_device,
-                'refresh_battery': self.refresh_battery
-            }
-            
-            device_card = DeviceCard(self.devices_frame, device, callbacks)
-            device_card.pack(fill="x", pady=5, padx=5)
+            card = self.device_cards.get(device.address)
+            if card is None:
+                card = self._card_class()(self.devices_frame, device, callbacks)
+                self.device_cards[device.address] = card
+                stats['created'] += 1
+            elif card.update_device(device):
+                stats['updated'] += 1
+            ordered_cards.append(card)
+        
+        stats['moved'] = self._reorder_cards(ordered_cards)
+        self.last_refresh_stats = stats
+    
+    def _replace_device(self, updated):
+        """Swap in a new snapshot for one device and update its card. Device snapshots are immutable."""
+        self.devices = [updated if d.address == updated.address else d for d in self.devices]
+        if self.virtual_list is not None:
+            self.virtual_list.devices = [updated if d.address == updated.address else d for d in self.virtual_list.devices]
+        card = self.device_cards.get(updated.address)
+        if card:
+            with metrics.timer('ui_rebuild', view='card'): card.update_device(updated)
+        self._update_battery_alerts([updated])
+    
+    def _update_battery_alerts(self, devices):
+        """Feed battery readings to NotificationManager, which decides whether to alert"""
+        for device in devices:
+            NotificationManager.update_battery_level(device.address, device.get_display_name(),
+                                                     device.battery_level, device.connected)
+
+    def _reorder_cards(self, ordered_cards):
+        """Pack cards in the given order, moving only those out of place. Returns the number moved."""
+        pack_options = {'fill': "x", 'pady': 5, 'padx': 5}
+        card_class = self._card_class()
+        packed = [w for w in self.devices_frame.pack_slaves() if isinstance(w, card_class)]
+        moved = 0
+        
+        for index, card in enumerate(ordered_cards):
+            if index < len(packed) and packed[index] is card: continue
+            if index > 0: card.pack(after=ordered_cards[index - 1], **pack_options)
+            elif packed: card.pack(before=packed[0], **pack_options)
+            else: card.pack(**pack_options)
+            moved += 1
+            packed = [w for w in self.devices_frame.pack_slaves() if isinstance(w, card_class)]
+        
+        return moved
     
     def connect_device(self, address):
         """Connect to a device"""
         self.update_status(f"Connecting to device...")
         
-        def connect_thread():
-            success = self.bt_manager.connect_device(address)
-            if success: self.update_status("Device connected successfully")
-            else: self.update_status("Failed to connect device")
-            self.after(1000, self.refresh_devices)
+        def on_done(future):
+            if future.cancelled(): return
+            if self._future_result(future): self.update_status("Device connected successfully")
+            else: self.update_status(self._failure_message("Failed to connect device", address))
+            self.schedule_refresh()
         
-        thread = threading.Thread(target=connect_thread)
-        thread.daemon = True
-        thread.start()
+        self.bt_manager.run_async('connect_device', address).add_done_callback(on_done)
         
     def disconnect_device(self, address):
         """Disconnect from a device"""
         self.update_status(f"Disconnecting device...")
         
-        def disconnect_thread():
-            success = self.bt_manager.disconnect_device(address)
-            if success: self.update_status("Device disconnected successfully")
-            else: self.update_status("Failed to disconnect device")
-            self.after(1000, self.refresh_devices)
+        def on_done(future):
+            if future.cancelled(): return
+            if self._future_result(future): self.update_status("Device disconnected successfully")
+            else: self.update_status(self._failure_message("Failed to disconnect device", address))
+            self.schedule_refresh()
         
-        thread = threading.Thread(target=disconnect_thread)
-        thread.daemon = True
-        thread.start()
+        self.bt_manager.run_async('disconnect_device', address).add_done_callback(on_done)
+    
+    def _future_result(self, future, default=False):
+        """Return a finished future's result, or default if it failed or was cancelled"""
+        if future.cancelled() or future.exception() is not None: return default
+        return future.result()
+    
+    def _failure_message(self, message, address):
+        """Append the backend's error for address to a failure message"""
+        error = self.bt_manager.get_last_error(address)
+        return f"{message}: {error}" if error else message
     
     def toggle_auto_connect(self, address, auto_connect, device):
         """Toggle auto-connect for a device"""
-        self.update_status(f"{'Setting' if auto_connect else 'Removing'} auto-connect device...")
+        self.update_status(f"{'Adding' if auto_connect else 'Removing'} auto-connect device...")
         
-        def auto_connect_thread():
-            if auto_connect:
-                for dev in self.devices:
-                    if dev.auto_connect and dev.address != address:
-                        self.bt_manager.config_manager.set_auto_connect_device(None)
-            
-            success = self.bt_manager.config_manager.set_auto_connect_device(address if auto_connect else None)
-            
-            if success:
+        def on_done(future):
+            if self._future_result(future):
                 device_name = device.get_display_name()
-                if auto_connect: self.update_status(f"{device_name} will auto-connect on startup")
+                if auto_connect: self.update_status(f"{device_name} will auto-connect and reconnect when dropped")
                 else: self.update_status(f"{device_name} will no longer auto-connect")
             else: self.update_status(f"Failed to update auto-connect settings")
-            
-            self.after(1000, self.refresh_devices)
+            self.schedule_refresh()
         
-        thread = threading.Thread(target=auto_connect_thread)
-        thread.daemon = True
-        thread.start()
+        self.bt_manager.run_async('set_auto_connect', address, auto_connect).add_done_callback(on_done)
     
     def rename_device(self, address, new_name):
         """Rename a device"""
@@ -323,48 +695,39 @@ class BluetoothManagerApp(ctk.CTk):
             self.update_status("Only connected devices can be renamed")
             return
         
-        success = self.bt_manager.config_manager.set_device_name(address, new_name)
+        def apply(success):
+            if success:
+                current = next((d for d in self.devices if d.address == address), device)
+                self._replace_device(current.replace(custom_name=new_name if new_name else None))
+                self.update_status(f"Device renamed successfully")
+            else: self.update_status(f"Failed to rename device")
+        
+        def on_done(future):
+            self.ui_queue.post(('rename', address), apply, self._future_result(future))
         
-        if success:
-            device.custom_name = new_name if new_name else None
-            
-            for widget in self.devices_frame.winfo_children():
-                if isinstance(widget, DeviceCard) and widget.device.address == address:
-                    display_name = device.get_display_name()
-                    widget.update_name_display(display_name)
-                    break
-            
-            self.update_status(f"Device renamed successfully")
-        else: self.update_status(f"Failed to rename device")
+        self.bt_manager.run_async('rename_device', address, new_name).add_done_callback(on_done)
     
     def refresh_battery(self, address):
         """Manually refresh the battery level for a specific device"""
         self.update_status(f"Refreshing battery information...")
         
-        def refresh_thread():
-            devices = self.bt_manager.get_devices()
-            
-            device = next((d for d in devices if d.address == address), None)
+        def apply(device):
             if not device:
                 self.update_status("Device not found")
                 return
             
             if device.connected:
-                device_cards = [w for w in self.devices_frame.winfo_children() 
-                              if isinstance(w, DeviceCard) and w.device.address == address]
-                
-                if device_cards:
-                    device_card = device_cards[0]
-                    device_card.device.battery_level = device.battery_level
-                    device_card.update_battery_display(device.battery_level)
+                device_card = self.device_cards.get(address)
+                if device_card: self._replace_device(device_card.device.replace(battery_level=device.battery_level))
                 
                 if device.battery_level is not None: self.update_status(f"Battery level: {device.battery_level}%")
                 else: self.update_status("Battery information not available for this device")
             else: self.update_status("Device not connected")
         
-        thread = threading.Thread(target=refresh_thread)
-        thread.daemon = True
-        thread.start()
+        def on_done(future):
+            self.ui_queue.post(('battery', address), apply, self._future_result(future, default=None))
+        
+        self.bt_manager.run_async('poll_battery', address).add_done_callback(on_done)
     
     def mainloop(self, *args, **kwargs):
         """Override mainloop to properly exit the application"""
@@ -0,0 +1,173 @@
+import customtkinter as ctk
+from customtkinter import ThemeManager
+from components.ui.device_card import DeviceCard, shared_font
+from components.ui.icons import IconFactory
+from components.utils.constants import *
+
+class CanvasDeviceCard(DeviceCard):
+    """Lightweight DeviceCard that draws its static content on one canvas.
+
+    The status bar, icon, name, address, status and battery text are canvas
+    items on a single CTkCanvas using the shared card fonts. Only the
+    refresh button, the connect button, the auto-connect checkbox and the
+    rename entry are real widgets. It exposes the same interface as
+    DeviceCard so the two renderers are interchangeable.
+    """
+    CANVAS_HEIGHT = 64
+
+    def _create_layout(self):
+        """Create the canvas and the interactive controls"""
+        self.container = ctk.CTkFrame(self, fg_color="transparent")
+        self.container.pack(fill="both", expand=True, padx=PADDING, pady=PADDING)
+
+        self._create_right_section()
+
+        self.canvas = ctk.CTkCanvas(self.container, height=self._apply_widget_scaling(self.CANVAS_HEIGHT),
+                                    highlightthickness=0, borderwidth=0)
+        self.canvas.pack(side="left", fill="both", expand=True)
+
+        self.refresh_battery_button = ctk.CTkButton(
+            self.canvas,
+            text="↺",
+            command=self.on_refresh_battery,
+            width=24,
+            height=24,
+            corner_radius=CORNER_RADIUS,
+            fg_color=BUTTON_COLOR,
+            hover_color="#2a5a8b",
+            font=shared_font(14)
+        )
+        self.name_entry = ctk.CTkEntry(self.canvas, font=shared_font(14))
+        self.name_entry_window = None
+
+        self._draw()
+        self.canvas.tag_bind('name', "<Double-Button-1>", self.on_name_double_click)
+
+    def _x(self, value):
+        return self._apply_widget_scaling(value)
+
+    def _draw(self):
+        """Draw every static item; called once and on appearance mode changes"""
+        canvas = self.canvas
+        canvas.delete('static')
+        canvas.configure(bg=self._apply_appearance_mode(("gray95", "gray20")))
+        text_color = self._apply_appearance_mode(ThemeManager.theme["CTkLabel"]["text_color"])
+        muted_color = self._apply_appearance_mode(("gray50", "gray70"))
+
+        canvas.create_rectangle(0, self._x(12), self._x(10), self._x(52), width=0,
+                                fill=self.status_color, tags=('static', 'status_bar'))
+
+        self.icon = IconFactory.create_device_photo(self.device.get_device_type())
+        if self.icon: canvas.create_image(self._x(29), self._x(32), image=self.icon, tags=('static', 'icon'))
+
+        text_x = self._x(50)
+        canvas.create_text(text_x, self._x(2), anchor="nw", text=self.device.get_display_name(),
+                           font=shared_font(14, "bold"), fill=text_color, tags=('static', 'name'))
+        canvas.create_text(text_x, self._x(24), anchor="nw", text=self.device.address,
+                           font=shared_font(11), fill=muted_color, tags=('static', 'address'))
+        canvas.create_text(text_x, self._x(42), anchor="nw",
+                           text="Connected" if self.device.connected else "Disconnected",
+                           font=shared_font(12), fill=self.status_color, tags=('static', 'status'))
+        canvas.create_text(0, self._x(42), anchor="nw", text="", font=shared_font(12),
+                           fill=muted_color, tags=('static', 'battery'))
+
+        self._layout_battery(self.device.battery_level)
+
+    def _layout_battery(self, battery_level):
+        """Position battery text and refresh button after the status text"""
+        canvas = self.canvas
+        if not self.device.connected:
+            canvas.itemconfigure('battery', state="hidden")
+            canvas.delete('refresh')
+            return
+
+        if battery_level is not None:
+            battery_color = CRITICAL_BATTERY_COLOR if battery_level < CRITICAL_BATTERY_THRESHOLD else NORMAL_BATTERY_COLOR
+            canvas.itemconfigure('battery', text=f" • {battery_level}%", fill=battery_color, state="normal")
+        else:
+            canvas.itemconfigure('battery', text=" • No battery info", state="normal",
+                                 fill=self._apply_appearance_mode(("gray50", "gray70")))
+
+        status_box = canvas.bbox('status')
+        canvas.coords('battery', status_box[2] + self._x(5), self._x(42))
+        battery_box = canvas.bbox('battery')
+        if not canvas.find_withtag('refresh'):
+            canvas.create_window(0, 0, anchor="w", window=self.refresh_battery_button, tags=('refresh',))
+        canvas.coords('refresh', battery_box[2] + self._x(5), (battery_box[1] + battery_box[3]) / 2)
+
+    def _set_appearance_mode(self, mode_string):
+        super()._set_appearance_mode(mode_string)
+        if hasattr(self, 'canvas'): self._draw()
+
+    def update_device(self, device) -> bool:
+        """Apply a fresh device snapshot by updating canvas items in place"""
+        old = self.device
+        self.device = device
+        if not device.diff(old): return False
+        rebinding = device.address != old.address
+        canvas = self.canvas
+        changed = rebinding
+
+        if rebinding:
+            if self.is_editing: self.cancel_edit_ui()
+            canvas.itemconfigure('address', text=device.address)
+
+        if device.connected != old.connected:
+            self.status_color = CONNECTED_COLOR if device.connected else DISCONNECTED_COLOR
+            canvas.itemconfigure('status_bar', fill=self.status_color)
+            canvas.itemconfigure('status', text="Connected" if device.connected else "Disconnected",
+                                 fill=self.status_color)
+            self._configure_connect_button()
+            if not device.connected and self.is_editing: self.cancel_edit_ui()
+            changed = True
+
+        battery_changed = device.battery_level != old.battery_level
+        if changed or battery_changed:
+            self.update_battery_display(device.battery_level)
+            changed = True
+
+        if device.get_display_name() != old.get_display_name():
+            self.update_name_display(device.get_display_name())
+            changed = True
+
+        if device.auto_connect != old.auto_connect:
+            self.auto_connect_var.set(device.auto_connect)
+            changed = True
+
+        if device.get_device_type() != old.get_device_type():
+            self.icon = IconFactory.create_device_photo(device.get_device_type())
+            if self.icon: canvas.itemconfigure('icon', image=self.icon)
+            changed = True
+
+        return changed
+
+    def update_battery_display(self, battery_level:int):
+        """Update the battery level text"""
+        self._layout_battery(battery_level)
+
+    def update_name_display(self, new_name:str):
+        """Update the display name"""
+        self.canvas.itemconfigure('name', text=new_name)
+
+    def on_name_double_click(self, event):
+        """Overlay an entry on the name text"""
+        if not self.device.connected or self.is_editing: return
+
+        self.is_editing = True
+        self.canvas.itemconfigure('name', state="hidden")
+        self.name_entry.delete(0, "end")
+        self.name_entry.insert(0, self.device.get_display_name())
+        self.name_entry_window = self.canvas.create_window(self._x(50), 0, anchor="nw", window=self.name_entry)
+        self.name_entry.focus_set()
+
+        self.name_entry.bind("<Return>", self.on_name_change)
+        self.name_entry.bind("<Escape>", self.cancel_edit)
+        self.name_entry.bind("<FocusOut>", self.on_name_change)
+
+    def cancel_edit_ui(self):
+        """Remove the entry and show the name text again"""
+        self.is_editing = False
+        if self.name_entry_window is not None:
+            self.canvas.delete(self.name_entry_window)
+            self.name_entry_window = None
+        self.canvas.itemconfigure('name', state="normal")
@@ -0,0 +1,91 @@
+import threading
+import customtkinter as ctk
+from tkinter import filedialog
+from components.utils.metrics import format_json, format_openmetrics, histogram_quantile
+from components.utils.constants import PADDING, CORNER_RADIUS, BUTTON_COLOR, DEBUG_PANEL_REFRESH_MS
+
+def format_table(snapshot:dict, extra:dict=None) -> str:
+    """Render histograms (in ms) and counters as fixed-width text."""
+    label = lambda series: series['name'] + ('{' + ','.join(f'{k}={v}' for k, v in series['labels'].items()) + '}'
+                                             if series['labels'] else '')
+    lines = [f'{"latency":<52}{"count":>8}{"mean":>9}{"p50":>9}{"p95":>9}{"max":>9}']
+    for series in snapshot.get('histograms', []):
+        mean = series['sum'] / series['count'] * 1000 if series['count'] else 0.0
+        p50, p95 = (histogram_quantile(series, q) * 1000 for q in (0.5, 0.95))
+        lines.append(f'{label(series)[:51]:<52}{series["count"]:>8}{mean:>9.2f}{p50:>9.2f}{p95:>9.2f}{series["max"] * 1000:>9.2f}')
+    lines += ['', f'{"counter":<52}{"value":>8}']
+    for series in snapshot.get('counters', []): lines.append(f'{label(series)[:51]:<52}{series["value"]:>8}')
+    for title, stats in (extra or {}).items():
+        lines += ['', title] + [f'  {key:<50}{value:>8}' for key, value in stats.items()]
+    return '\n'.join(lines)
+
+class DebugPanel(ctk.CTkToplevel):
+    """Live view of the metrics registry with JSON and OpenMetrics export.
+
+    get_snapshot may talk to the daemon, so it runs on a background thread
+    and results come back through the UI queue. get_extra returns a dict of
+    {title: stats} shown below the metrics, e.g. UI queue counters.
+    """
+    def __init__(self, master, ui_queue, get_snapshot, get_extra=None, refresh_ms:int=DEBUG_PANEL_REFRESH_MS):
+        super().__init__(master)
+        self.ui_queue = ui_queue
+        self.get_snapshot = get_snapshot
+        self.get_extra = get_extra
+        self.refresh_ms = refresh_ms
+        self.snapshot = {'counters': [], 'histograms': []}
+        self._job = None
+        self._fetching = False
+
+        self.title("BlueSync Metrics")
+        self.geometry("860x520")
+
+        button_frame = ctk.CTkFrame(self, fg_color="transparent")
+        button_frame.pack(fill="x", padx=PADDING, pady=(PADDING, 0))
+        for text, command in (("Save JSON", self.save_json), ("Save OpenMetrics", self.save_openmetrics)):
+            ctk.CTkButton(button_frame, text=text, command=command, fg_color=BUTTON_COLOR,
+                          corner_radius=CORNER_RADIUS, width=140).pack(side="left", padx=(0, PADDING))
+
+        self.textbox = ctk.CTkTextbox(self, font=ctk.CTkFont(family="monospace", size=12), wrap="none")
+        self.textbox.pack(fill="both", expand=True, padx=PADDING, pady=PADDING)
+        self.protocol("WM_DELETE_WINDOW", self.close)
+        self.refresh()
+
+    def refresh(self):
+        self._job = self.after(self.refresh_ms, self.refresh)
+        if self._fetching: return
+        self._fetching = True
+        threading.Thread(target=self._fetch, daemon=True).start()
+
+    def _fetch(self):
+        try: snapshot, error = self.get_snapshot(), None
+        except Exception as e: snapshot, error = None, e
+        self.ui_queue.post('debug_panel', self._show, snapshot, error)
+
+    def _show(self, snapshot, error):
+        self._fetching = False
+        if not self.winfo_exists(): return
+        if snapshot is not None: self.snapshot = snapshot
+        text = format_table(self.snapshot, self.get_extra() if self.get_extra else None)
+        if error is not None: text = f'Error reading metrics: {error}\n\n' + text
+        scroll = self.textbox.yview()[0]
+        self.textbox.configure(state="normal")
+        self.textbox.delete("1.0", "end")
+        self.textbox.insert("1.0", text)
+        self.textbox.configure(state="disabled")
+        self.textbox.yview_moveto(scroll)
+
+    def _save(self, text, extension):
+        path = filedialog.asksaveasfilename(parent=self, defaultextension=extension, initialfile=f'bluesync-metrics{extension}')
+        if not path: return
+        with open(path, 'w') as f: f.write(text)
+
+    def save_json(self):
+        self._save(format_json(self.snapshot), '.json')
+
+    def save_openmetrics(self):
+        self._save(format_openmetrics(self.snapshot), '.txt')
+
+    def close(self):
+        if self._job is not None: self.after_cancel(self._job)
+        self._job = None
+        self.destroy()
@@ -1,7 +1,14 @@
 import customtkinter as ctk
 from components.ui.icons import IconFactory
 from components.utils.constants import *
-from components.utils.notifications import NotificationManager
+
+_shared_fonts = {}
+
+def shared_font(size:int, weight:str="normal") -> ctk.CTkFont:
+    """Return the CTkFont for (size, weight), created once and shared by every card."""
+    key = (size, weight)
+    if key not in _shared_fonts: _shared_fonts[key] = ctk.CTkFont(size=size, weight=weight)
+    return _shared_fonts[key]
 
 class DeviceCard(ctk.CTkFrame):
     """Custom frame for displaying a device in a card-like style."""
@@ -49,15 +56,15 @@ class DeviceCard(ctk.CTkFrame):
         
         display_name = self.device.get_display_name()
         self.name_label = ctk.CTkLabel(self.name_container, text=display_name,
-                                     font=ctk.CTkFont(size=14, weight="bold"))
+                                     font=shared_font(14, "bold"))
         self.name_label.pack(anchor="w")
         
         self.name_label.bind("<Double-Button-1>", self.on_name_double_click)
         
-        self.name_entry = ctk.CTkEntry(self.name_container, font=ctk.CTkFont(size=14))
+        self.name_entry = ctk.CTkEntry(self.name_container, font=shared_font(14))
         
         self.address_label = ctk.CTkLabel(self.middle_frame, text=self.device.address,
-                                         font=ctk.CTkFont(size=11),
+                                         font=shared_font(11),
                                          text_color=("gray50", "gray70"))
         self.address_label.pack(anchor="w")
         
@@ -66,67 +73,58 @@ class DeviceCard(ctk.CTkFrame):
         
         status_text = "Connected" if self.device.connected else "Disconnected"
         self.status_label = ctk.CTkLabel(self.status_info_frame, text=status_text,
-                                       font=ctk.CTkFont(size=12),
+                                       font=shared_font(12),
                                        text_color=self.status_color)
         self.status_label.pack(side="left", anchor="w")
         
+        self.battery_label = ctk.CTkLabel(self.status_info_frame, text="",
+                                        font=shared_font(12))
+        self.refresh_battery_button = ctk.CTkButton(
+            self.status_info_frame,
+            text="↺",
+            command=self.on_refresh_battery,
+            width=24,
+            height=24,
+            corner_radius=CORNER_RADIUS,
+            fg_color=BUTTON_COLOR,
+            hover_color="#2a5a8b",
+            font=shared_font(14)
+        )
+        
         if self.device.connected:
-            if self.device.battery_level is not None:
-                battery_text = f" • {self.device.battery_level}%"
-                battery_color = CRITICAL_BATTERY_COLOR if self.device.battery_level < CRITICAL_BATTERY_THRESHOLD else NORMAL_BATTERY_COLOR
-                self.battery_label = ctk.CTkLabel(self.status_info_frame, text=battery_text,
-                                              font=ctk.CTkFont(size=12),
-                                              text_color=battery_color)
-                self.battery_label.pack(side="left", anchor="w", padx=(5, 0))
-                
-                if self.device.battery_level < CRITICAL_BATTERY_THRESHOLD:
-                    self.after(1000, lambda: self._send_low_battery_notification())
-            else:
-                self.battery_label = ctk.CTkLabel(self.status_info_frame, text=" • No battery info",
-                                              font=ctk.CTkFont(size=12),
-                                              text_color=("gray50", "gray70"))
-                self.battery_label.pack(side="left", anchor="w", padx=(5, 0))
-                
-            self.refresh_battery_button = ctk.CTkButton(
-                self.status_info_frame,
-                text="↺",
-                command=self.on_refresh_battery,
-                width=24,
-                height=24,
-                corner_radius=CORNER_RADIUS,
-                fg_color=BUTTON_COLOR,
-                hover_color="#2a5a8b",
-                font=ctk.CTkFont(size=14)
-            )
-            self.refresh_battery_button.pack(side="left", padx=(5, 0))
+            self._configure_battery_label(self.device.battery_level)
+            self._show_battery_widgets()
+    
+    def _show_battery_widgets(self):
+        """Pack the battery label and refresh button"""
+        self.battery_label.pack(side="left", anchor="w", padx=(5, 0))
+        self.refresh_battery_button.pack(side="left", padx=(5, 0))
+    
+    def _hide_battery_widgets(self):
+        """Unpack the battery label and refresh button"""
+        self.battery_label.pack_forget()
+        self.refresh_battery_button.pack_forget()
+    
+    def _configure_battery_label(self, battery_level):
+        """Set battery label text and colour for a level"""
+        if battery_level is not None:
+            battery_color = CRITICAL_BATTERY_COLOR if battery_level < CRITICAL_BATTERY_THRESHOLD else NORMAL_BATTERY_COLOR
+            self.battery_label.configure(text=f" • {battery_level}%", text_color=battery_color)
+        else:
+            self.battery_label.configure(text=" • No battery info", text_color=("gray50", "gray70"))
     
     def _create_right_section(self):
         """Create the right section with buttons"""
         self.right_frame = ctk.CTkFrame(self.container, fg_color="transparent")
         self.right_frame.pack(side="right", padx=(PADDING, 0))
         
-        if self.device.connected:
-            self.connect_button = ctk.CTkButton(
-                self.right_frame, 
-                text="Disconnect",
-                command=self.on_disconnect,
-                fg_color="#f44336",
-                hover_color="#d32f2f",
-                width=100,
-                height=32,
-                corner_radius=CORNER_RADIUS
-            )
-        else:
-            self.connect_button = ctk.CTkButton(
-                self.right_frame, 
-                text="Connect",
-                command=self.on_connect,
-                fg_color="#4CAF50",
-                hover_color="#388E3C",
-                width=100,
-                height=32,
-                corner_radius=CORNER_RADIUS
-            )
+        self.connect_button = ctk.CTkButton(
+            self.right_frame,
+            width=100,
+            height=32,
+            corner_radius=CORNER_RADIUS
+        )
+        self._configure_connect_button()
         self.connect_button.pack(pady=(0, 5))
         
         self.auto_connect_var = ctk.BooleanVar(value=self.device.auto_connect)
@@ -141,43 +139,68 @@ class DeviceCard(ctk.CTkFrame):
         )
         self.auto_connect_check.pack()
     
-    def _send_low_battery_notification(self):
-        """Send notification about low battery level"""
-        NotificationManager.send_low_battery_notification(
-            self.device.get_display_name(),
-            self.device.battery_level
-        )
+    def _configure_connect_button(self):
+        """Switch the connect button between Connect and Disconnect"""
+        if self.device.connected:
+            self.connect_button.configure(text="Disconnect", command=self.on_disconnect,
+                                          fg_color="#f44336", hover_color="#d32f2f")
+        else:
+            self.connect_button.configure(text="Connect", command=self.on_connect,
+                                          fg_color="#4CAF50", hover_color="#388E3C")
+    
+    def update_device(self, device) -> bool:
+        """Apply a fresh device snapshot, touching only the fields that changed. Returns True if anything changed.
+        
+        The snapshot may be for a different device when the card is recycled.
+        """
+        old = self.device
+        self.device = device
+        if not device.diff(old): return False
+        changed = False
+        rebinding = device.address != old.address
+        
+        if rebinding:
+            if self.is_editing: self.cancel_edit_ui()
+            self.address_label.configure(text=device.address)
+            changed = True
+        
+        if device.connected != old.connected:
+            self.status_color = CONNECTED_COLOR if device.connected else DISCONNECTED_COLOR
+            self.status_frame.configure(fg_color=self.status_color)
+            self.status_label.configure(text="Connected" if device.connected else "Disconnected",
+                                        text_color=self.status_color)
+            self._configure_connect_button()
+            if device.connected:
+                self._configure_battery_label(device.battery_level)
+                self._show_battery_widgets()
+            else:
+                self._hide_battery_widgets()
+                if self.is_editing: self.cancel_edit_ui()
+            changed = True
+        
+        if device.connected and (rebinding or device.battery_level != old.battery_level):
+            self.update_battery_display(device.battery_level)
+            changed = True
+        
+        if device.get_display_name() != old.get_display_name():
+            self.update_name_display(device.get_display_name())
+            changed = True
+        
+        if device.auto_connect != old.auto_connect:
+            self.auto_connect_var.set(device.auto_connect)
+            changed = True
+        
+        if device.get_device_type() != old.get_device_type():
+            self.icon = IconFactory.create_device_icon(device.get_device_type())
+            if self.icon and hasattr(self, 'icon_label'): self.icon_label.configure(image=self.icon)
+            changed = True
+        
+        return changed
     
     def update_battery_display(self, battery_level:int):
         """Update the battery level display."""
-        if hasattr(self, 'battery_label'):
-            if battery_level is not None:
-                battery_text = f" • {battery_level}%"
-                battery_color = CRITICAL_BATTERY_COLOR if battery_level < CRITICAL_BATTERY_THRESHOLD else NORMAL_BATTERY_COLOR
-                self.battery_label.configure(text=battery_text, text_color=battery_color)
-                
-                if battery_level < CRITICAL_BATTERY_THRESHOLD:
-                    self._send_low_battery_notification()
-            else:
-                self.battery_label.configure(text=" • No battery info", text_color=("gray50", "gray70"))
-        elif self.device.connected:
-            self.status_info_frame = getattr(self, 'status_info_frame', None)
-            if self.status_info_frame:
-                if battery_level is not None:
-                    battery_text = f" • {battery_level}%"
-                    battery_color = CRITICAL_BATTERY_COLOR if battery_level < CRITICAL_BATTERY_THRESHOLD else NORMAL_BATTERY_COLOR
-                    self.battery_label = ctk.CTkLabel(self.status_info_frame, text=battery_text,
-                                                  font=ctk.CTkFont(size=12),
-                                                  text_color=battery_color)
-                    
-                    if battery_level < CRITICAL_BATTERY_THRESHOLD:
-                        self._send_low_battery_notification()
-                else:
-                    self.battery_label = ctk.CTkLabel(self.status_info_frame, text=" • No battery info",
-                                                  font=ctk.CTkFont(size=12),
-                                                  text_color=("gray50", "gray70"))
-                
-                self.battery_label.pack(side="left", anchor="w", padx=(5, 0))
+        self._configure_battery_label(battery_level)
+        if self.device.connected and not self.battery_label.winfo_manager(): self._show_battery_widgets()
     
     def update_name_display(self, new_name:str):
         """Update the display name"""
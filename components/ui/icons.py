@@ -1,54 +1,141 @@
 import os
-from PIL import Image, ImageDraw
+import time
+from PIL import Image, ImageTk
 import customtkinter as ctk
 import threading
+import logging
+
+logger = logging.getLogger(__name__)
 
 class IconFactory:
-    """Factory class for loading UI icons."""
+    """Factory class for loading UI icons.
+
+    Decoded and resized images are cached per (asset, size) and the CTkImage
+    wrappers per (device type, size, theme), so every card showing the same
+    kind of device shares one image.
+    """
 
     # Use the absolute path to the assets directory based on the location of main.py
     ASSETS_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'assets'))
 
+    ICON_MAP = {
+        "headphones": "headphones.png",
+        "speaker": "speaker.png",
+        "mouse": "mouse.png",
+        "keyboard": "keyboard.png",
+        "controller": "controller.png",
+        "phone": "phone.png"
+    }
+
+    _images = {}
+    _icons = {}
+    _lock = threading.RLock()
+    _stats = {'hits': 0, 'misses': 0, 'decodes': 0, 'decode_ms': 0.0}
+
+    @staticmethod
+    def _asset_path(icon_file:str, theme:str) -> str:
+        """Prefer a themed variant such as mouse_dark.png when one exists."""
+        if theme != 'default':
+            stem, ext = os.path.splitext(icon_file)
+            themed_path = os.path.join(IconFactory.ASSETS_PATH, f'{stem}_{theme}{ext}')
+            if os.path.exists(themed_path): return themed_path
+        return os.path.join(IconFactory.ASSETS_PATH, icon_file)
+
     @staticmethod
-    def create_device_icon(device_type:str, size:tuple=(24,24)) -> ctk.CTkImage:
+    def _load_image(icon_path:str, size:tuple) -> Image:
+        """Decode and resize an asset once per (path, size)."""
+        key = (icon_path, size)
+        with IconFactory._lock:
+            if key in IconFactory._images: return IconFactory._images[key]
+
+        start = time.perf_counter()
+        icon = Image.open(icon_path)
+        icon = icon.resize(size, Image.LANCZOS)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+
+        with IconFactory._lock:
+            IconFactory._stats['decodes'] += 1
+            IconFactory._stats['decode_ms'] += elapsed_ms
+            IconFactory._images[key] = icon
+        return icon
+
+    @staticmethod
+    def create_device_icon(device_type:str, size:tuple=(24,24), theme:str='default') -> ctk.CTkImage:
         """Load an icon for a device type."""
-        icon_map = {
-            "headphones": "headphones.png",
-            "speaker": "speaker.png",
-            "mouse": "mouse.png",
-            "keyboard": "keyboard.png",
-            "controller": "controller.png",
-            "phone": "phone.png"
-        }
-
-        icon_file = icon_map.get(device_type, 'generic.png')
-        icon_path = os.path.join(IconFactory.ASSETS_PATH, icon_file)
+        size = tuple(size)
+        key = (device_type, size, theme)
+        with IconFactory._lock:
+            if key in IconFactory._icons:
+                IconFactory._stats['hits'] += 1
+                return IconFactory._icons[key]
+            IconFactory._stats['misses'] += 1
 
+        icon_file = IconFactory.ICON_MAP.get(device_type, 'generic.png')
+        image = None
         try:
-            icon = Image.open(icon_path)
-            icon = icon.resize(size, Image.LANCZOS)
-            return ctk.CTkImage(light_image=icon, dark_image=icon, size=size)
+            icon = IconFactory._load_image(IconFactory._asset_path(icon_file, theme), size)
+            image = ctk.CTkImage(light_image=icon, dark_image=icon, size=size)
         except Exception as e:
-            print(f'Error loading icon {icon_file}: {e}')
+            logger.error('Error loading icon %s: %s', icon_file, e)
             if icon_file != 'generic.png':
                 try:
-                    generic_path = os.path.join(IconFactory.ASSETS_PATH, 'generic.png')
-                    icon = Image.open(generic_path)
-                    icon = icon.resize(size, Image.LANCZOS)
-                    return ctk.CTkImage(light_image=icon, dark_image=icon, size=size)
-                except Exception: return None
-            return None
-        
+                    icon = IconFactory._load_image(IconFactory._asset_path('generic.png', theme), size)
+                    image = ctk.CTkImage(light_image=icon, dark_image=icon, size=size)
+                except Exception: image = None
+
+        with IconFactory._lock:
+            return IconFactory._icons.setdefault(key, image)
+
+    @staticmethod
+    def create_device_photo(device_type:str, size:tuple=(24,24)):
+        """Return a shared ImageTk.PhotoImage for drawing a device icon on a canvas. Needs a Tk root."""
+        size = tuple(size)
+        key = (device_type, size, 'photo')
+        with IconFactory._lock:
+            if key in IconFactory._icons:
+                IconFactory._stats['hits'] += 1
+                return IconFactory._icons[key]
+            IconFactory._stats['misses'] += 1
+
+        photo = None
+        for icon_file in (IconFactory.ICON_MAP.get(device_type, 'generic.png'), 'generic.png'):
+            try:
+                photo = ImageTk.PhotoImage(IconFactory._load_image(IconFactory._asset_path(icon_file, 'default'), size))
+                break
+            except Exception as e: logger.error('Error loading icon %s: %s', icon_file, e)
+
+        with IconFactory._lock:
+            return IconFactory._icons.setdefault(key, photo)
+
     @staticmethod
     def create_bluetooth_icon(size:tuple=(64, 64)) -> Image:
         """Load bluetooth icon for the system tray"""
         icon_path = os.path.join(IconFactory.ASSETS_PATH, 'bluetooth.png')
-        print(f"Resolved icon path: {icon_path}")  # Debugging log
+        logger.debug('Resolved icon path: %s', icon_path)
 
         try:
-            icon = Image.open(icon_path)
-            icon = icon.resize(size, Image.LANCZOS)
-            return icon
+            return IconFactory._load_image(icon_path, tuple(size))
         except Exception as e:
-            print(f'Error loading Bluetooth icon: {e}')
+            logger.error('Error loading Bluetooth icon: %s', e)
             return None
+
+    @staticmethod
+    def preload(sizes:tuple=((24, 24),), theme:str='default'):
+        """Decode every device icon up front, e.g. from a background thread at startup."""
+        for size in sizes:
+            for device_type in list(IconFactory.ICON_MAP) + ['generic']:
+                IconFactory.create_device_icon(device_type, size, theme)
+
+    @staticmethod
+    def get_cache_stats() -> dict:
+        """Return cache hits, misses, number of decodes and total decode time in ms."""
+        with IconFactory._lock:
+            stats = dict(IconFactory._stats)
+            stats['cached_icons'] = len(IconFactory._icons)
+        return stats
+
+    @staticmethod
+    def clear_cache():
+        with IconFactory._lock:
+            IconFactory._images.clear()
+            IconFactory._icons.clear()
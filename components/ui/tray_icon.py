@@ -3,15 +3,17 @@ import threading
 import logging
 from components.ui.icons import IconFactory
 
-# Initialize logging
-logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
 
 class TrayIconManager:
     """Manages the system tray icon"""
-    def __init__(self, show_window_callback, quit_callback, quit_disconnect_callback):
+    def __init__(self, show_window_callback, quit_callback, quit_disconnect_callback,
+                 profiles_callback=None, apply_profile_callback=None):
         self.show_window_callback = show_window_callback
         self.quit_callback = quit_callback
         self.quit_disconnect_callback = quit_disconnect_callback
+        self.profiles_callback = profiles_callback
+        self.apply_profile_callback = apply_profile_callback
         self.tray_icon = None
         self._setup_tray()
     
@@ -20,41 +22,60 @@ class TrayIconManager:
         try:
             icon_image = IconFactory.create_bluetooth_icon()
             if not icon_image:
-                logging.error("Failed to load tray icon image.")
+                logger.error("Failed to load tray icon image.")
                 return
 
             menu = (
                 pystray.MenuItem('Show Bluetooth Manager', self.show_window),
+                pystray.MenuItem('Profiles', pystray.Menu(self._profile_items)),
                 pystray.MenuItem('Exit', self.quit_app),
                 pystray.MenuItem('Exit and Close All Connections', self.quit_and_close_connections)
             )
 
             self.tray_icon = pystray.Icon("bluetooth_manager", icon_image, "Bluetooth Manager", menu)
-            logging.info("Tray icon setup completed successfully.")
+            logger.debug("Tray icon setup completed successfully.")
         except Exception as e:
-            logging.error(f"Error setting up tray icon: {e}")
+            logger.error("Error setting up tray icon: %s", e)
 
     def run(self):
         """Run the tray icon in a separate thread"""
         try:
             if self.tray_icon:
                 threading.Thread(target=self.tray_icon.run, daemon=True).start()
-                logging.info("Tray icon is running.")
+                logger.debug("Tray icon is running.")
             else:
-                logging.error("Tray icon is not initialized.")
+                logger.error("Tray icon is not initialized.")
         except Exception as e:
-            logging.error(f"Error running tray icon: {e}")
+            logger.error("Error running tray icon: %s", e)
     
     def stop(self):
         """Stop the tray icon"""
         try:
             if self.tray_icon:
                 self.tray_icon.stop()
-                logging.info("Tray icon stopped.")
+                logger.debug("Tray icon stopped.")
             else:
-                logging.error("Tray icon is not initialized.")
+                logger.error("Tray icon is not initialized.")
         except Exception as e:
-            logging.error(f"Error stopping tray icon: {e}")
+            logger.error("Error stopping tray icon: %s", e)
+    
+    def _profile_items(self):
+        """Build the Profiles submenu from the current profile names"""
+        names = self.profiles_callback() if self.profiles_callback else []
+        if not names: return [pystray.MenuItem('No profiles', None, enabled=False)]
+        return [pystray.MenuItem(name, self._apply_profile_action(name)) for name in names]
+    
+    def _apply_profile_action(self, name):
+        def apply(icon, item):
+            if self.apply_profile_callback: self.apply_profile_callback(name)
+        return apply
+    
+    def update_menu(self):
+        """Rebuild the menu, e.g. after profiles change"""
+        try:
+            if self.tray_icon: self.tray_icon.update_menu()
+        except Exception as e:
+            logger.error("Error updating tray menu: %s", e)
     
     def show_window(self, icon=None, item=None):
         """Show the main window"""
@@ -0,0 +1,86 @@
+import time
+import threading
+import itertools
+import collections
+from components.utils.metrics import metrics
+import logging
+
+logger = logging.getLogger(__name__)
+
+class UIUpdateQueue:
+    """Thread-safe queue of UI updates drained by the Tk main loop.
+
+    Background threads post callables; the Tk thread runs them in frames of
+    at most budget_ms, leaving the rest for the next frame. Updates posted
+    with the same key before they run are merged so only the latest one
+    executes, which collapses bursts of status or device updates into a
+    single UI pass.
+    """
+    def __init__(self, root, frame_ms:int=16, budget_ms:int=8, idle_ms:int=50):
+        self.root = root
+        self.frame_ms = frame_ms
+        self.budget_ms = budget_ms
+        self.idle_ms = idle_ms
+        self._lock = threading.Lock()
+        self._pending = collections.OrderedDict()
+        self._sequence = itertools.count()
+        self._job = None
+        self._stats = {
+            'posted': 0, 'merged': 0, 'executed': 0, 'errors': 0,
+            'max_depth': 0, 'last_drain_ms': 0.0, 'max_drain_ms': 0.0
+        }
+
+    def start(self):
+        """Begin draining. Must be called on the Tk thread."""
+        if self._job is None: self._job = self.root.after(self.frame_ms, self._drain)
+
+    def stop(self):
+        """Stop draining and drop pending updates, e.g. because the window is being destroyed."""
+        with self._lock: self._pending.clear()
+        if self._job is not None:
+            self.root.after_cancel(self._job)
+            self._job = None
+
+    def post(self, key, callback, *args, **kwargs):
+        """Queue callback(*args, **kwargs) for the Tk thread. A key of None never merges."""
+        if key is None: key = ('unkeyed', next(self._sequence))
+        with self._lock:
+            self._stats['posted'] += 1
+            if key in self._pending:
+                self._stats['merged'] += 1
+                del self._pending[key]
+            self._pending[key] = (callback, args, kwargs)
+            self._stats['max_depth'] = max(self._stats['max_depth'], len(self._pending))
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            stats = dict(self._stats)
+            stats['depth'] = len(self._pending)
+        return stats
+
+    def _drain(self):
+        start = time.perf_counter()
+        deadline = start + self.budget_ms / 1000
+        executed = 0
+
+        while time.perf_counter() < deadline:
+            with self._lock:
+                if not self._pending: break
+                _, (callback, args, kwargs) = self._pending.popitem(last=False)
+            try: callback(*args, **kwargs)
+            except Exception:
+                self._stats['errors'] += 1
+                logger.exception('Error applying UI update')
+            executed += 1
+
+        with self._lock:
+            if executed:
+                elapsed_ms = (time.perf_counter() - start) * 1000
+                self._stats['executed'] += executed
+                self._stats['last_drain_ms'] = elapsed_ms
+                self._stats['max_drain_ms'] = max(self._stats['max_drain_ms'], elapsed_ms)
+                metrics.observe('ui_queue_drain', elapsed_ms / 1000)
+            delay = self.frame_ms if self._pending else self.idle_ms
+
+        try: self._job = self.root.after(delay, self._drain)
+        except Exception: self._job = None
@@ -0,0 +1,105 @@
+import customtkinter as ctk
+from components.ui.device_card import DeviceCard
+from components.utils.constants import VIRTUAL_ROW_HEIGHT, VIRTUAL_OVERSCAN_ROWS
+
+class VirtualDeviceList(ctk.CTkFrame):
+    """Scrollable device list that only renders rows in or near the viewport.
+
+    Rows have a fixed height. A pool of DeviceCard widgets, sized to the
+    viewport plus overscan, is placed at absolute offsets and rebound to
+    different devices as the user scrolls, so the widget count does not grow
+    with the number of devices.
+    """
+    def __init__(self, master, callbacks, row_height:int=VIRTUAL_ROW_HEIGHT,
+                 overscan:int=VIRTUAL_OVERSCAN_ROWS, card_class=DeviceCard, **kwargs):
+        super().__init__(master, **kwargs)
+        self.callbacks = callbacks
+        self.card_class = card_class
+        self.row_height = row_height
+        self.overscan = overscan
+        self.devices = []
+        self.offset = 0
+        self.cards_by_address = {}
+        self.stats = {'created': 0, 'rebound': 0, 'pool_size': 0, 'rendered_rows': 0}
+
+        self._pool = []
+        self._bound = {}
+
+        self.viewport = ctk.CTkFrame(self, fg_color="transparent")
+        self.viewport.pack(side="left", fill="both", expand=True)
+
+        self.scrollbar = ctk.CTkScrollbar(self, command=self._on_scrollbar)
+        self.scrollbar.pack(side="right", fill="y")
+
+        self.viewport.bind("<Configure>", lambda event: self._render())
+        self.bind_all("<MouseWheel>", self._on_mouse_wheel, add="+")
+        self.bind_all("<Button-4>", self._on_mouse_wheel, add="+")
+        self.bind_all("<Button-5>", self._on_mouse_wheel, add="+")
+
+    def set_devices(self, devices):
+        """Replace the list contents and re-render the visible rows"""
+        self.devices = list(devices)
+        self._render()
+
+    def get_card(self, address):
+        """Return the card currently showing address, or None if it is off-screen"""
+        return self.cards_by_address.get(address)
+
+    def _content_height(self):
+        return len(self.devices) * self.row_height
+
+    def _render(self):
+        """Bind pool cards to the rows in range and place them at their offsets"""
+        height = max(self.viewport.winfo_height(), 1)
+        self.offset = max(0, min(self.offset, self._content_height() - height))
+
+        first = max(0, self.offset // self.row_height - self.overscan)
+        last = min(len(self.devices), (self.offset + height) // self.row_height + 1 + self.overscan)
+        rows = range(first, last)
+
+        free = [card for row, card in self._bound.items() if row not in rows]
+        self._bound = {row: card for row, card in self._bound.items() if row in rows}
+        free.extend(card for card in self._pool if card not in free and card not in self._bound.values())
+
+        for row in rows:
+            device = self.devices[row]
+            card = self._bound.get(row)
+            if card is None:
+                if free: card = free.pop()
+                else:
+                    card = self.card_class(self.viewport, device, self.callbacks)
+                    self._pool.append(card)
+                    self.stats['created'] += 1
+                self._bound[row] = card
+            if card.device.address != device.address: self.stats['rebound'] += 1
+            card.update_device(device)
+            card.place(x=0, y=row * self.row_height - self.offset, relwidth=1)
+
+        for card in free: card.place_forget()
+
+        self.cards_by_address.clear()
+        self.cards_by_address.update((card.device.address, card) for card in self._bound.values())
+        self.stats['pool_size'] = len(self._pool)
+        self.stats['rendered_rows'] = len(self._bound)
+
+        total = self._content_height()
+        if total <= height: self.scrollbar.set(0, 1)
+        else: self.scrollbar.set(self.offset / total, (self.offset + height) / total)
+
+    def scroll_to(self, offset:int):
+        self.offset = int(offset)
+        self._render()
+
+    def _on_scrollbar(self, action, *args):
+        height = self.viewport.winfo_height()
+        if action == "moveto": self.scroll_to(float(args[0]) * self._content_height())
+        elif action == "scroll":
+            step = self.row_height if args[1] == "units" else height
+            self.scroll_to(self.offset + int(args[0]) * step)
+
+    def _on_mouse_wheel(self, event):
+        if not str(event.widget).startswith(str(self)): return
+        if getattr(event, 'num', None) == 4: delta = -1
+        elif getattr(event, 'num', None) == 5: delta = 1
+        else: delta = -1 if event.delta > 0 else 1
+        self.scroll_to(self.offset + delta * self.row_height)
@@ -1,7 +1,15 @@
 import os
+import tempfile
 
 CONFIG_PATH = os.path.expanduser("~/.blue_sync_config.json")
 
+# Unix socket served by `main.py --daemon`; calls wait at most DAEMON_CALL_TIMEOUT_S
+DAEMON_SOCKET_PATH = os.path.join(os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir(), f"bluesync-{os.getuid()}.sock")
+DAEMON_CALL_TIMEOUT_S = 30
+DAEMON_MAX_WORKERS = 8
+# Replies and events waiting for one daemon client; a client further behind is disconnected
+DAEMON_CLIENT_QUEUE_SIZE = 256
+
 PADDING = 10
 CORNER_RADIUS = 8
 BUTTON_COLOR = "#3a7ebf"
@@ -12,4 +20,72 @@ CRITICAL_BATTERY_COLOR = "#FF5252"
 NORMAL_BATTERY_COLOR = "#4CAF50"
 
 CRITICAL_BATTERY_THRESHOLD = 20
-BATTERY_CHECK_INTERVAL_MS = 60000 
\ No newline at end of file
+BATTERY_CHECK_INTERVAL_MS = 60000
+
+# Adaptive battery polling: base interval is BATTERY_CHECK_INTERVAL_MS
+BATTERY_POLL_MIN_S = 30
+BATTERY_POLL_MAX_S = 1800
+BATTERY_POLL_CRITICAL_MARGIN = 10
+BATTERY_POLL_FULL_LEVEL = 95
+
+# Low battery alerts: re-arm above threshold + margin, update after a further
+# drop of NOTIFY_UPDATE_STEP points, send at most once per NOTIFY_MIN_INTERVAL_S
+NOTIFY_REARM_MARGIN = 5
+NOTIFY_UPDATE_STEP = 5
+NOTIFY_MIN_INTERVAL_S = 30
+
+DBUS_CALL_TIMEOUT_S = 5
+CONNECT_TIMEOUT_S = 20
+DISCONNECT_TIMEOUT_S = 10
+DISCONNECT_ALL_MAX_PARALLEL = 4
+DISCONNECT_ALL_DEADLINE_S = 5
+PROFILE_DEADLINE_S = 30
+
+# Reconnect supervisor: jittered exponential backoff between attempts; after
+# RECONNECT_MAX_ATTEMPTS a device is only retried every RECONNECT_MAX_DELAY_S
+# until it is added or changes again, or an adapter powers on.
+# RECONNECT_POLL_S is only used when the backend cannot deliver device events.
+RECONNECT_BASE_DELAY_S = 2
+RECONNECT_MAX_DELAY_S = 300
+RECONNECT_MAX_ATTEMPTS = 10
+RECONNECT_POLL_S = 30
+
+BATTERY_NEGATIVE_TTL_S = 300
+# `bluetoothctl info` is the last battery source; a hung call counts as a failed read
+BLUETOOTHCTL_TIMEOUT_S = 5
+
+# Battery history: binary log next to the config, samples kept per device,
+# heartbeat for unchanged levels and the window used for drain-rate estimates
+BATTERY_HISTORY_PATH = os.path.join(os.path.dirname(CONFIG_PATH), ".blue_sync_battery_history.bin")
+BATTERY_HISTORY_CAPACITY = 1024
+BATTERY_HISTORY_HEARTBEAT_S = 900
+BATTERY_DRAIN_WINDOW_S = 6 * 3600
+
+# Config changes are written this long after the last mutation
+CONFIG_FLUSH_DELAY_S = 1.0
+
+# "linux" (blocking calls on scheduler workers) or "async" (single asyncio loop thread)
+DEFAULT_BACKEND = "linux"
+
+SCHEDULER_MAX_WORKERS = 4
+
+# Passed to org.bluez.Adapter1.SetDiscoveryFilter; add 'RSSI' or 'UUIDs' to narrow results
+DISCOVERY_FILTER = {'Transport': 'auto', 'DuplicateData': False}
+SCAN_DURATION_MS = 10000
+SCAN_POLL_INTERVAL_MS = 2000
+
+UI_FRAME_MS = 16
+UI_FRAME_BUDGET_MS = 8
+
+# "standard" packs one card per device, "virtual" recycles a pool of cards,
+# "auto" switches to virtual once VIRTUAL_LIST_THRESHOLD devices are listed
+DEVICE_LIST_MODE = "auto"
+VIRTUAL_LIST_THRESHOLD = 50
+VIRTUAL_ROW_HEIGHT = 100
+VIRTUAL_OVERSCAN_ROWS = 2
+
+# "widgets" builds each card from nested frames and labels, "canvas" draws it on one canvas
+CARD_RENDERER = "widgets"
+
+# Metrics debug panel (F12) refresh interval
+DEBUG_PANEL_REFRESH_MS = 1000
@@ -0,0 +1,136 @@
+import json
+import time
+import bisect
+import threading
+import contextlib
+
+# Histogram bucket upper bounds in seconds, from a cached D-Bus property read to a slow Connect
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+PREFIX = 'bluesync_'
+
+class Histogram:
+    """Latency histogram with fixed buckets; counts[i] is the number of observations <= bounds[i]."""
+    __slots__ = ('bounds', 'counts', 'count', 'sum', 'max')
+
+    def __init__(self, bounds=DEFAULT_BUCKETS):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value:float):
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+        if value > self.max: self.max = value
+
+class MetricsRegistry:
+    """Thread-safe counters and latency histograms keyed by name and labels.
+
+    Recording is a dict lookup and a few additions under one lock, so it is
+    cheap enough for hot paths. snapshot() returns plain JSON-friendly data
+    that format_json() and format_openmetrics() render, including snapshots
+    received from the daemon.
+    """
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self._counters = {}
+        self._histograms = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(name, labels):
+        return (name, tuple(sorted(labels.items()))) if labels else (name, ())
+
+    def inc(self, name:str, value:float=1, **labels):
+        key = self._key(name, labels)
+        with self._lock: self._counters[key] = self._counters.get(key, 0) + value
+
+    def observe(self, name:str, seconds:float, **labels):
+        key = self._key(name, labels)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None: histogram = self._histograms[key] = Histogram(self.buckets)
+            histogram.observe(seconds)
+
+    @contextlib.contextmanager
+    def timer(self, name:str, **labels):
+        """Observe how long the enclosed block takes; exceptions also count towards name_errors."""
+        start = time.perf_counter()
+        try: yield
+        except BaseException:
+            self.inc(f'{name}_errors', **labels)
+            raise
+        finally: self.observe(name, time.perf_counter() - start, **labels)
+
+    def reset(self):
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+    def snapshot(self) -> dict:
+        """Return {'counters': [...], 'histograms': [...]} sorted by name and labels."""
+        with self._lock:
+            counters = [{'name': name, 'labels': dict(labels), 'value': value}
+                        for (name, labels), value in sorted(self._counters.items())]
+            histograms = [{'name': name, 'labels': dict(labels), 'buckets': list(h.bounds), 'counts': list(h.counts),
+                           'count': h.count, 'sum': h.sum, 'max': h.max}
+                          for (name, labels), h in sorted(self._histograms.items())]
+        return {'counters': counters, 'histograms': histograms}
+
+metrics = MetricsRegistry()
+
+def label_snapshot(snapshot:dict, **labels) -> dict:
+    """Add labels to every series in snapshot, e.g. to tell daemon metrics apart from local ones."""
+    return {kind: [dict(series, labels=dict(series['labels'], **labels)) for series in snapshot.get(kind, [])]
+            for kind in ('counters', 'histograms')}
+
+def merge_snapshots(*snapshots) -> dict:
+    return {kind: [series for snapshot in snapshots for series in snapshot.get(kind, [])]
+            for kind in ('counters', 'histograms')}
+
+def histogram_quantile(series:dict, q:float) -> float:
+    """Estimate quantile q of a snapshot histogram as the upper bound of the bucket it falls in."""
+    if not series['count']: return 0.0
+    rank = q * series['count']
+    seen = 0
+    for bound, count in zip(series['buckets'], series['counts']):
+        seen += count
+        if seen >= rank: return min(bound, series['max'])
+    return series['max']
+
+def format_json(snapshot:dict) -> str:
+    return json.dumps(snapshot, indent=2, sort_keys=True) + '\n'
+
+def _labels_text(labels, **extra):
+    labels = dict(labels, **extra)
+    if not labels: return ''
+    escape = lambda value: str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+    return '{' + ','.join(f'{key}="{escape(value)}"' for key, value in labels.items()) + '}'
+
+def format_openmetrics(snapshot:dict) -> str:
+    """Render a snapshot in the OpenMetrics text format; histograms are in seconds."""
+    lines = []
+    families = {}
+    for series in snapshot.get('counters', []): families.setdefault(('counter', series['name']), []).append(series)
+    for series in snapshot.get('histograms', []): families.setdefault(('histogram', series['name']), []).append(series)
+
+    for (kind, name), group in sorted(families.items(), key=lambda item: item[0][1]):
+        if kind == 'counter':
+            family = PREFIX + name
+            lines.append(f'# TYPE {family} counter')
+            for series in group: lines.append(f'{family}_total{_labels_text(series["labels"])} {series["value"]}')
+            continue
+        family = f'{PREFIX}{name}_seconds'
+        lines.append(f'# TYPE {family} histogram')
+        lines.append(f'# UNIT {family} seconds')
+        for series in group:
+            cumulative = 0
+            for bound, count in zip(series['buckets'] + ['+Inf'], series['counts']):
+                cumulative += count
+                lines.append(f'{family}_bucket{_labels_text(series["labels"], le=bound)} {cumulative}')
+            lines.append(f'{family}_count{_labels_text(series["labels"])} {series["count"]}')
+            lines.append(f'{family}_sum{_labels_text(series["labels"])} {series["sum"]}')
+    lines.append('# EOF')
+    return '\n'.join(lines) + '\n'
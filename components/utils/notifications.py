@@ -1,28 +1,153 @@
+import time
+import threading
 import subprocess
+import logging
+from components.utils.metrics import metrics
+from components.utils.constants import (
+    CRITICAL_BATTERY_THRESHOLD, NOTIFY_REARM_MARGIN, NOTIFY_UPDATE_STEP, NOTIFY_MIN_INTERVAL_S
+)
+
+logger = logging.getLogger(__name__)
 
 class NotificationManager:
-    """Handles system notifications."""
+    """Handles system notifications.
+
+    Notifications go straight to org.freedesktop.Notifications on the session
+    bus, falling back to notify-send when D-Bus is unavailable. Each
+    notification key keeps its server id and passes it back as replaces_id,
+    so a repeat updates the existing popup instead of stacking a new one.
+
+    Low battery alerts are stateful per device: a device alerts once when it
+    drops below CRITICAL_BATTERY_THRESHOLD, updates the alert only when it
+    falls another NOTIFY_UPDATE_STEP points, and re-arms after recovering to
+    the threshold plus NOTIFY_REARM_MARGIN. Alerts are sent at most once per
+    NOTIFY_MIN_INTERVAL_S; alerts raised in between are coalesced into one.
+    """
+    APP_NAME = 'BlueSync'
+    URGENCY = {'low': 0, 'normal': 1, 'critical': 2}
+
+    _lock = threading.RLock()
+    _interface = None
+    _replaces_ids = {}
+    _alerted = {}
+    _pending = {}
+    _last_sent = 0.0
+    _flush_timer = None
+    _stats = {'sent': 0, 'replaced': 0, 'coalesced': 0, 'suppressed': 0, 'fallbacks': 0}
+
+    @staticmethod
+    def _get_interface():
+        """Connect to the notification server on first use so dbus is not imported at startup"""
+        if NotificationManager._interface is None:
+            import dbus
+            bus = dbus.SessionBus()
+            proxy = bus.get_object('org.freedesktop.Notifications', '/org/freedesktop/Notifications', introspect=False)
+            NotificationManager._interface = dbus.Interface(proxy, 'org.freedesktop.Notifications')
+        return NotificationManager._interface
 
     @staticmethod
-    def send_notification(title:str, message:str, urgency:str='normal', icon:str=None):
+    def send_notification(title:str, message:str, urgency:str='normal', icon:str=None, key:str=None):
+        """Show a notification now. Notifications with the same key replace each other.
+
+        The lock only guards the bookkeeping; the D-Bus call is made outside it,
+        so a slow notification server never blocks update_battery_level().
+        """
+        with NotificationManager._lock: replaces_id = NotificationManager._replaces_ids.get(key, 0) if key else 0
+        try:
+            import dbus
+            interface = NotificationManager._get_interface()
+            hints = dbus.Dictionary({'urgency': dbus.Byte(NotificationManager.URGENCY.get(urgency, 1))}, signature='sv')
+            with metrics.timer('dbus_notify'):
+                notification_id = interface.Notify(
+                    NotificationManager.APP_NAME, dbus.UInt32(replaces_id), icon or '', title, message,
+                    dbus.Array([], signature='s'), hints, dbus.Int32(-1), timeout=5
+                )
+            with NotificationManager._lock:
+                if key: NotificationManager._replaces_ids[key] = int(notification_id)
+                NotificationManager._stats['sent'] += 1
+                if replaces_id: NotificationManager._stats['replaced'] += 1
+            return True
+        except Exception as e:
+            NotificationManager._interface = None
+            logger.warning('Error sending notification over D-Bus, falling back to notify-send: %s', e)
+
         try:
             cmd = ['notify-send']
             if urgency: cmd.extend(['-u', urgency])
             if icon: cmd.extend(['-i', icon])
             cmd.extend([title, message])
 
-            subprocess.Popen(cmd)
+            with metrics.timer('subprocess', command='notify-send'): subprocess.Popen(cmd)
+            with NotificationManager._lock: NotificationManager._stats['fallbacks'] += 1
             return True
         except Exception as e:
-            print(f'Error sending notification: {e}')
+            logger.error('Error sending notification: %s', e)
             return False
-        
+
+    @staticmethod
+    def update_battery_level(address:str, device_name:str, battery_level:int, connected:bool=True):
+        """Feed a battery reading; sends a low battery alert only when the alert state calls for one."""
+        if not connected or battery_level is None: return
+        with NotificationManager._lock:
+            alerted_level = NotificationManager._alerted.get(address)
+            if battery_level >= CRITICAL_BATTERY_THRESHOLD + NOTIFY_REARM_MARGIN:
+                NotificationManager._alerted.pop(address, None)
+                NotificationManager._pending.pop(address, None)
+                return
+            if battery_level >= CRITICAL_BATTERY_THRESHOLD: return
+            if alerted_level is not None and alerted_level - battery_level < NOTIFY_UPDATE_STEP:
+                NotificationManager._stats['suppressed'] += 1
+                return
+
+            NotificationManager._alerted[address] = battery_level
+            if address in NotificationManager._pending: NotificationManager._stats['coalesced'] += 1
+            NotificationManager._pending[address] = (device_name, battery_level)
+            NotificationManager._schedule_flush()
+
+    @staticmethod
+    def _schedule_flush():
+        if NotificationManager._flush_timer is not None: return
+        wait = max(0.0, NotificationManager._last_sent + NOTIFY_MIN_INTERVAL_S - time.monotonic())
+        NotificationManager._flush_timer = threading.Timer(wait, NotificationManager._flush)
+        NotificationManager._flush_timer.daemon = True
+        NotificationManager._flush_timer.start()
+
     @staticmethod
-    def send_low_battery_notification(device_name:str, battery_level:int):
+    def _flush():
+        with NotificationManager._lock:
+            NotificationManager._flush_timer = None
+            pending = NotificationManager._pending
+            NotificationManager._pending = {}
+            if not pending: return
+            NotificationManager._last_sent = time.monotonic()
+            NotificationManager._stats['coalesced'] += len(pending) - 1
+
+        if len(pending) == 1:
+            address, (device_name, battery_level) = next(iter(pending.items()))
+            NotificationManager.send_low_battery_notification(device_name, battery_level, key=f'low_battery:{address}')
+        else:
+            NotificationManager.send_notification(
+                f'Low Battery: {len(pending)} devices',
+                '\n'.join(f'{name} ({level}%)' for name, level in pending.values()),
+                urgency='critical',
+                icon='battery_low',
+                key='low_battery'
+            )
+
+    @staticmethod
+    def send_low_battery_notification(device_name:str, battery_level:int, key:str=None):
         """Send a notification about low battery level."""
         return NotificationManager.send_notification(
             f'Low Battery: {device_name}',
             f'Battery level is critically low ({battery_level}%)',
             urgency='critical',
-            icon='battery_low'
-        )
\ No newline at end of file
+            icon='battery_low',
+            key=key
+        )
+
+    @staticmethod
+    def get_stats() -> dict:
+        with NotificationManager._lock:
+            stats = dict(NotificationManager._stats)
+            stats['alerted_devices'] = len(NotificationManager._alerted)
+        return stats
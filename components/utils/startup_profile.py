@@ -0,0 +1,50 @@
+import time
+import threading
+import contextlib
+
+class StartupProfile:
+    """Records startup milestones and task durations relative to process start.
+
+    Tasks run on several threads, so entries carry the thread name. Once every
+    label in expected has been recorded the report is printed. When disabled,
+    mark() and span() do nothing.
+    """
+    def __init__(self, enabled:bool=False, start:float=None, expected=()):
+        self.enabled = enabled
+        self.start = time.perf_counter() if start is None else start
+        self.expected = set(expected)
+        self._entries = []
+        self._lock = threading.Lock()
+        self._reported = False
+
+    def _record(self, label, offset, duration):
+        with self._lock:
+            self._entries.append((label, threading.current_thread().name, offset, duration))
+            self.expected.discard(label)
+            done = not self.expected and not self._reported
+            if done: self._reported = True
+        if done: print(self.format_report())
+
+    def mark(self, label:str):
+        """Record that a milestone was reached now."""
+        if self.enabled: self._record(label, time.perf_counter() - self.start, None)
+
+    @contextlib.contextmanager
+    def span(self, label:str):
+        """Record how long the enclosed block takes."""
+        if not self.enabled:
+            yield
+            return
+        began = time.perf_counter()
+        try: yield
+        finally: self._record(label, began - self.start, time.perf_counter() - began)
+
+    def format_report(self) -> str:
+        with self._lock: entries = sorted(self._entries, key=lambda entry: entry[2] + (entry[3] or 0))
+        lines = ['Startup profile (ms since process start):',
+                 f'  {"step":<24}{"thread":<20}{"start":>10}{"took":>10}{"done":>10}']
+        for label, thread, offset, duration in entries:
+            took = f'{duration * 1000:.1f}' if duration is not None else '-'
+            done = (offset + (duration or 0)) * 1000
+            lines.append(f'  {label:<24}{thread[:19]:<20}{offset * 1000:>10.1f}{took:>10}{done:>10.1f}')
+        return '\n'.join(lines)
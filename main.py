@@ -1,18 +1,90 @@
-import os
-import signal
+import time
+STARTED = time.perf_counter()
+
 import sys
-import customtkinter as ctk
-from components.core.bluetooth_manager import BluetoothManager
-from components.ui.app_window import BluetoothManagerApp
+import signal
+import logging
+import argparse
+import threading
+import concurrent.futures
+from components.utils.startup_profile import StartupProfile
+
+STARTUP_MILESTONES = ('first_paint', 'backend', 'tray', 'icons', 'first_devices')
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="BlueSync Bluetooth manager")
+    parser.add_argument('--startup-profile', action='store_true',
+                        help="print where startup time went once the first device list is shown")
+    parser.add_argument('--daemon', action='store_true',
+                        help="run headless and serve devices to other BlueSync processes over a Unix socket")
+    parser.add_argument('--no-daemon', action='store_true',
+                        help="talk to BlueZ directly even if a BlueSync daemon is running")
+    parser.add_argument('--log-level', default='warning', choices=('debug', 'info', 'warning', 'error'),
+                        help="log messages at this level and above to stderr")
+    parser.add_argument('--metrics', choices=('json', 'openmetrics'),
+                        help="print the running daemon's metrics in this format and exit")
+    return parser.parse_args(argv)
+
+def dump_metrics(fmt):
+    """Print the running daemon's metrics registry as JSON or OpenMetrics text"""
+    from components.core.remote_backend import RemoteBluetoothBackend
+    from components.utils.metrics import format_json, format_openmetrics
+    if not RemoteBluetoothBackend.daemon_running(): sys.exit("No BlueSync daemon is running")
+    backend = RemoteBluetoothBackend()
+    try: snapshot = backend.get_metrics()
+    finally: backend.close()
+    sys.stdout.write(format_json(snapshot) if fmt == 'json' else format_openmetrics(snapshot))
+
+def run_daemon():
+    """Serve one BluetoothManager over the daemon socket until SIGINT/SIGTERM"""
+    from components.core.bluetooth_manager import BluetoothManager
+    from components.core.daemon import DaemonServer
+
+    bt_manager = BluetoothManager()
+    server = DaemonServer(bt_manager)
+    bt_manager.reconnect.start()
+    for signum in (signal.SIGINT, signal.SIGTERM): signal.signal(signum, lambda sig, frame: server.shutdown())
+    try: server.serve_forever()
+    finally:
+        bt_manager.config_manager.flush()
+        bt_manager.battery_history.close()
+
+def start_backend(profile, use_daemon:bool=True) -> concurrent.futures.Future:
+    """Import dbus and connect to BlueZ, or to a running daemon, on a background thread while the window paints"""
+    future = concurrent.futures.Future()
+
+    def build():
+        try:
+            with profile.span('backend'):
+                from components.core.bluetooth_manager import BluetoothManager
+                from components.core.remote_backend import RemoteBluetoothBackend
+                backend = 'remote' if use_daemon and RemoteBluetoothBackend.daemon_running() else None
+                future.set_result(BluetoothManager(backend=backend))
+        except BaseException as e: future.set_exception(e)
+
+    threading.Thread(target=build, name='backend-startup', daemon=True).start()
+    return future
 
 def main():
     """Main entry point for Bluetooth Manager application"""
+    args = parse_args()
+    logging.basicConfig(level=args.log_level.upper(), format='%(asctime)s %(levelname)s %(name)s: %(message)s')
+    if args.metrics: return dump_metrics(args.metrics)
+    if args.daemon: return run_daemon()
+    profile = StartupProfile(args.startup_profile, STARTED, STARTUP_MILESTONES)
+    profile.mark('main')
+    signal.signal(signal.SIGINT, lambda sig, frame: sys.exit(0))
+    bt_manager = start_backend(profile, use_daemon=not args.no_daemon)
+
+    with profile.span('import_ui'):
+        import customtkinter as ctk
+        from components.ui.app_window import BluetoothManagerApp
+
     ctk.set_appearance_mode("dark")
     ctk.set_default_color_theme("blue")
-    signal.signal(signal.SIGINT, lambda sig, frame: sys.exit(0))
-    bt_manager = BluetoothManager()
-    app = BluetoothManagerApp(bt_manager)
+    with profile.span('create_window'):
+        app = BluetoothManagerApp(bt_manager, startup_profile=profile)
     app.mainloop()
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main()
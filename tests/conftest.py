@@ -0,0 +1,74 @@
+import os
+import pytest
+
+class FakeDBusObject:
+    """Stands in for both a proxy object and the dbus.Interface wrapped around it."""
+    def __init__(self, bus, path):
+        self.bus = bus
+        self.path = path
+
+    def GetManagedObjects(self):
+        return self.bus.managed_objects
+
+    def EnumerateDevices(self):
+        return list(self.bus.upower_devices)
+
+    def Get(self, interface, name):
+        return self.bus.properties[self.path][interface][name]
+
+    def GetAll(self, interface):
+        return dict(self.bus.properties.get(self.path, {}).get(interface, {}))
+
+class FakeBus:
+    """Minimal system bus: BlueZ managed objects, UPower devices and per-path properties."""
+    def __init__(self, managed_objects=None, upower_devices=(), properties=None):
+        self.managed_objects = managed_objects or {}
+        self.upower_devices = list(upower_devices)
+        self.properties = properties or {}
+
+    def get_object(self, service, path, introspect=True):
+        return FakeDBusObject(self, path)
+
+    def add_signal_receiver(self, *args, **kwargs): pass
+
+    def watch_name_owner(self, *args, **kwargs): pass
+
+@pytest.fixture
+def fake_bus(monkeypatch):
+    """Route dbus.SystemBus and dbus.Interface to a FakeBus."""
+    dbus = pytest.importorskip('dbus')
+    bus = FakeBus()
+    monkeypatch.setattr(dbus, 'SystemBus', lambda *args, **kwargs: bus)
+    monkeypatch.setattr(dbus, 'Interface', lambda obj, interface=None: obj)
+    return bus
+
+class FakeEnvironment:
+    """A BluetoothManager over a FakeBluetoothBackend, with config and battery history in a temp dir."""
+    def __init__(self, directory, **backend_options):
+        from components.config.config_manager import ConfigManager
+        from components.core.battery_history import BatteryHistoryStore
+        from components.core.bluetooth_manager import BluetoothManager
+        from components.core.fake_backend import FakeBluetoothBackend
+
+        self.config_manager = ConfigManager(os.path.join(directory, 'config.json'))
+        self.backend = FakeBluetoothBackend(self.config_manager, **backend_options)
+        self.manager = BluetoothManager(self.config_manager, backend=self.backend,
+                                        battery_history=BatteryHistoryStore(os.path.join(directory, 'battery_history.bin')))
+
+    def close(self):
+        self.manager.reconnect.stop()
+        self.manager.scheduler.shutdown()
+        self.manager.battery_history.close()
+
+@pytest.fixture
+def make_env(tmp_path):
+    """Factory for FakeEnvironments; each call gets its own directory and is closed after the test."""
+    pytest.importorskip('dbus')
+    environments = []
+    def make(**backend_options):
+        directory = os.path.join(tmp_path, str(len(environments)))
+        os.makedirs(directory)
+        environments.append(FakeEnvironment(directory, **backend_options))
+        return environments[-1]
+    yield make
+    for environment in environments: environment.close()
@@ -0,0 +1,55 @@
+import types
+import pytest
+
+pytest.importorskip('dbus')
+
+from components.core import bluetooth_backend
+from components.core.bluetooth_backend import LinuxBluetoothBackend
+
+ADDRESS = 'AA:BB:CC:DD:EE:FF'
+PATH = '/org/bluez/hci0/dev_AA_BB_CC_DD_EE_FF'
+
+class StubConfig:
+    def get_auto_connect_devices(self): return []
+    def get_renamed_devices(self): return {}
+
+@pytest.fixture
+def backend(fake_bus, monkeypatch):
+    monkeypatch.setattr(bluetooth_backend, 'DBusGMainLoop', None)
+    fake_bus.managed_objects = {PATH: {'org.bluez.Device1': {'Address': ADDRESS, 'Name': 'Headset', 'Connected': True}}}
+    calls = []
+    def run(args, **kwargs):
+        calls.append(args)
+        return types.SimpleNamespace(stdout='')
+    monkeypatch.setattr(bluetooth_backend.subprocess, 'run', run)
+    backend = LinuxBluetoothBackend(StubConfig())
+    backend.bluetoothctl_calls = calls
+    return backend
+
+def test_caches_are_keyed_by_device_address(backend):
+    assert backend.get_battery_level(PATH) is None
+    assert backend.bluetoothctl_calls == [['bluetoothctl', 'info', ADDRESS]]
+    assert {address for address, _ in backend._battery_negative} == {ADDRESS}
+
+def test_negative_entries_are_skipped_until_expiry(backend):
+    backend.get_battery_level(PATH)
+    backend.get_battery_level(PATH)
+    assert len(backend.bluetoothctl_calls) == 1
+    assert backend.get_battery_cache_stats()['negative_hits'] == len(LinuxBluetoothBackend.BATTERY_SOURCES)
+
+def test_reconnect_clears_negative_entries(backend):
+    backend.get_battery_level(PATH)
+    backend._on_properties_changed('org.bluez.Device1', {'Connected': True}, [], path=PATH)
+    assert backend._battery_negative == {}
+    backend.get_battery_level(PATH)
+    assert len(backend.bluetoothctl_calls) == 2
+
+def test_working_source_is_remembered(backend, fake_bus):
+    fake_bus.properties[PATH] = {'org.bluez.Device1': {'BatteryPercentage': 42}}
+    assert backend.get_battery_level(PATH) == 42
+    assert backend._battery_sources == {ADDRESS: 'device1'}
+    assert backend.get_battery_level(PATH) == 42
+    assert backend.get_battery_cache_stats()['hits'] == 1
+
+def test_address_from_unknown_path(backend):
+    assert backend._get_address_from_path('/org/bluez/hci0/dev_11_22_33_44_55_66') == '11:22:33:44:55:66'
@@ -0,0 +1,42 @@
+from components.core.battery_poller import BatteryPollScheduler
+from components.utils.constants import CRITICAL_BATTERY_THRESHOLD
+
+class StubHistory:
+    def __init__(self, rate):
+        self.rate = rate
+        self.lookups = 0
+
+    def get_drain_rate(self, address):
+        self.lookups += 1
+        return self.rate
+
+def make_poller(history=None):
+    poller = BatteryPollScheduler(history, base_s=60, min_s=10, max_s=600)
+    poller.sync(['AA'])
+    assert poller.due() == ['AA']
+    return poller
+
+def test_given_drain_rate_skips_the_history_lookup():
+    history = StubHistory(rate=1.0)
+    poller = make_poller(history)
+    # 40 points above critical at 80%/h is half an hour away; poll four times before then
+    poller.reschedule('AA', CRITICAL_BATTERY_THRESHOLD + 40, now=0, drain_rate=80.0)
+    assert history.lookups == 0
+    assert poller.next_delay(now=0) == 450
+
+def test_fast_drain_polls_often():
+    poller = make_poller()
+    poller.reschedule('AA', CRITICAL_BATTERY_THRESHOLD + 20, now=0, drain_rate=360.0)
+    assert poller.next_delay(now=0) == 50
+
+def test_history_is_used_without_a_drain_rate():
+    history = StubHistory(rate=None)
+    poller = make_poller(history)
+    poller.reschedule('AA', 100, now=0)
+    assert history.lookups == 1
+    assert poller.next_delay(now=0) == 120
+
+def test_critical_level_polls_at_min_interval():
+    poller = make_poller()
+    poller.reschedule('AA', CRITICAL_BATTERY_THRESHOLD, now=0)
+    assert poller.next_delay(now=0) == 10
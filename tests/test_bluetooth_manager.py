@@ -0,0 +1,87 @@
+import time
+import threading
+import pytest
+
+from components.utils.metrics import metrics
+
+@pytest.fixture
+def env(make_env):
+    """Four paired devices, none connected; env.addresses lists them in order."""
+    env = make_env(device_count=4, connected_ratio=0.0)
+    env.addresses = [device.address for device in env.backend.get_devices()]
+    return env
+
+def record_connects(env, fail=(), latency=0.0):
+    """Log the order connects start and finish in, failing the addresses in fail."""
+    log = []
+    connect = env.backend.connect_device
+    def connect_device(address):
+        log.append(('start', address))
+        time.sleep(latency)
+        success = address not in fail and connect(address)
+        log.append(('end', address))
+        return success
+    env.backend.connect_device = connect_device
+    return log
+
+def test_coalesced_requests_are_observed_once(env):
+    release = threading.Event()
+    env.manager.scheduler.submit(None, 'block', release.wait, 2)
+    metrics.reset()
+
+    futures = [env.manager.run_async('get_devices') for _ in range(5)]
+    # Done callbacks run in order, so this one fires after the metrics observer
+    observed = threading.Event()
+    futures[0].add_done_callback(lambda future: observed.set())
+    release.set()
+    assert observed.wait(2)
+    counters = {c['labels'].get('result'): c['value'] for c in metrics.snapshot()['counters']
+                if c['name'] == 'operation_results' and c['labels']['operation'] == 'get_devices'}
+    assert counters == {'ok': 1}
+
+def test_apply_profile_respects_after(env):
+    a, b, c, _ = env.addresses
+    log = record_connects(env, latency=0.05)
+    env.config_manager.set_profile('desk', [a, b, c], after={b: [a], c: [b]})
+    results = env.manager.apply_profile('desk')
+    assert all(result['success'] for result in results.values())
+    assert log.index(('end', a)) < log.index(('start', b))
+    assert log.index(('end', b)) < log.index(('start', c))
+
+def test_apply_profile_runs_independent_devices_concurrently(env):
+    a, b, _, _ = env.addresses
+    log = record_connects(env, latency=0.1)
+    env.config_manager.set_profile('desk', [a, b])
+    env.manager.apply_profile('desk')
+    assert [event for event, _ in log[:2]] == ['start', 'start']
+
+def test_apply_profile_skips_devices_waiting_on_a_failure(env):
+    a, b, c, _ = env.addresses
+    record_connects(env, fail=(a,))
+    env.config_manager.set_profile('desk', [a, b, c], after={b: [a]})
+    results = env.manager.apply_profile('desk')
+    assert not results[a]['success']
+    assert results[b] == {'action': 'connect', 'success': False, 'error': f'skipped: {a} failed'}
+    assert results[c]['success']
+
+def test_apply_profile_exclusive_disconnects_others(env):
+    a, b, c, _ = env.addresses
+    env.backend.set_connected([b, c], True)
+    env.config_manager.set_profile('solo', [a, b], exclusive=True)
+    results = env.manager.apply_profile('solo')
+    assert results[b] == {'action': 'connect', 'success': True, 'error': None}
+    assert results[c]['action'] == 'disconnect' and results[c]['success']
+    assert sorted(env.backend.get_connected_addresses()) == sorted([a, b])
+
+def test_apply_profile_deadline(env):
+    a, b, _, _ = env.addresses
+    record_connects(env, latency=0.5)
+    env.config_manager.set_profile('slow', [a, b], after={b: [a]})
+    started = time.monotonic()
+    results = env.manager.apply_profile('slow', deadline=0.1)
+    assert time.monotonic() - started < 0.4
+    assert results[a] == {'action': 'connect', 'success': False, 'error': 'timed out'}
+    assert results[b] == {'action': 'connect', 'success': False, 'error': 'timed out'}
+
+def test_apply_profile_unknown_name(env):
+    with pytest.raises(KeyError): env.manager.apply_profile('missing')
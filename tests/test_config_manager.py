@@ -0,0 +1,59 @@
+import os
+import json
+import time
+import atexit
+from components.config.config_manager import ConfigManager
+
+def read(path):
+    with open(path) as f: return json.load(f)
+
+def test_pending_changes_are_flushed_at_exit(tmp_path, monkeypatch):
+    handlers = []
+    monkeypatch.setattr(atexit, 'register', handlers.append)
+    path = os.path.join(tmp_path, 'config.json')
+    config_manager = ConfigManager(path, flush_delay=60)
+    config_manager.set_device_name('AA:BB:CC:DD:EE:FF', 'Headset')
+    assert not os.path.exists(path)
+
+    for handler in handlers: handler()
+    assert read(path)['renamed_devices'] == {'AA:BB:CC:DD:EE:FF': 'Headset'}
+
+def test_changes_are_debounced_into_one_write(tmp_path, monkeypatch):
+    path = os.path.join(tmp_path, 'config.json')
+    config_manager = ConfigManager(path, flush_delay=0.05)
+    writes = []
+    flush = config_manager.flush
+    monkeypatch.setattr(config_manager, 'flush', lambda: writes.append(config_manager.is_dirty()) or flush())
+
+    for index in range(5): config_manager.set_device_name('AA:BB:CC:DD:EE:FF', f'Headset {index}')
+    assert config_manager.is_dirty()
+    deadline = time.monotonic() + 2
+    while config_manager.is_dirty() and time.monotonic() < deadline: time.sleep(0.01)
+
+    assert writes == [True]
+    assert read(path)['renamed_devices'] == {'AA:BB:CC:DD:EE:FF': 'Headset 4'}
+
+def test_changes_from_another_process_are_reloaded(tmp_path):
+    path = os.path.join(tmp_path, 'config.json')
+    config_manager = ConfigManager(path, flush_delay=60)
+    config_manager.set_auto_connect_devices(['AA:BB:CC:DD:EE:FF'])
+    config_manager.flush()
+
+    other = ConfigManager(path, flush_delay=60)
+    other.set_auto_connect_devices(['11:22:33:44:55:66'])
+    other.flush()
+    # Make sure the mtime moves even on filesystems with coarse timestamps
+    os.utime(path, ns=(time.time_ns(), time.time_ns() + 10 ** 9))
+    assert config_manager.get_auto_connect_devices() == ['11:22:33:44:55:66']
+
+def test_unsaved_changes_win_over_the_file(tmp_path):
+    path = os.path.join(tmp_path, 'config.json')
+    config_manager = ConfigManager(path, flush_delay=60)
+    config_manager.flush()
+    config_manager.set_device_name('AA:BB:CC:DD:EE:FF', 'Mine')
+
+    other = ConfigManager(path, flush_delay=60)
+    other.set_device_name('11:22:33:44:55:66', 'Other')
+    other.flush()
+    os.utime(path, ns=(time.time_ns(), time.time_ns() + 10 ** 9))
+    assert config_manager.get_renamed_devices() == {'AA:BB:CC:DD:EE:FF': 'Mine'}
@@ -0,0 +1,35 @@
+import sys
+import types
+import threading
+from components.utils.notifications import NotificationManager
+
+class SlowNotifications:
+    """Notification server whose Notify call blocks until released."""
+    def __init__(self):
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def Notify(self, *args, **kwargs):
+        self.started.set()
+        self.release.wait(2)
+        return 7
+
+def test_update_battery_level_is_not_blocked_by_a_slow_notify(monkeypatch):
+    server = SlowNotifications()
+    fake_dbus = types.SimpleNamespace(Dictionary=lambda *a, **k: {}, Byte=int, UInt32=int, Int32=int,
+                                      Array=lambda *a, **k: [])
+    monkeypatch.setitem(sys.modules, 'dbus', fake_dbus)
+    monkeypatch.setattr(NotificationManager, '_interface', server)
+    monkeypatch.setattr(NotificationManager, '_replaces_ids', {})
+
+    sender = threading.Thread(target=NotificationManager.send_notification, args=('Title', 'Body'), kwargs={'key': 'k'})
+    sender.start()
+    assert server.started.wait(2)
+
+    done = threading.Event()
+    threading.Thread(target=lambda: (NotificationManager.update_battery_level('AA', 'Mouse', 100), done.set())).start()
+    assert done.wait(1)
+
+    server.release.set()
+    sender.join(2)
+    assert NotificationManager._replaces_ids == {'k': 7}
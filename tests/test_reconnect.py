@@ -0,0 +1,71 @@
+import time
+import pytest
+
+from components.core.reconnect import ReconnectSupervisor
+
+def wait_for(predicate, timeout=2.0):
+    end = time.monotonic() + timeout
+    while time.monotonic() < end:
+        if predicate(): return True
+        time.sleep(0.01)
+    return predicate()
+
+@pytest.fixture
+def env(make_env):
+    """A running supervisor with fast retries watching one connected auto-connect device, env.address."""
+    env = make_env(device_count=4, connected_ratio=1.0)
+    env.manager.reconnect = ReconnectSupervisor(env.manager, base_delay=0.01, max_delay=60, max_attempts=2)
+    env.address = env.backend.get_connected_addresses()[0]
+    env.config_manager.set_auto_connect_devices([env.address])
+    env.state = lambda: (env.manager.get_reconnect_state(env.address) or {}).get('state')
+    env.manager.reconnect.start()
+    assert wait_for(lambda: env.state() == 'connected')
+    return env
+
+def drop(env):
+    """Disconnect env.address behind the supervisor's back, like a device going out of range."""
+    env.backend.set_connected([env.address], False)
+    env.backend._notify_listeners('changed', env.address)
+
+def test_user_disconnect_stays_disconnected(env):
+    assert env.manager.run_async('disconnect_device', env.address).result()
+    assert wait_for(lambda: env.state() == 'held')
+    time.sleep(0.2)
+    assert env.address not in env.backend.get_connected_addresses()
+    assert env.state() == 'held'
+
+def test_manual_connect_releases_hold(env):
+    env.manager.run_async('disconnect_device', env.address).result()
+    assert env.manager.run_async('connect_device', env.address).result()
+    drop(env)
+    assert wait_for(lambda: env.address in env.backend.get_connected_addresses())
+
+def test_unexpected_drop_reconnects(env):
+    drop(env)
+    assert wait_for(lambda: env.address in env.backend.get_connected_addresses())
+    assert wait_for(lambda: env.state() == 'connected')
+
+def test_failed_device_is_rearmed_by_events(env):
+    env.backend.failure_rate = 1.0
+    drop(env)
+    assert wait_for(lambda: env.state() == 'failed')
+    assert env.manager.get_reconnect_state(env.address)['retry_in'] is not None
+
+    env.backend.failure_rate = 0.0
+    env.backend._notify_listeners('added', env.address)
+    assert wait_for(lambda: env.address in env.backend.get_connected_addresses())
+
+def test_disconnect_all_holds_devices_and_keeps_supervising(env):
+    results = env.manager.disconnect_all_devices()
+    assert results and all(results.values())
+    assert env.manager.reconnect.running
+    assert wait_for(lambda: env.state() == 'held')
+    time.sleep(0.2)
+    assert env.backend.get_connected_addresses() == []
+
+def test_adapter_power_cycle_reconnects(env):
+    env.backend.set_powered(False)
+    drop(env)
+    assert wait_for(lambda: env.state() == 'no_adapter')
+    env.backend.set_powered(True)
+    assert wait_for(lambda: env.address in env.backend.get_connected_addresses())
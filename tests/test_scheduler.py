@@ -0,0 +1,43 @@
+import threading
+from components.core.scheduler import OperationScheduler
+
+def blocked_scheduler():
+    """Scheduler whose first operation on key 'A' runs until release is set."""
+    scheduler = OperationScheduler(max_workers=2)
+    release = threading.Event()
+    first = scheduler.submit('A', 'block', release.wait, 2)
+    return scheduler, release, first
+
+def test_operations_on_one_key_run_in_order():
+    scheduler = OperationScheduler(max_workers=4)
+    order = []
+    futures = [scheduler.submit('A', f'op{i}', order.append, i) for i in range(5)]
+    for future in futures: future.result(2)
+    assert order == list(range(5))
+    scheduler.shutdown()
+
+def test_identical_pending_requests_are_coalesced():
+    scheduler, release, _ = blocked_scheduler()
+    created = []
+    futures = [scheduler.submit('A', 'connect', lambda: 'ok', on_created=created.append) for _ in range(3)]
+    assert futures[0] is futures[1] is futures[2]
+    assert created == [futures[0]]
+    assert scheduler.get_stats()['coalesced'] == 2
+    release.set()
+    assert futures[0].result(2) == 'ok'
+    scheduler.shutdown()
+
+def test_new_operation_supersedes_pending_kinds():
+    scheduler, release, _ = blocked_scheduler()
+    disconnect = scheduler.submit('A', 'disconnect', lambda: True)
+    connect = scheduler.submit('A', 'connect', lambda: True, supersedes=('disconnect',))
+    assert disconnect.cancelled()
+    release.set()
+    assert connect.result(2) is True
+    scheduler.shutdown()
+
+def test_other_keys_are_not_blocked():
+    scheduler, release, _ = blocked_scheduler()
+    assert scheduler.submit('B', 'connect', lambda: 'b').result(2) == 'b'
+    release.set()
+    scheduler.shutdown()
@@ -0,0 +1,43 @@
+import pytest
+
+pytest.importorskip('dbus')
+
+from components.core import bluetooth_backend
+from components.core.bluetooth_backend import LinuxBluetoothBackend
+from components.core.upower_index import UPowerIndex, UPOWER_DEVICE_IFACE
+
+UPOWER_DEVICE = '/org/freedesktop/UPower/devices/headset_dev_AA_BB_CC_DD_EE_FF'
+
+@pytest.fixture
+def index(fake_bus):
+    fake_bus.upower_devices = [UPOWER_DEVICE, '/org/freedesktop/UPower/devices/DisplayDevice']
+    fake_bus.properties = {
+        UPOWER_DEVICE: {UPOWER_DEVICE_IFACE: {'NativePath': '/org/bluez/hci0/dev_AA_BB_CC_DD_EE_FF',
+                                              'Percentage': 73.0, 'IsPresent': True}},
+        '/org/freedesktop/UPower/devices/DisplayDevice': {UPOWER_DEVICE_IFACE: {'NativePath': ''}},
+    }
+    return UPowerIndex(fake_bus)
+
+@pytest.mark.parametrize('address', ['AA:BB:CC:DD:EE:FF', 'aa:bb:cc:dd:ee:ff', 'AA_BB_CC_DD_EE_FF', 'dev_AA_BB_CC_DD_EE_FF'])
+def test_get_path_normalizes_the_address(index, address):
+    assert index.get_path(address) == UPOWER_DEVICE
+
+def test_unknown_or_invalid_address(index):
+    assert index.get_path('11:22:33:44:55:66') is None
+    assert index.get_path('not an address') is None
+
+def test_get_percentage(index):
+    assert index.get_percentage('AA:BB:CC:DD:EE:FF') == 73
+
+def test_removed_device_is_forgotten(index):
+    index.get_path('AA:BB:CC:DD:EE:FF')
+    index._on_device_removed(UPOWER_DEVICE)
+    assert index.get_path('AA:BB:CC:DD:EE:FF') is None
+
+def test_backend_reads_upower_by_device_address(fake_bus, index, monkeypatch):
+    monkeypatch.setattr(bluetooth_backend, 'DBusGMainLoop', None)
+    path = '/org/bluez/hci0/dev_AA_BB_CC_DD_EE_FF'
+    fake_bus.managed_objects = {path: {'org.bluez.Device1': {'Address': 'AA:BB:CC:DD:EE:FF', 'Connected': True}}}
+    backend = LinuxBluetoothBackend(None)
+    assert backend.get_battery_level(path) == 73
+    assert backend._battery_sources == {'AA:BB:CC:DD:EE:FF': 'upower'}